@@ -7,6 +7,8 @@ __version__ = "1.0.0"
 __author__ = "Ollama-RAG-Sync Team"
 
 # Make main components easily importable
-from .api_client import APIClient, APIClientException
+from .api_client import APIClient, APIClientException, get_default_client, close_default_client
+from .models import Collection, TrackedFile, ChunkResult
 
-__all__ = ['APIClient', 'APIClientException']
+__all__ = ['APIClient', 'APIClientException', 'get_default_client', 'close_default_client',
+           'Collection', 'TrackedFile', 'ChunkResult']
@@ -4,13 +4,147 @@ Provides a clean interface to interact with FileTracker and Vectors APIs
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Callable, Dict, Iterator, List, Optional, Any
+import hashlib
 import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+try:
+    from .models import Collection, TrackedFile, ChunkResult, HAS_MSGSPEC, decode_search_response
+except ImportError:  # imported as a top-level module by the GUI scripts
+    from models import Collection, TrackedFile, ChunkResult, HAS_MSGSPEC, decode_search_response
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional, iter_collection_files then decodes page by page
+    ijson = None
 
 
 class APIClientException(Exception):
     """Custom exception for API client errors"""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status code of the failed response, if the server answered
+        self.status_code = status_code
+
+
+class _TTLCache:
+    """
+    Minimal thread-safe time-based cache for idempotent GET responses
+
+    Entries are stored as key -> (expires_at, value). Keys are built from
+    the request method, URL and query parameters.
+    """
+    
+    def __init__(self):
+        self._data: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        """Return the cached value for key, or None if missing/expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.hits += 1
+                    return entry[1]
+                del self._data[key]
+            self.misses += 1
+            return None
+    
+    def set(self, key, value, ttl: float):
+        """Store value under key for ttl seconds"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+    
+    def invalidate(self, prefix: Optional[str] = None):
+        """Drop every entry, or only those whose URL starts with prefix"""
+        with self._lock:
+            if prefix is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if k[1].startswith(prefix)]:
+                del self._data[key]
+
+
+class _SearchCache:
+    """
+    Bounded thread-safe LRU cache for search results
+
+    Keys are a blake2b digest of the endpoint and full request body; each
+    entry remembers its collection so writes can drop just that collection.
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: 'OrderedDict[bytes, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    @staticmethod
+    def make_key(url: str, data: Dict[str, Any]) -> bytes:
+        """Digest of the request; filters are serialized with sorted keys"""
+        raw = json.dumps([url, data], sort_keys=True, default=str)
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).digest()
+    
+    def get(self, key: bytes):
+        """Return the cached results for key (marking it recently used), or None"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key: bytes, collection_name: str, results):
+        """Store results, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = (collection_name, results)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def invalidate(self, collection_names=None):
+        """Drop every entry, or only those searched in the given collections"""
+        with self._lock:
+            if collection_names is None:
+                self._data.clear()
+                return
+            for key in [k for k, v in self._data.items() if v[0] in collection_names]:
+                del self._data[key]
+
+
+class _BreakerState:
+    """Consecutive-failure circuit breaker state for a single host"""
+    
+    __slots__ = ('fail_count', 'open_until')
+    
+    def __init__(self):
+        self.fail_count = 0
+        self.open_until = 0.0
 
 
 class APIClient:
@@ -18,9 +152,24 @@ class APIClient:
     Client for interacting with Ollama-RAG-Sync REST APIs
     """
     
+    # Consecutive transport failures before a host's circuit opens, and how
+    # long (seconds) calls to it then fail fast before it is tried again
+    BREAKER_THRESHOLD = 3
+    BREAKER_COOLDOWN = 10
+    
+    # Seconds a GET response stays cached, per endpoint kind
+    CACHE_TTL = {
+        'health': 4,
+        'status': 2,
+        'processing': 4,
+        'statistics': 10,
+        'collections': 30,
+    }
+    
     def __init__(self, filetracker_url: str = "http://localhost:10003", 
                  vectors_url: str = "http://localhost:10001",
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 max_connections: int = 20):
         """
         Initialize the API client
         
@@ -28,18 +177,204 @@ class APIClient:
             filetracker_url: Base URL for FileTracker API (default: http://localhost:10003)
             vectors_url: Base URL for Vectors API (default: http://localhost:10001)
             timeout: Request timeout in seconds (default: 30)
+            max_connections: Keep-alive connections pooled per host (default: 20)
+        
+        Note:
+            The Pode servers only speak HTTP/1.1, so there is no HTTP/2
+            multiplexing to opt into. Concurrent calls from worker threads
+            each get their own pooled connection instead; max_connections
+            should be at least the number of requests the GUI issues at once.
         """
-        self.filetracker_url = filetracker_url.rstrip('/')
-        self.vectors_url = vectors_url.rstrip('/')
+        self.filetracker_url = sys.intern(filetracker_url.rstrip('/'))
+        self.vectors_url = sys.intern(vectors_url.rstrip('/'))
         self.timeout = timeout
         
-    def _request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        # Endpoint URLs are built once here. Parameterized ones are bound
+        # str.format_map callables, e.g. self._u_file({'cid': 1, 'fid': 2})
+        ft = self.filetracker_url
+        self._u_collections = ft + "/api/collections"
+        self._u_collection = (ft + "/api/collections/{cid}").format_map
+        self._u_settings = (ft + "/api/collections/{cid}/settings").format_map
+        self._u_watch = (ft + "/api/collections/{cid}/watch").format_map
+        self._u_watchers_stop = ft + "/api/watchers/stop"
+        self._u_files = (ft + "/api/collections/{cid}/files").format_map
+        self._u_files_batch = (ft + "/api/collections/{cid}/files/batch").format_map
+        self._u_file_counts = (ft + "/api/collections/{cid}/file-counts").format_map
+        self._u_file = (ft + "/api/collections/{cid}/files/{fid}").format_map
+        self._u_all_files = ft + "/api/files"
+        self._u_file_metadata = (ft + "/api/files/{fid}/metadata").format_map
+        self._u_ft_status = ft + "/status"
+        self._u_ft_statistics = ft + "/api/statistics"
+        self._u_processing_status = ft + "/api/processing/status"
+        self._u_ft_health = ft + "/health"
+        vec = self.vectors_url
+        self._u_documents = vec + "/documents"
+        self._u_search_chunks = vec + "/api/search/chunks"
+        self._u_search_documents = vec + "/api/search/documents"
+        self._u_vector_collections = vec + "/api/collections"
+        self._u_vectors_status = vec + "/status"
+        self._u_vectors_statistics = vec + "/api/statistics"
+        self._u_vectors_health = vec + "/health"
+        
+        # Reuse TCP connections across calls (keep-alive) instead of opening
+        # a new connection for every request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max_connections,
+            max_retries=self._make_retry()
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # For the usual localhost setup, skip requests' per-call environment
+        # lookups (proxy variables, proxy bypass / registry checks, .netrc)
+        if self._is_loopback(self.filetracker_url) and self._is_loopback(self.vectors_url):
+            self._session.trust_env = False
+        # Ask for compressed bodies using every encoding urllib3 can decode
+        # here (zstd/br are included when zstandard/brotli are installed)
+        self._session.headers['Accept-Encoding'] = ', '.join(ACCEPT_ENCODING.split(','))
+        
+        # Health probes go through their own session that never retries, so
+        # an unresponsive API is reported down within one timeout
+        self._probe_session = requests.Session()
+        probe_adapter = HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+        self._probe_session.mount('http://', probe_adapter)
+        self._probe_session.mount('https://', probe_adapter)
+        self._probe_session.trust_env = self._session.trust_env
+        self._probe_session.headers.update(self._session.headers)
+        
+        # Threads for fanning one call out into concurrent requests (health
+        # probes, dashboard bundle). Started on demand and kept between calls
+        # so each fan-out doesn't pay thread start-up. Only leaf requests may
+        # be submitted here; a task waiting on another task could deadlock.
+        self._fanout = ThreadPoolExecutor(max_workers=max_connections,
+                                          thread_name_prefix='api-client')
+        
+        self._cache = _TTLCache()
+        self._search_cache = _SearchCache()
+        self._breakers: Dict[str, _BreakerState] = {}
+        self._breaker_lock = threading.Lock()
+        # Optional server endpoints that answered 404/405; callers go straight
+        # to their client-side fallback afterwards
+        self._missing_endpoints = set()
+    
+    @staticmethod
+    def _is_loopback(url: str) -> bool:
+        """Check whether url points at this machine"""
+        host = urlsplit(url).hostname or ''
+        return host == 'localhost' or host == '::1' or host.startswith('127.')
+    
+    @staticmethod
+    def _make_retry() -> Retry:
+        """
+        Build the retry policy for transient failures
+        
+        Only idempotent methods are retried, with exponential backoff plus
+        jitter so concurrent callers don't retry in lockstep.
+        """
+        options = dict(
+            total=3,
+            backoff_factor=0.25,
+            allowed_methods=frozenset(['GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS']),
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        try:
+            return Retry(backoff_jitter=0.1, **options)
+        except TypeError:
+            # urllib3 < 2.0 has no backoff_jitter
+            return Retry(**options)
+    
+    def _breaker(self, url: str) -> _BreakerState:
+        """Get the circuit breaker state for the host of url"""
+        host = urlsplit(url).netloc
+        with self._breaker_lock:
+            state = self._breakers.get(host)
+            if state is None:
+                state = self._breakers[host] = _BreakerState()
+            return state
+    
+    def _check_breaker(self, url: str) -> _BreakerState:
+        """
+        Get the circuit breaker for the host of url, refusing the call while it is open
+        
+        Raises:
+            APIClientException: If the breaker is open
+        """
+        breaker = self._breaker(url)
+        if time.monotonic() < breaker.open_until:
+            raise APIClientException(
+                f"API request failed: circuit open for {urlsplit(url).netloc} "
+                f"after {breaker.fail_count} consecutive failures"
+            )
+        return breaker
+    
+    def _record_result(self, breaker: _BreakerState, failed: bool):
+        """Update a breaker after a request; opens it after too many failures"""
+        with self._breaker_lock:
+            if not failed:
+                breaker.fail_count = 0
+                breaker.open_until = 0.0
+                return
+            breaker.fail_count += 1
+            if breaker.fail_count >= self.BREAKER_THRESHOLD:
+                breaker.open_until = time.monotonic() + self.BREAKER_COOLDOWN
+    
+    def warmup(self):
+        """
+        Open a pooled connection to each API ahead of the first real call
+        
+        Errors are ignored; an unreachable service is simply left cold.
+        """
+        for url in (self._u_ft_health, self._u_vectors_health):
+            try:
+                self._session.get(url, timeout=2).close()
+            except requests.exceptions.RequestException:
+                pass
+    
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections"""
+        self._fanout.shutdown(wait=False)
+        self._session.close()
+        self._probe_session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def invalidate(self, prefix: Optional[str] = None):
+        """
+        Drop cached GET responses
+        
+        Args:
+            prefix: Only drop entries whose URL starts with this prefix (default: all)
+        """
+        self._cache.invalidate(prefix)
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get response and search cache hit/miss counters"""
+        return {
+            'hits': self._cache.hits,
+            'misses': self._cache.misses,
+            'search_hits': self._search_cache.hits,
+            'search_misses': self._search_cache.misses,
+            'search_entries': len(self._search_cache)
+        }
+        
+    def _request(self, method: str, url: str, cache_ttl: Optional[float] = None,
+                 decode: Optional[Callable[[bytes], Dict[str, Any]]] = None,
+                 retry: bool = True, **kwargs) -> Dict[str, Any]:
         """
         Make an HTTP request and handle errors
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             url: Full URL to request
+            cache_ttl: Cache a successful GET response for this many seconds
+            decode: Custom decoder for the raw response body (default: JSON)
+            retry: Retry transient failures (False sends the request only once)
             **kwargs: Additional arguments to pass to requests
             
         Returns:
@@ -48,33 +383,92 @@ class APIClient:
         Raises:
             APIClientException: If request fails
         """
+        cache_key = None
+        if cache_ttl and method == 'GET':
+            params = kwargs.get('params') or {}
+            cache_key = (method, url, frozenset(params.items()))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if orjson is not None and kwargs.get('json') is not None:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **{'Content-Type': 'application/json'})
+        
+        breaker = self._check_breaker(url)
+        
         try:
             kwargs.setdefault('timeout', self.timeout)
-            response = requests.request(method, url, **kwargs)
+            try:
+                session = self._session if retry else self._probe_session
+                response = session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.RetryError):
+                self._record_result(breaker, failed=True)
+                raise
+            self._record_result(breaker, failed=response.status_code >= 500)
             response.raise_for_status()
-            return response.json()
+            if decode is not None:
+                result = decode(response.content)
+            elif orjson is not None:
+                # orjson parses the raw bytes directly, skipping the str decode
+                result = orjson.loads(response.content)
+            else:
+                result = response.json()
+            if cache_key is not None and result.get('success', True):
+                self._cache.set(cache_key, result, cache_ttl)
+            return result
+        except requests.exceptions.HTTPError as e:
+            raise APIClientException(f"API request failed: {str(e)}",
+                                     status_code=e.response.status_code)
         except requests.exceptions.RequestException as e:
             raise APIClientException(f"API request failed: {str(e)}")
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, ValueError) as e:
             raise APIClientException(f"Failed to parse API response: {str(e)}")
     
+    @staticmethod
+    def _unwrap(result: Dict[str, Any], key: Optional[str], error_message: str,
+                default: Any = None) -> Any:
+        """
+        Unpack a {"success": ..., key: ...} API response
+        
+        Args:
+            result: Decoded response
+            key: Payload key to return, or None for the whole response
+            error_message: Message prefix for the exception on failure
+            default: Value when key is missing (default: empty dict)
+            
+        Returns:
+            The payload under key (or the whole response)
+            
+        Raises:
+            APIClientException: If the response reports failure
+        """
+        if result.get('success'):
+            if key is None:
+                return result
+            return result.get(key, {} if default is None else default)
+        raise APIClientException(f"{error_message}: {result.get('error')}")
+    
     # ========== FileTracker API Methods ==========
     
-    def get_collections(self) -> List[Dict[str, Any]]:
-        """Get all collections"""
-        url = f"{self.filetracker_url}/api/collections"
-        result = self._request('GET', url)
-        if result.get('success'):
-            return result.get('collections', [])
-        raise APIClientException(f"Failed to get collections: {result.get('error')}")
+    def get_collections(self, as_objects: bool = False) -> List[Dict[str, Any]]:
+        """Get all collections (as Collection objects if as_objects is set)"""
+        url = self._u_collections
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['collections'])
+        collections = self._unwrap(result, 'collections', "Failed to get collections", default=[])
+        if as_objects:
+            return [Collection.from_dict(c) for c in collections]
+        return collections
     
-    def get_collection(self, collection_id: int) -> Dict[str, Any]:
-        """Get collection by ID"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}"
-        result = self._request('GET', url)
-        if result.get('success'):
-            return result.get('collection', {})
-        raise APIClientException(f"Failed to get collection: {result.get('error')}")
+    def get_collection(self, collection_id: int, as_objects: bool = False) -> Dict[str, Any]:
+        """Get collection by ID (as a Collection object if as_objects is set)"""
+        url = self._u_collection({'cid': collection_id})
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['collections'])
+        collection = self._unwrap(result, 'collection', "Failed to get collection")
+        if as_objects:
+            return Collection.from_dict(collection)
+        return collection
     
     def create_collection(self, name: str, source_folder: str, 
                          description: str = "", 
@@ -93,7 +487,7 @@ class APIClient:
         Returns:
             Created collection data
         """
-        url = f"{self.filetracker_url}/api/collections"
+        url = self._u_collections
         data = {
             "name": name,
             "sourceFolder": source_folder,
@@ -102,9 +496,8 @@ class APIClient:
             "excludeFolders": exclude_folders
         }
         result = self._request('POST', url, json=data)
-        if result.get('success'):
-            return result.get('collection', {})
-        raise APIClientException(f"Failed to create collection: {result.get('error')}")
+        self.invalidate(self.filetracker_url)
+        return self._unwrap(result, 'collection', "Failed to create collection")
     
     def update_collection(self, collection_id: int, **kwargs) -> Dict[str, Any]:
         """
@@ -117,22 +510,23 @@ class APIClient:
         Returns:
             Updated collection data
         """
-        url = f"{self.filetracker_url}/api/collections/{collection_id}"
+        url = self._u_collection({'cid': collection_id})
         result = self._request('PUT', url, json=kwargs)
-        if result.get('success'):
-            return result.get('collection', {})
-        raise APIClientException(f"Failed to update collection: {result.get('error')}")
+        self.invalidate(self.filetracker_url)
+        return self._unwrap(result, 'collection', "Failed to update collection")
     
     def delete_collection(self, collection_id: int) -> bool:
         """Delete a collection"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}"
+        url = self._u_collection({'cid': collection_id})
         result = self._request('DELETE', url)
+        self.invalidate(self.filetracker_url)
         return result.get('success', False)
     
     def get_collection_files(self, collection_id: int, 
                             dirty: Optional[bool] = None,
                             processed: Optional[bool] = None,
-                            deleted: Optional[bool] = None) -> List[Dict[str, Any]]:
+                            deleted: Optional[bool] = None,
+                            as_objects: bool = False) -> List[Dict[str, Any]]:
         """
         Get files in a collection
         
@@ -141,11 +535,95 @@ class APIClient:
             dirty: Filter for dirty files (unprocessed)
             processed: Filter for processed files
             deleted: Filter for deleted files
+            as_objects: Return TrackedFile objects instead of dictionaries
             
         Returns:
             List of files
         """
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/files"
+        url = self._u_files({'cid': collection_id})
+        params = self._file_filter_params(dirty, processed, deleted)
+        result = self._request('GET', url, params=params)
+        files = self._unwrap(result, 'files', "Failed to get files", default=[])
+        if as_objects:
+            return [TrackedFile.from_dict(f) for f in files]
+        return files
+    
+    def get_collection_files_page(self, collection_id: int, offset: int = 0, limit: int = 200,
+                                  dirty: Optional[bool] = None,
+                                  processed: Optional[bool] = None,
+                                  deleted: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        Get one page of the files in a collection
+        
+        Servers without paging support return every file in the first page;
+        'total' is then the number of files received.
+        
+        Args:
+            collection_id: Collection ID
+            offset: Number of files to skip
+            limit: Maximum number of files to return
+            dirty: Filter for dirty files (unprocessed)
+            processed: Filter for processed files
+            deleted: Filter for deleted files
+            
+        Returns:
+            Dictionary with the page's 'files' and the 'total' number of files
+        """
+        url = self._u_files({'cid': collection_id})
+        params = dict(self._file_filter_params(dirty, processed, deleted), offset=offset, limit=limit)
+        result = self._request('GET', url, params=params)
+        files = self._unwrap(result, 'files', "Failed to get files", default=[])
+        total = result.get('total')
+        if total is None:
+            total = offset + len(files)
+        return {'files': files, 'total': total}
+    
+    def get_all_files(self, dirty: Optional[bool] = None,
+                      processed: Optional[bool] = None,
+                      deleted: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """
+        Get the files of every collection
+        
+        Uses the server's /api/files endpoint when available. Otherwise (404/405,
+        remembered for later calls) the collections are listed and their files
+        fetched concurrently; a collection that fails to load is skipped.
+        
+        Args:
+            dirty: Filter for dirty files (unprocessed)
+            processed: Filter for processed files
+            deleted: Filter for deleted files
+            
+        Returns:
+            List of files, each with 'collection_id' and 'collection_name'
+        """
+        params = self._file_filter_params(dirty, processed, deleted)
+        if 'files' not in self._missing_endpoints:
+            try:
+                result = self._request('GET', self._u_all_files, params=params)
+                return self._unwrap(result, 'files', "Failed to get files", default=[])
+            except APIClientException as e:
+                if e.status_code not in (404, 405):
+                    raise
+                self._missing_endpoints.add('files')
+        
+        def fetch(collection):
+            try:
+                files = self.get_collection_files(collection['id'], dirty, processed, deleted)
+            except APIClientException:
+                return []
+            for f in files:
+                f['collection_id'] = collection['id']
+                f['collection_name'] = collection.get('name', '')
+            return files
+        
+        collections = self.get_collections()
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(collections)))) as executor:
+            return [f for files in executor.map(fetch, collections) for f in files]
+    
+    @staticmethod
+    def _file_filter_params(dirty: Optional[bool], processed: Optional[bool],
+                            deleted: Optional[bool]) -> Dict[str, str]:
+        """Build the query parameters for the collection files filters"""
         params = {}
         if dirty is not None:
             params['dirty'] = 'true' if dirty else 'false'
@@ -153,53 +631,274 @@ class APIClient:
             params['processed'] = 'true' if processed else 'false'
         if deleted is not None:
             params['deleted'] = 'true' if deleted else 'false'
+        return params
+    
+    def iter_collection_files(self, collection_id: int,
+                              dirty: Optional[bool] = None,
+                              processed: Optional[bool] = None,
+                              deleted: Optional[bool] = None,
+                              page_size: int = 1000,
+                              as_objects: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the files in a collection without loading them all at once
+        
+        Files are requested page by page (offset/limit). When ijson is
+        installed each page is also parsed incrementally from the socket, so
+        files are yielded as they arrive. Servers without paging support
+        return everything in the first page, which is then the only one.
+        
+        Args:
+            collection_id: Collection ID
+            dirty: Filter for dirty files (unprocessed)
+            processed: Filter for processed files
+            deleted: Filter for deleted files
+            page_size: Files requested per page (default: 1000)
+            as_objects: Yield TrackedFile objects instead of dictionaries
             
-        result = self._request('GET', url, params=params)
-        if result.get('success'):
-            return result.get('files', [])
-        raise APIClientException(f"Failed to get files: {result.get('error')}")
+        Yields:
+            One file at a time
+        """
+        url = self._u_files({'cid': collection_id})
+        params = self._file_filter_params(dirty, processed, deleted)
+        offset = 0
+        while True:
+            page = dict(params, offset=offset, limit=page_size)
+            if ijson is not None:
+                count, total = yield from self._stream_files_page(url, page, as_objects)
+            else:
+                result = self._request('GET', url, params=page)
+                files = self._unwrap(result, 'files', "Failed to get files", default=[])
+                for f in files:
+                    yield TrackedFile.from_dict(f) if as_objects else f
+                count, total = len(files), result.get('total')
+            
+            offset += count
+            # No 'total' means the server ignored offset/limit and sent everything
+            if total is None or count == 0 or offset >= total:
+                return
+    
+    def _stream_files_page(self, url: str, params: Dict[str, Any], as_objects: bool):
+        """
+        Stream one page of files with ijson, yielding each file as it is parsed
+        
+        Returns (via StopIteration) a (count, total) tuple; total is None if
+        the server did not report one. Like _request, the call goes through
+        the host's circuit breaker, and a connection lost mid-stream counts
+        as a failure.
+        """
+        breaker = self._check_breaker(url)
+        try:
+            try:
+                response = self._session.get(url, params=params, stream=True, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.RetryError):
+                self._record_result(breaker, failed=True)
+                raise
+            if response.status_code >= 400:
+                # A success is only recorded once the whole body has been read
+                self._record_result(breaker, failed=response.status_code >= 500)
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise APIClientException(f"API request failed: {str(e)}",
+                                     status_code=e.response.status_code)
+        except requests.exceptions.RequestException as e:
+            raise APIClientException(f"API request failed: {str(e)}")
+        
+        count, total, success, error = 0, None, False, None
+        with response:
+            # Let urllib3 undo gzip/deflate before ijson sees the bytes
+            response.raw.decode_content = True
+            builder = None
+            try:
+                for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == 'files.item' and event == 'end_map':
+                            count += 1
+                            yield TrackedFile.from_dict(builder.value) if as_objects else builder.value
+                            builder = None
+                    elif prefix == 'files.item' and event == 'start_map':
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == 'total':
+                        total = int(value)
+                    elif prefix == 'success':
+                        success = value
+                    elif prefix == 'error':
+                        error = value
+            except ijson.JSONError as e:
+                raise APIClientException(f"Failed to parse API response: {str(e)}")
+            except (Urllib3HTTPError, requests.exceptions.RequestException) as e:
+                # Read errors surface from response.raw as urllib3 exceptions
+                self._record_result(breaker, failed=True)
+                raise APIClientException(f"API request failed: {str(e)}")
+        self._record_result(breaker, failed=False)
+        
+        if not success:
+            raise APIClientException(f"Failed to get files: {error}")
+        return count, total
+    
+    def get_collection_file_counts(self, collection_id: int) -> Dict[str, int]:
+        """
+        Get the number of dirty, processed and deleted files in a collection
+        
+        Uses the server's file-counts endpoint when available; otherwise the
+        three filtered file lists are fetched concurrently and counted.
+        
+        Args:
+            collection_id: Collection ID
+            
+        Returns:
+            Dictionary with 'dirty', 'processed' and 'deleted' counts
+        """
+        if 'file-counts' not in self._missing_endpoints:
+            try:
+                result = self._request('GET', self._u_file_counts({'cid': collection_id}),
+                                       cache_ttl=self.CACHE_TTL['status'])
+                return self._unwrap(result, 'counts', "Failed to get file counts")
+            except APIClientException as e:
+                if e.status_code not in (404, 405):
+                    raise
+                self._missing_endpoints.add('file-counts')
+        
+        submit = self._fanout.submit
+        dirty = submit(self.get_collection_files, collection_id, dirty=True)
+        processed = submit(self.get_collection_files, collection_id, processed=True)
+        deleted = submit(self.get_collection_files, collection_id, deleted=True)
+        return {
+            'dirty': len(dirty.result()),
+            'processed': len(processed.result()),
+            'deleted': len(deleted.result())
+        }
+    
+    def get_collections_file_counts(self, collection_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        """
+        Get file counts for several collections concurrently
+        
+        Args:
+            collection_ids: Collection IDs
+            
+        Returns:
+            Dictionary mapping collection ID to its counts (see get_collection_file_counts)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(collection_ids)))) as executor:
+            return dict(zip(collection_ids,
+                            executor.map(self.get_collection_file_counts, collection_ids)))
     
     def add_file_to_collection(self, collection_id: int, file_path: str,
                                original_url: str = "", dirty: bool = True) -> Dict[str, Any]:
         """Add a file to a collection"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/files"
+        url = self._u_files({'cid': collection_id})
         data = {
             "filePath": file_path,
             "originalUrl": original_url,
             "dirty": dirty
         }
         result = self._request('POST', url, json=data)
-        if result.get('success'):
-            return result.get('file', {})
-        raise APIClientException(f"Failed to add file: {result.get('error')}")
+        self.invalidate(self.filetracker_url)
+        return self._unwrap(result, 'file', "Failed to add file")
     
     def update_file_status(self, collection_id: int, file_id: int, dirty: bool) -> bool:
         """Update file processing status"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/files/{file_id}"
+        url = self._u_file({'cid': collection_id, 'fid': file_id})
         data = {"dirty": dirty}
         result = self._request('PUT', url, json=data)
+        self.invalidate(self.filetracker_url)
         return result.get('success', False)
     
     def update_all_files_status(self, collection_id: int, dirty: bool) -> bool:
         """Update all files status in a collection"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/files"
+        url = self._u_files({'cid': collection_id})
         data = {"dirty": dirty}
         result = self._request('PUT', url, json=data)
+        self.invalidate(self.filetracker_url)
         return result.get('success', False)
     
     def delete_file_from_collection(self, collection_id: int, file_id: int) -> bool:
         """Remove a file from a collection"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/files/{file_id}"
+        url = self._u_file({'cid': collection_id, 'fid': file_id})
         result = self._request('DELETE', url)
+        self.invalidate(self.filetracker_url)
         return result.get('success', False)
     
+    def _batch_files(self, collection_id: int, data: Dict[str, Any],
+                     fallback, file_ids: List[int]) -> Dict[str, Any]:
+        """
+        POST a batch file operation, falling back to per-file calls
+        
+        Servers without the /files/batch endpoint (404/405) are remembered so
+        later batches go straight to the fallback, which runs the per-file
+        calls concurrently over the pooled session.
+        
+        Returns:
+            Dictionary with 'count' (files changed) and 'failed' (file IDs)
+        """
+        if not file_ids:
+            return {'count': 0, 'failed': []}
+        
+        if 'files/batch' not in self._missing_endpoints:
+            url = self._u_files_batch({'cid': collection_id})
+            try:
+                result = self._request('POST', url, json=dict(data, fileIds=list(file_ids)))
+                self.invalidate(self.filetracker_url)
+                self._unwrap(result, None, "Batch file operation failed")
+                return {'count': result.get('count', 0), 'failed': result.get('failed', [])}
+            except APIClientException as e:
+                if e.status_code not in (404, 405):
+                    raise
+                self._missing_endpoints.add('files/batch')
+        
+        def run(file_id):
+            try:
+                return fallback(collection_id, file_id)
+            except APIClientException:
+                return False
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(run, file_ids))
+        failed = [fid for fid, ok in zip(file_ids, outcomes) if not ok]
+        return {'count': len(file_ids) - len(failed), 'failed': failed}
+    
+    def update_files_status(self, collection_id: int, file_ids: List[int],
+                            dirty: bool) -> Dict[str, Any]:
+        """
+        Update the processing status of several files in one request
+        
+        Args:
+            collection_id: Collection ID
+            file_ids: IDs of the files to update
+            dirty: New dirty flag for every listed file
+            
+        Returns:
+            Dictionary with 'count' (files updated) and 'failed' (file IDs)
+        """
+        return self._batch_files(
+            collection_id, {"action": "update", "dirty": dirty},
+            lambda cid, fid: self.update_file_status(cid, fid, dirty), file_ids
+        )
+    
+    def delete_files_from_collection(self, collection_id: int,
+                                     file_ids: List[int]) -> Dict[str, Any]:
+        """
+        Remove several files from a collection in one request
+        
+        Args:
+            collection_id: Collection ID
+            file_ids: IDs of the files to remove
+            
+        Returns:
+            Dictionary with 'count' (files removed) and 'failed' (file IDs)
+        """
+        return self._batch_files(
+            collection_id, {"action": "delete"},
+            self.delete_file_from_collection, file_ids
+        )
+    
     def get_file_metadata(self, file_id: int) -> Dict[str, Any]:
         """Get file metadata"""
-        url = f"{self.filetracker_url}/api/files/{file_id}/metadata"
+        url = self._u_file_metadata({'fid': file_id})
         result = self._request('GET', url)
-        if result.get('success'):
-            return result
-        raise APIClientException(f"Failed to get file metadata: {result.get('error')}")
+        return self._unwrap(result, None, "Failed to get file metadata")
     
     def start_collection_watcher(self, collection_id: int, 
                                  watch_created: bool = True,
@@ -225,7 +924,7 @@ class APIClient:
         Returns:
             Watch job information
         """
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/watch"
+        url = self._u_watch({'cid': collection_id})
         data = {
             "action": "start",
             "watchCreated": watch_created,
@@ -237,32 +936,68 @@ class APIClient:
             "omitFolders": omit_folders or []
         }
         result = self._request('POST', url, json=data)
-        if result.get('success'):
-            return result
-        raise APIClientException(f"Failed to start watcher: {result.get('error')}")
+        self.invalidate(self.filetracker_url)
+        return self._unwrap(result, None, "Failed to start watcher")
     
     def stop_collection_watcher(self, collection_id: int) -> bool:
         """Stop watching a collection"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/watch"
+        url = self._u_watch({'cid': collection_id})
         data = {"action": "stop"}
         result = self._request('POST', url, json=data)
+        self.invalidate(self.filetracker_url)
         return result.get('success', False)
     
+    def stop_collection_watchers(self, collection_ids: List[int]) -> Dict[str, Any]:
+        """
+        Stop watching several collections in one request
+        
+        Servers without the /api/watchers/stop endpoint (404/405) are
+        remembered, and the watchers are then stopped one call each,
+        concurrently over the pooled session.
+        
+        Args:
+            collection_ids: IDs of the collections to stop watching
+            
+        Returns:
+            Dictionary with 'count' (watchers stopped) and 'failed' (collection IDs)
+        """
+        if not collection_ids:
+            return {'count': 0, 'failed': []}
+        
+        if 'watchers/stop' not in self._missing_endpoints:
+            try:
+                result = self._request('POST', self._u_watchers_stop,
+                                       json={"collectionIds": list(collection_ids)})
+                self.invalidate(self.filetracker_url)
+                self._unwrap(result, None, "Failed to stop watchers")
+                return {'count': result.get('count', 0), 'failed': result.get('failed', [])}
+            except APIClientException as e:
+                if e.status_code not in (404, 405):
+                    raise
+                self._missing_endpoints.add('watchers/stop')
+        
+        def run(collection_id):
+            try:
+                return self.stop_collection_watcher(collection_id)
+            except APIClientException:
+                return False
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(run, collection_ids))
+        failed = [cid for cid, ok in zip(collection_ids, outcomes) if not ok]
+        return {'count': len(collection_ids) - len(failed), 'failed': failed}
+    
     def get_collection_settings(self, collection_id: int) -> Dict[str, Any]:
         """Get collection settings including watch status"""
-        url = f"{self.filetracker_url}/api/collections/{collection_id}/settings"
-        result = self._request('GET', url)
-        if result.get('success'):
-            return result
-        raise APIClientException(f"Failed to get settings: {result.get('error')}")
+        url = self._u_settings({'cid': collection_id})
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['status'])
+        return self._unwrap(result, None, "Failed to get settings")
     
     def get_filetracker_status(self) -> Dict[str, Any]:
         """Get FileTracker system status"""
-        url = f"{self.filetracker_url}/status"
-        result = self._request('GET', url)
-        if result.get('success'):
-            return result.get('status', {})
-        raise APIClientException(f"Failed to get status: {result.get('error')}")
+        url = self._u_ft_status
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['status'])
+        return self._unwrap(result, 'status', "Failed to get status")
     
     def get_filetracker_statistics(self) -> Dict[str, Any]:
         """
@@ -271,30 +1006,58 @@ class APIClient:
         Note: This endpoint can be slow for large databases.
         Uses a shorter timeout (10s) to fail fast if server is overloaded.
         """
-        url = f"{self.filetracker_url}/api/statistics"
+        url = self._u_ft_statistics
         # Use shorter timeout for statistics since it can be slow
-        result = self._request('GET', url, timeout=10)
-        if result.get('success'):
-            return result.get('statistics', {})
-        raise APIClientException(f"Failed to get statistics: {result.get('error')}")
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['statistics'], timeout=10)
+        return self._unwrap(result, 'statistics', "Failed to get statistics")
     
     def get_processing_status(self) -> List[Dict[str, Any]]:
         """Get status of all processing jobs"""
-        url = f"{self.filetracker_url}/api/processing/status"
-        result = self._request('GET', url)
-        if result.get('success'):
-            return result.get('jobs', [])
-        raise APIClientException(f"Failed to get processing status: {result.get('error')}")
+        url = self._u_processing_status
+        # Watcher start/stop invalidate the FileTracker cache, so a cached
+        # job list never outlives a change made through this client
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['processing'])
+        return self._unwrap(result, 'jobs', "Failed to get processing status", default=[])
+    
+    def check_filetracker_health(self, timeout: Optional[float] = None,
+                                 use_cache: bool = True) -> bool:
+        """Check if FileTracker API is healthy (use_cache=False forces a fresh probe)"""
+        return self._check_health(self._u_ft_health, timeout, use_cache)
     
-    def check_filetracker_health(self) -> bool:
-        """Check if FileTracker API is healthy"""
+    def _check_health(self, url: str, timeout: Optional[float], use_cache: bool) -> bool:
+        """
+        Probe a health endpoint, answering from the health cache when allowed
+        
+        Both outcomes are cached for CACHE_TTL['health'] seconds, so callers
+        polling within that window share one probe.
+        """
+        key = ('HEALTH', url)
+        if use_cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
         try:
-            url = f"{self.filetracker_url}/health"
-            result = self._request('GET', url)
-            return result.get('status') == 'OK'
+            # Not retried, so the probe fails fast instead of backing off
+            result = self._request('GET', url, timeout=timeout or self.timeout, retry=False)
+            healthy = result.get('status') == 'OK'
         except (APIClientException, requests.exceptions.RequestException):
-            # Return False for all HTTP errors including 404, connection errors, timeouts, etc.
-            return False
+            # False for all HTTP errors including 404, connection errors, timeouts, etc.
+            healthy = False
+        self._cache.set(key, healthy, self.CACHE_TTL['health'])
+        return healthy
+    
+    def cached_health(self) -> Dict[str, Optional[bool]]:
+        """
+        Get the cached health flags without probing
+        
+        Returns:
+            Dictionary with 'filetracker' and 'vectors' health flags, each
+            None when no recent probe result is cached
+        """
+        return {
+            'filetracker': self._cache.get(('HEALTH', self._u_ft_health)),
+            'vectors': self._cache.get(('HEALTH', self._u_vectors_health))
+        }
     
     # ========== Vectors API Methods ==========
     
@@ -319,7 +1082,7 @@ class APIClient:
         Returns:
             Add document result
         """
-        url = f"{self.vectors_url}/documents"
+        url = self._u_documents
         data = {
             "filePath": file_path,
             "originalFilePath": original_file_path or file_path,
@@ -331,27 +1094,32 @@ class APIClient:
             "collectionName": collection_name
         }
         result = self._request('POST', url, json=data)
-        if result.get('success'):
-            return result
-        raise APIClientException(f"Failed to add document: {result.get('error')}")
+        self.invalidate(self.vectors_url)
+        # Documents are always stored in "default" as well as their own collection
+        self._search_cache.invalidate({collection_name, "default"})
+        return self._unwrap(result, None, "Failed to add document")
     
     def remove_document(self, file_path: str, file_id: int = 0,
                        collection_name: str = "default") -> bool:
         """Remove a document from the vector database"""
-        url = f"{self.vectors_url}/documents"
+        url = self._u_documents
         data = {
             "filePath": file_path,
             "fileId": file_id,
             "collectionName": collection_name
         }
         result = self._request('DELETE', url, json=data)
+        self.invalidate(self.vectors_url)
+        self._search_cache.invalidate({collection_name, "default"})
         return result.get('success', False)
     
     def search_chunks(self, query: str, max_results: int = 10,
                      threshold: float = 0.0,
                      aggregate_by_document: bool = False,
                      collection_name: str = "default",
-                     filter_dict: Optional[Dict] = None) -> List[Dict[str, Any]]:
+                     filter_dict: Optional[Dict] = None,
+                     as_objects: bool = False,
+                     cache: bool = False) -> List[Dict[str, Any]]:
         """
         Search for relevant chunks
         
@@ -362,11 +1130,13 @@ class APIClient:
             aggregate_by_document: Aggregate results by document
             collection_name: Collection to search in
             filter_dict: Optional metadata filter
+            as_objects: Return ChunkResult objects instead of dictionaries
+            cache: Reuse results of an identical earlier search
             
         Returns:
             List of matching chunks
         """
-        url = f"{self.vectors_url}/api/search/chunks"
+        url = self._u_search_chunks
         data = {
             "query": query,
             "max_results": max_results,
@@ -375,16 +1145,15 @@ class APIClient:
             "collectionName": collection_name,
             "filter": filter_dict or {}
         }
-        result = self._request('POST', url, json=data)
-        if result.get('success'):
-            return result.get('results', [])
-        raise APIClientException(f"Search failed: {result.get('error')}")
+        return self._search(url, data, as_objects, cache)
     
     def search_documents(self, query: str, max_results: int = 10,
                         threshold: float = 0.5,
                         return_content: bool = False,
                         collection_name: str = "default",
-                        filter_dict: Optional[Dict] = None) -> List[Dict[str, Any]]:
+                        filter_dict: Optional[Dict] = None,
+                        as_objects: bool = False,
+                        cache: bool = False) -> List[Dict[str, Any]]:
         """
         Search for relevant documents
         
@@ -395,11 +1164,13 @@ class APIClient:
             return_content: Include document content in results
             collection_name: Collection to search in
             filter_dict: Optional metadata filter
+            as_objects: Return ChunkResult objects instead of dictionaries
+            cache: Reuse results of an identical earlier search
             
         Returns:
             List of matching documents
         """
-        url = f"{self.vectors_url}/api/search/documents"
+        url = self._u_search_documents
         data = {
             "query": query,
             "max_results": max_results,
@@ -408,39 +1179,138 @@ class APIClient:
             "collectionName": collection_name,
             "filter": filter_dict or {}
         }
-        result = self._request('POST', url, json=data)
-        if result.get('success'):
-            return result.get('results', [])
-        raise APIClientException(f"Search failed: {result.get('error')}")
+        return self._search(url, data, as_objects, cache)
+    
+    def _search(self, url: str, data: Dict[str, Any], as_objects: bool,
+                cache: bool) -> List[Any]:
+        """
+        POST a search request, optionally through the search result cache
+        
+        Cached entries are keyed on the full request (and the result type),
+        and are dropped when add_document/remove_document touches their
+        collection.
+        """
+        key = None
+        if cache:
+            key = self._search_cache.make_key(url, dict(data, as_objects=as_objects))
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                return list(cached)
+        
+        # With msgspec the body is decoded straight into ChunkResult objects
+        decode = decode_search_response if as_objects and HAS_MSGSPEC else None
+        result = self._request('POST', url, json=data, decode=decode)
+        results = self._unwrap(result, 'results', "Search failed", default=[])
+        if as_objects and decode is None:
+            results = [ChunkResult.from_dict(r) for r in results]
+        
+        if key is not None:
+            self._search_cache.set(key, data['collectionName'], results)
+            return list(results)
+        return results
     
     def get_vector_collections(self) -> List[str]:
         """Get list of collections in vector database"""
-        url = f"{self.vectors_url}/api/collections"
-        result = self._request('GET', url)
+        url = self._u_vector_collections
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['collections'])
         if result.get('success'):
             return result.get('collections', [])
         return []
     
     def get_vectors_status(self) -> Dict[str, Any]:
         """Get Vectors API status"""
-        url = f"{self.vectors_url}/status"
+        url = self._u_vectors_status
         result = self._request('GET', url)
         return result
     
     def get_vectors_statistics(self) -> Dict[str, Any]:
         """Get Vectors API statistics"""
-        url = f"{self.vectors_url}/api/statistics"
-        result = self._request('GET', url)
-        if result.get('success'):
-            return result.get('statistics', {})
-        raise APIClientException(f"Failed to get statistics: {result.get('error')}")
+        url = self._u_vectors_statistics
+        result = self._request('GET', url, cache_ttl=self.CACHE_TTL['statistics'])
+        return self._unwrap(result, 'statistics', "Failed to get statistics")
     
-    def check_vectors_health(self) -> bool:
-        """Check if Vectors API is healthy"""
-        try:
-            url = f"{self.vectors_url}/health"
-            result = self._request('GET', url)
-            return result.get('status') == 'OK'
-        except (APIClientException, requests.exceptions.RequestException):
-            # Return False for all HTTP errors including 404, connection errors, timeouts, etc.
-            return False
+    def check_vectors_health(self, timeout: Optional[float] = None,
+                             use_cache: bool = True) -> bool:
+        """Check if Vectors API is healthy (use_cache=False forces a fresh probe)"""
+        return self._check_health(self._u_vectors_health, timeout, use_cache)
+    
+    # ========== Combined Methods ==========
+    
+    def check_health_all(self, timeout: float = 2, use_cache: bool = True) -> Dict[str, bool]:
+        """
+        Probe both APIs concurrently
+        
+        Args:
+            timeout: Per-probe timeout in seconds (default: 2), so a dead
+                service is reported quickly instead of after the full timeout
+            use_cache: Answer from the health cache when it is fresh (default: True)
+            
+        Returns:
+            Dictionary with 'filetracker' and 'vectors' health flags
+        """
+        ft = self._fanout.submit(self.check_filetracker_health, timeout, use_cache)
+        vec = self._fanout.submit(self.check_vectors_health, timeout, use_cache)
+        return {'filetracker': ft.result(), 'vectors': vec.result()}
+    
+    def get_dashboard_bundle(self) -> Dict[str, Any]:
+        """
+        Fetch everything the dashboard shows in one concurrent round
+        
+        The four calls share the session's connection pool, so the round
+        takes as long as the slowest call rather than the sum of all four.
+        Failed calls are reported as the exception instance for that key
+        instead of aborting the whole bundle.
+        
+        Returns:
+            Dictionary with filetracker_statistics, processing_status,
+            vectors_status and vectors_statistics
+        """
+        calls = {
+            'filetracker_statistics': self.get_filetracker_statistics,
+            'processing_status': self.get_processing_status,
+            'vectors_status': self.get_vectors_status,
+            'vectors_statistics': self.get_vectors_statistics,
+        }
+        futures = {key: self._fanout.submit(func) for key, func in calls.items()}
+        
+        bundle = {}
+        for key, future in futures.items():
+            error = future.exception()
+            bundle[key] = error if error is not None else future.result()
+        return bundle
+
+
+# ========== Shared Client ==========
+
+_default_client: Optional[APIClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client(**kwargs) -> APIClient:
+    """
+    Get the process-wide shared APIClient, creating it on first use
+    
+    All GUI widgets should use this client so they share one connection
+    pool and response cache. Widgets must not call close() on it; the
+    application closes it on exit via close_default_client().
+    
+    Args:
+        **kwargs: APIClient constructor arguments, only used on the first call
+        
+    Returns:
+        The shared APIClient
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = APIClient(**kwargs)
+        return _default_client
+
+
+def close_default_client():
+    """Close the shared APIClient (if created) so the next call makes a new one"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is not None:
+            _default_client.close()
+            _default_client = None
@@ -0,0 +1,444 @@
+"""
+Async REST API Client for Ollama-RAG-Sync
+asyncio/aiohttp counterpart of APIClient for issuing many calls concurrently
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional, Any
+
+import aiohttp
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    from .api_client import APIClientException
+except ImportError:  # imported as a top-level module by the GUI scripts
+    from api_client import APIClientException
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a request body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+class AsyncAPIClient:
+    """
+    Async client for interacting with Ollama-RAG-Sync REST APIs
+
+    Mirrors the method set of APIClient, but every call is a coroutine so
+    independent requests can be awaited together (see gather_dashboard).
+    Qt code should run these on a background event loop thread, e.g. via
+    asyncio.run_coroutine_threadsafe(), or through qasync.
+    """
+
+    def __init__(self, filetracker_url: str = "http://localhost:10003",
+                 vectors_url: str = "http://localhost:10001",
+                 timeout: int = 30,
+                 max_connections: int = 20):
+        """
+        Initialize the async API client
+
+        Args:
+            filetracker_url: Base URL for FileTracker API (default: http://localhost:10003)
+            vectors_url: Base URL for Vectors API (default: http://localhost:10001)
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Total keep-alive connections in the pool (default: 20)
+        """
+        self.filetracker_url = filetracker_url.rstrip('/')
+        self.vectors_url = vectors_url.rstrip('/')
+        self.timeout = timeout
+        self.max_connections = max_connections
+        # The session is bound to the event loop it is created on, so it is
+        # created lazily from inside a coroutine
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                json_serialize=_json_dumps
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session and release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make an HTTP request and handle errors
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            url: Full URL to request
+            **kwargs: Additional arguments to pass to aiohttp
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            APIClientException: If request fails
+        """
+        timeout = kwargs.pop('timeout', None)
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                response.raise_for_status()
+                body = await response.read()
+                if not body.strip():
+                    # Callers all read the result with .get(); an empty body
+                    # then reads as an unsuccessful response
+                    return {}
+                if orjson is not None:
+                    # orjson parses the raw bytes directly, skipping the str decode
+                    return orjson.loads(body)
+                return json.loads(body)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIClientException(f"API request failed: {str(e) or type(e).__name__}")
+        except json.JSONDecodeError as e:
+            raise APIClientException(f"Failed to parse API response: {str(e)}")
+
+    # ========== Aggregate Helpers ==========
+
+    async def gather_dashboard(self) -> Dict[str, Any]:
+        """
+        Fetch everything the dashboard shows in one concurrent round
+
+        Failed calls are reported as the exception instance for that key
+        instead of aborting the whole batch.
+
+        Returns:
+            Dictionary with collections, filetracker_status, filetracker_statistics,
+            vectors_status, vectors_statistics, filetracker_healthy, vectors_healthy
+        """
+        keys = ('collections', 'filetracker_status', 'filetracker_statistics',
+                'vectors_status', 'vectors_statistics',
+                'filetracker_healthy', 'vectors_healthy')
+        results = await asyncio.gather(
+            self.get_collections(),
+            self.get_filetracker_status(),
+            self.get_filetracker_statistics(),
+            self.get_vectors_status(),
+            self.get_vectors_statistics(),
+            self.check_filetracker_health(),
+            self.check_vectors_health(),
+            return_exceptions=True
+        )
+        return dict(zip(keys, results))
+
+    async def check_health_all(self, timeout: float = 2) -> Dict[str, bool]:
+        """
+        Probe both APIs concurrently
+
+        Args:
+            timeout: Per-probe timeout in seconds (default: 2)
+
+        Returns:
+            Dictionary with 'filetracker' and 'vectors' health flags
+        """
+        ft, vec = await asyncio.gather(
+            self.check_filetracker_health(timeout),
+            self.check_vectors_health(timeout)
+        )
+        return {'filetracker': ft, 'vectors': vec}
+
+    # ========== FileTracker API Methods ==========
+
+    async def get_collections(self) -> List[Dict[str, Any]]:
+        """Get all collections"""
+        url = f"{self.filetracker_url}/api/collections"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result.get('collections', [])
+        raise APIClientException(f"Failed to get collections: {result.get('error')}")
+
+    async def get_collection(self, collection_id: int) -> Dict[str, Any]:
+        """Get collection by ID"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result.get('collection', {})
+        raise APIClientException(f"Failed to get collection: {result.get('error')}")
+
+    async def create_collection(self, name: str, source_folder: str,
+                                description: str = "",
+                                include_extensions: str = "",
+                                exclude_folders: str = "") -> Dict[str, Any]:
+        """Create a new collection (see APIClient.create_collection)"""
+        url = f"{self.filetracker_url}/api/collections"
+        data = {
+            "name": name,
+            "sourceFolder": source_folder,
+            "description": description,
+            "includeExtensions": include_extensions,
+            "excludeFolders": exclude_folders
+        }
+        result = await self._request('POST', url, json=data)
+        if result.get('success'):
+            return result.get('collection', {})
+        raise APIClientException(f"Failed to create collection: {result.get('error')}")
+
+    async def update_collection(self, collection_id: int, **kwargs) -> Dict[str, Any]:
+        """Update a collection (see APIClient.update_collection)"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}"
+        result = await self._request('PUT', url, json=kwargs)
+        if result.get('success'):
+            return result.get('collection', {})
+        raise APIClientException(f"Failed to update collection: {result.get('error')}")
+
+    async def delete_collection(self, collection_id: int) -> bool:
+        """Delete a collection"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}"
+        result = await self._request('DELETE', url)
+        return result.get('success', False)
+
+    async def get_collection_files(self, collection_id: int,
+                                   dirty: Optional[bool] = None,
+                                   processed: Optional[bool] = None,
+                                   deleted: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Get files in a collection (see APIClient.get_collection_files)"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/files"
+        params = {}
+        if dirty is not None:
+            params['dirty'] = 'true' if dirty else 'false'
+        if processed is not None:
+            params['processed'] = 'true' if processed else 'false'
+        if deleted is not None:
+            params['deleted'] = 'true' if deleted else 'false'
+
+        result = await self._request('GET', url, params=params)
+        if result.get('success'):
+            return result.get('files', [])
+        raise APIClientException(f"Failed to get files: {result.get('error')}")
+
+    async def add_file_to_collection(self, collection_id: int, file_path: str,
+                                     original_url: str = "", dirty: bool = True) -> Dict[str, Any]:
+        """Add a file to a collection"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/files"
+        data = {
+            "filePath": file_path,
+            "originalUrl": original_url,
+            "dirty": dirty
+        }
+        result = await self._request('POST', url, json=data)
+        if result.get('success'):
+            return result.get('file', {})
+        raise APIClientException(f"Failed to add file: {result.get('error')}")
+
+    async def update_file_status(self, collection_id: int, file_id: int, dirty: bool) -> bool:
+        """Update file processing status"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/files/{file_id}"
+        result = await self._request('PUT', url, json={"dirty": dirty})
+        return result.get('success', False)
+
+    async def update_all_files_status(self, collection_id: int, dirty: bool) -> bool:
+        """Update all files status in a collection"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/files"
+        result = await self._request('PUT', url, json={"dirty": dirty})
+        return result.get('success', False)
+
+    async def delete_file_from_collection(self, collection_id: int, file_id: int) -> bool:
+        """Remove a file from a collection"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/files/{file_id}"
+        result = await self._request('DELETE', url)
+        return result.get('success', False)
+
+    async def get_file_metadata(self, file_id: int) -> Dict[str, Any]:
+        """Get file metadata"""
+        url = f"{self.filetracker_url}/api/files/{file_id}/metadata"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result
+        raise APIClientException(f"Failed to get file metadata: {result.get('error')}")
+
+    async def start_collection_watcher(self, collection_id: int,
+                                       watch_created: bool = True,
+                                       watch_modified: bool = True,
+                                       watch_deleted: bool = True,
+                                       watch_renamed: bool = True,
+                                       include_subdirectories: bool = True,
+                                       process_interval: int = 15,
+                                       omit_folders: List[str] = None) -> Dict[str, Any]:
+        """Start watching a collection for file changes (see APIClient.start_collection_watcher)"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/watch"
+        data = {
+            "action": "start",
+            "watchCreated": watch_created,
+            "watchModified": watch_modified,
+            "watchDeleted": watch_deleted,
+            "watchRenamed": watch_renamed,
+            "includeSubdirectories": include_subdirectories,
+            "processInterval": process_interval,
+            "omitFolders": omit_folders or []
+        }
+        result = await self._request('POST', url, json=data)
+        if result.get('success'):
+            return result
+        raise APIClientException(f"Failed to start watcher: {result.get('error')}")
+
+    async def stop_collection_watcher(self, collection_id: int) -> bool:
+        """Stop watching a collection"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/watch"
+        result = await self._request('POST', url, json={"action": "stop"})
+        return result.get('success', False)
+
+    async def get_collection_settings(self, collection_id: int) -> Dict[str, Any]:
+        """Get collection settings including watch status"""
+        url = f"{self.filetracker_url}/api/collections/{collection_id}/settings"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result
+        raise APIClientException(f"Failed to get settings: {result.get('error')}")
+
+    async def get_filetracker_status(self) -> Dict[str, Any]:
+        """Get FileTracker system status"""
+        url = f"{self.filetracker_url}/status"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result.get('status', {})
+        raise APIClientException(f"Failed to get status: {result.get('error')}")
+
+    async def get_filetracker_statistics(self) -> Dict[str, Any]:
+        """Get FileTracker statistics (shorter 10s timeout, the query can be slow)"""
+        url = f"{self.filetracker_url}/api/statistics"
+        result = await self._request('GET', url, timeout=10)
+        if result.get('success'):
+            return result.get('statistics', {})
+        raise APIClientException(f"Failed to get statistics: {result.get('error')}")
+
+    async def get_processing_status(self) -> List[Dict[str, Any]]:
+        """Get status of all processing jobs"""
+        url = f"{self.filetracker_url}/api/processing/status"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result.get('jobs', [])
+        raise APIClientException(f"Failed to get processing status: {result.get('error')}")
+
+    async def check_filetracker_health(self, timeout: Optional[float] = None) -> bool:
+        """Check if FileTracker API is healthy"""
+        try:
+            result = await self._request('GET', f"{self.filetracker_url}/health", timeout=timeout)
+            return result.get('status') == 'OK'
+        except APIClientException:
+            return False
+
+    # ========== Vectors API Methods ==========
+
+    async def add_document(self, file_path: str, original_file_path: str = "",
+                           file_id: int = 0, chunk_size: int = 20,
+                           chunk_overlap: int = 2, max_workers: int = 5,
+                           content_type: str = "Text",
+                           collection_name: str = "default") -> Dict[str, Any]:
+        """Add a document to the vector database (see APIClient.add_document)"""
+        url = f"{self.vectors_url}/documents"
+        data = {
+            "filePath": file_path,
+            "originalFilePath": original_file_path or file_path,
+            "fileId": file_id,
+            "chunkSize": chunk_size,
+            "chunkOverlap": chunk_overlap,
+            "maxWorkers": max_workers,
+            "contentType": content_type,
+            "collectionName": collection_name
+        }
+        result = await self._request('POST', url, json=data)
+        if result.get('success'):
+            return result
+        raise APIClientException(f"Failed to add document: {result.get('error')}")
+
+    async def remove_document(self, file_path: str, file_id: int = 0,
+                              collection_name: str = "default") -> bool:
+        """Remove a document from the vector database"""
+        url = f"{self.vectors_url}/documents"
+        data = {
+            "filePath": file_path,
+            "fileId": file_id,
+            "collectionName": collection_name
+        }
+        result = await self._request('DELETE', url, json=data)
+        return result.get('success', False)
+
+    async def search_chunks(self, query: str, max_results: int = 10,
+                            threshold: float = 0.0,
+                            aggregate_by_document: bool = False,
+                            collection_name: str = "default",
+                            filter_dict: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Search for relevant chunks (see APIClient.search_chunks)"""
+        url = f"{self.vectors_url}/api/search/chunks"
+        data = {
+            "query": query,
+            "max_results": max_results,
+            "threshold": threshold,
+            "aggregateByDocument": aggregate_by_document,
+            "collectionName": collection_name,
+            "filter": filter_dict or {}
+        }
+        result = await self._request('POST', url, json=data)
+        if result.get('success'):
+            return result.get('results', [])
+        raise APIClientException(f"Search failed: {result.get('error')}")
+
+    async def search_documents(self, query: str, max_results: int = 10,
+                               threshold: float = 0.5,
+                               return_content: bool = False,
+                               collection_name: str = "default",
+                               filter_dict: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Search for relevant documents (see APIClient.search_documents)"""
+        url = f"{self.vectors_url}/api/search/documents"
+        data = {
+            "query": query,
+            "max_results": max_results,
+            "threshold": threshold,
+            "return_content": return_content,
+            "collectionName": collection_name,
+            "filter": filter_dict or {}
+        }
+        result = await self._request('POST', url, json=data)
+        if result.get('success'):
+            return result.get('results', [])
+        raise APIClientException(f"Search failed: {result.get('error')}")
+
+    async def get_vector_collections(self) -> List[str]:
+        """Get list of collections in vector database"""
+        url = f"{self.vectors_url}/api/collections"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result.get('collections', [])
+        return []
+
+    async def get_vectors_status(self) -> Dict[str, Any]:
+        """Get Vectors API status"""
+        return await self._request('GET', f"{self.vectors_url}/status")
+
+    async def get_vectors_statistics(self) -> Dict[str, Any]:
+        """Get Vectors API statistics"""
+        url = f"{self.vectors_url}/api/statistics"
+        result = await self._request('GET', url)
+        if result.get('success'):
+            return result.get('statistics', {})
+        raise APIClientException(f"Failed to get statistics: {result.get('error')}")
+
+    async def check_vectors_health(self, timeout: Optional[float] = None) -> bool:
+        """Check if Vectors API is healthy"""
+        try:
+            result = await self._request('GET', f"{self.vectors_url}/health", timeout=timeout)
+            return result.get('status') == 'OK'
+        except APIClientException:
+            return False
@@ -3,13 +3,20 @@ Collections Tab - Manage document collections
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QDialog, QFormLayout, QLineEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QDialog, QFormLayout, QLineEdit,
     QTextEdit, QDialogButtonBox, QMessageBox, QFileDialog, QLabel,
     QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QAction
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex
+from functools import partial
+from operator import itemgetter
+from PyQt6.QtGui import QAction
+
+from delegates import ActionButtonsDelegate, RowAction
+from styles import get_font
+from worker import APIWorker
+from throttle import Throttler
 
 
 class CollectionDialog(QDialog):
@@ -108,16 +115,200 @@ class CollectionDialog(QDialog):
         }
 
 
+# Collection fields shown in the table, in column order
+_COLUMN_FIELDS = ('id', 'name', 'source_folder', 'include_extensions', 'created_at')
+_get_column_fields = itemgetter(*_COLUMN_FIELDS)
+_COLUMN_DEFAULTS = dict.fromkeys(_COLUMN_FIELDS, '')
+
+
+def _display_row(collection):
+    """Build the display strings of one table row from a collection dictionary"""
+    collection_id, name, source_folder, extensions, created = _get_column_fields(
+        {**_COLUMN_DEFAULTS, **collection}
+    )
+    return (
+        str(collection_id),
+        name,
+        source_folder,
+        extensions,
+        "...",  # File counts are not fetched yet
+        created[:10] if created else '',  # Just the date of the ISO 8601 timestamp
+        None  # Actions, painted by the delegate
+    )
+
+
+class CollectionsModel(QAbstractTableModel):
+    """
+    Table model over the collection dictionaries returned by the API
+    
+    Display strings are built once per row when data arrives; data() is a
+    tuple lookup, and Qt only asks for visible rows.
+    """
+    
+    HEADERS = ["ID", "Name", "Source Folder", "Extensions", "Files", "Created", "Actions"]
+    ACTIONS_COLUMN = 6
+    _CENTERED_COLUMNS = (0, 4)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._display = []
+        self._id_to_row = {}
+    
+    def set_collections(self, collections):
+        """
+        Replace the rows with a new list of collection dictionaries
+        
+        Existing rows are updated in place and only the changed span is
+        signalled; rows are inserted or removed just for the size difference,
+        so a refresh with unchanged data costs the views nothing.
+        
+        Args:
+            collections: Collection dictionaries from the API
+            
+        Returns:
+            True if any row was added, removed or changed
+        """
+        old_count = len(self._rows)
+        new_count = len(collections)
+        
+        changed = [
+            row for row in range(min(old_count, new_count))
+            if self._rows[row] != collections[row]
+        ]
+        display = [_display_row(collection) for collection in collections]
+        
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows = self._rows[:new_count]
+            self._display = self._display[:new_count]
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows = self._rows + collections[old_count:]
+            self._display = self._display + display[old_count:]
+            self.endInsertRows()
+        
+        # Own copy: insert/remove_collection edit the list in place, and the
+        # one passed in may be shared (e.g. the API client's cached response)
+        self._rows = list(collections)
+        self._display = display
+        self._id_to_row = {collection.get('id'): row for row, collection in enumerate(collections)}
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1)
+            )
+        
+        return bool(changed) or new_count != old_count
+    
+    def insert_collection(self, collection):
+        """Append one collection row"""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(collection)
+        self._display.append(_display_row(collection))
+        self._id_to_row[collection.get('id')] = row
+        self.endInsertRows()
+    
+    def update_collection(self, collection):
+        """
+        Replace the row of an already loaded collection
+        
+        Returns:
+            False if the collection isn't loaded
+        """
+        row = self._id_to_row.get(collection.get('id'))
+        if row is None:
+            return False
+        self._rows[row] = collection
+        self._display[row] = _display_row(collection)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+    
+    def remove_collection(self, collection_id):
+        """
+        Remove the row of a collection
+        
+        Returns:
+            False if the collection isn't loaded
+        """
+        row = self._id_to_row.get(collection_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._display[row]
+        self._id_to_row = {collection.get('id'): r for r, collection in enumerate(self._rows)}
+        self.endRemoveRows()
+        return True
+    
+    def collection_at(self, row):
+        """Get the collection dictionary shown in a row"""
+        return self._rows[row]
+    
+    def row_of(self, collection_id):
+        """Get the row showing a collection ID, or None if it isn't loaded"""
+        return self._id_to_row.get(collection_id)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()][column]
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in self._CENTERED_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        
+        return None
+
+
 class CollectionsTab(QWidget):
     """Collections management tab"""
     
     collection_selected = pyqtSignal(int)  # Emits collection ID
+    collections_changed = pyqtSignal()  # A collection was created, updated or deleted
+    
+    ROW_ACTIONS = (
+        RowAction('view', "📄", "View Files"),
+        RowAction('edit', "✏️", "Edit"),
+        RowAction('delete', "🗑️", "Delete", "#f44336"),
+    )
+    
+    # Columns sized to their contents (ID, Extensions, Files, Created) and
+    # their widths until the first load is measured
+    CONTENT_COLUMNS = {0: 60, 3: 100, 4: 60, 5: 100}
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
         self.current_collections = []
-        self.init_ui()
+        self._columns_measured = False
+        # Coalesce repeated clicks and chained CRUD refreshes into one load
+        self._refresh_throttle = Throttler(self._load_collections, 300, parent=self)
+        # The UI is built and loaded on first show (see showEvent)
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        """Build the UI and load collections the first time the tab is shown"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+            self.refresh()
+        super().showEvent(event)
     
     def init_ui(self):
         """Initialize the UI"""
@@ -128,10 +319,7 @@ class CollectionsTab(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("Collections Management")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(get_font(16, bold=True))
         header_layout.addWidget(title)
         
         header_layout.addStretch()
@@ -148,43 +336,56 @@ class CollectionsTab(QWidget):
         layout.addLayout(header_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Name", "Source Folder", "Extensions", "Files", "Created", "Actions"
-        ])
-        
-        # Set column widths
+        self.model = CollectionsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        
+        self.actions_delegate = ActionButtonsDelegate(self.ROW_ACTIONS, self.table)
+        self.actions_delegate.action_triggered.connect(self.on_row_action)
+        self.table.setItemDelegateForColumn(CollectionsModel.ACTIONS_COLUMN, self.actions_delegate)
+        
+        # Set column widths. Content-sized columns start at fixed defaults and
+        # are measured once after the first load (see _measure_content_columns)
+        # rather than with ResizeToContents, which re-reads row size hints on
+        # every model change. They stay user-resizable afterwards.
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in self.CONTENT_COLUMNS.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(column, width)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(CollectionsModel.ACTIONS_COLUMN, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(
+            CollectionsModel.ACTIONS_COLUMN,
+            ActionButtonsDelegate.width_for(len(self.ROW_ACTIONS))
+        )
+        
+        # Uniform row heights: rows are never measured individually
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
-        self.table.cellDoubleClicked.connect(self.on_row_double_clicked)
+        self.table.doubleClicked.connect(self.on_row_double_clicked)
         
         layout.addWidget(self.table)
-        
-        # Load data
-        self.refresh()
     
     def refresh(self):
-        """Refresh collections list"""
+        """Refresh collections list (throttled)"""
+        if not self._ui_built:
+            return  # Loaded on first show
+        self._refresh_throttle()
+    
+    def _load_collections(self):
+        """Load the collections list in the background"""
         if not self.main_window or not self.main_window.api_client:
             return
         
-        from worker import APIWorker
         worker = APIWorker(
             "Loading collections",
             self.main_window.api_client.get_collections
         )
-        worker.started.connect(lambda name: self.main_window.status_updated.emit(name))
+        worker.started.connect(self.main_window.status_updated)
         worker.finished.connect(self._on_collections_loaded)
         worker.error.connect(self._on_load_error)
         self.main_window.worker_manager.start_worker("collections_refresh", worker)
@@ -192,88 +393,30 @@ class CollectionsTab(QWidget):
     def _on_collections_loaded(self, collections):
         """Handle collections loaded"""
         self.current_collections = collections
-        self.populate_table(collections)
+        
+        # Update the model (and measure columns on the first load) behind a single repaint
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_collections(collections)
+            self._measure_content_columns()
+        finally:
+            self.table.setUpdatesEnabled(True)
+        
         self.main_window.status_updated.emit(f"Loaded {len(collections)} collections")
     
+    def _measure_content_columns(self):
+        """Fit the content-sized columns to the first rows loaded, once"""
+        if self._columns_measured or not self.model.rowCount():
+            return
+        self._columns_measured = True
+        for column in self.CONTENT_COLUMNS:
+            self.table.resizeColumnToContents(column)
+    
     def _on_load_error(self, error_msg):
         """Handle load error"""
         QMessageBox.critical(self, "Error", f"Failed to load collections:\n{error_msg}")
         self.main_window.status_updated.emit("Failed to load collections")
     
-    def populate_table(self, collections):
-        """Populate the table with collections"""
-        # Disable updates during batch operations to prevent UI lag
-        self.table.setUpdatesEnabled(False)
-        try:
-            self.table.setRowCount(0)
-            self.table.setRowCount(len(collections))  # Pre-allocate all rows
-            
-            for row, collection in enumerate(collections):
-                # ID
-                id_item = QTableWidgetItem(str(collection.get('id', '')))
-                id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 0, id_item)
-                
-                # Name
-                self.table.setItem(row, 1, QTableWidgetItem(collection.get('name', '')))
-                
-                # Source Folder
-                self.table.setItem(row, 2, QTableWidgetItem(collection.get('source_folder', '')))
-                
-                # Extensions
-                self.table.setItem(row, 3, QTableWidgetItem(collection.get('include_extensions', '')))
-                
-                # Files count (will need to fetch)
-                files_item = QTableWidgetItem("...")
-                files_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 4, files_item)
-                
-                # Created
-                created = collection.get('created_at', '')
-                if created:
-                    created = created.split('T')[0]  # Just the date
-                self.table.setItem(row, 5, QTableWidgetItem(created))
-                
-                # Actions
-                actions_widget = self.create_actions_widget(collection.get('id'))
-                self.table.setCellWidget(row, 6, actions_widget)
-        finally:
-            # Re-enable updates and trigger a single repaint
-            self.table.setUpdatesEnabled(True)
-        
-        # Fetch file counts asynchronously (simplified - just show button for now)
-    
-    def create_actions_widget(self, collection_id):
-        """Create actions widget for a collection row"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(2)
-        
-        # View files button
-        view_btn = QPushButton("📄")
-        view_btn.setToolTip("View Files")
-        view_btn.setMaximumWidth(30)
-        view_btn.clicked.connect(lambda: self.view_files(collection_id))
-        layout.addWidget(view_btn)
-        
-        # Edit button
-        edit_btn = QPushButton("✏️")
-        edit_btn.setToolTip("Edit")
-        edit_btn.setMaximumWidth(30)
-        edit_btn.clicked.connect(lambda: self.edit_collection(collection_id))
-        layout.addWidget(edit_btn)
-        
-        # Delete button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Delete")
-        delete_btn.setMaximumWidth(30)
-        delete_btn.setStyleSheet("QPushButton { background-color: #f44336; }")
-        delete_btn.clicked.connect(lambda: self.delete_collection(collection_id))
-        layout.addWidget(delete_btn)
-        
-        return widget
-    
     def create_collection(self):
         """Create a new collection"""
         dialog = CollectionDialog(self)
@@ -284,7 +427,6 @@ class CollectionsTab(QWidget):
                 QMessageBox.warning(self, "Validation Error", "Name and Source Folder are required")
                 return
             
-            from worker import APIWorker
             worker = APIWorker(
                 "Creating collection",
                 self.main_window.api_client.create_collection,
@@ -294,15 +436,21 @@ class CollectionsTab(QWidget):
                 include_extensions=data['includeExtensions'],
                 exclude_folders=data['excludeFolders']
             )
-            worker.started.connect(lambda name: self.main_window.status_updated.emit(name))
-            worker.finished.connect(lambda result: self._on_create_success())
-            worker.error.connect(lambda error: self._on_create_error(error))
+            worker.started.connect(self.main_window.status_updated)
+            worker.finished.connect(self._on_create_success)
+            worker.error.connect(self._on_create_error)
             self.main_window.worker_manager.start_worker("create_collection", worker)
     
-    def _on_create_success(self):
+    def _on_create_success(self, result=None):
         """Handle successful collection creation"""
         QMessageBox.information(self, "Success", "Collection created successfully")
-        self.refresh()
+        self.collections_changed.emit()
+        # The response carries the new record; add it without reloading the list
+        if isinstance(result, dict) and 'id' in result:
+            self.model.insert_collection(result)
+            self._measure_content_columns()
+        else:
+            self.refresh()
     
     def _on_create_error(self, error_msg):
         """Handle collection creation error"""
@@ -311,16 +459,19 @@ class CollectionsTab(QWidget):
     def edit_collection(self, collection_id):
         """Edit an existing collection"""
         # First, get the collection data
-        from worker import APIWorker
         worker = APIWorker(
             "Loading collection",
             self.main_window.api_client.get_collection,
             collection_id
         )
-        worker.finished.connect(lambda collection: self._show_edit_dialog(collection_id, collection))
-        worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to load collection:\n{error}"))
+        worker.finished.connect(partial(self._show_edit_dialog, collection_id))
+        worker.error.connect(self._on_load_collection_error)
         self.main_window.worker_manager.start_worker("load_collection", worker)
     
+    def _on_load_collection_error(self, error_msg):
+        """Handle collection load error"""
+        QMessageBox.critical(self, "Error", f"Failed to load collection:\n{error_msg}")
+    
     def _show_edit_dialog(self, collection_id, collection):
         """Show edit dialog with loaded collection data"""
         dialog = CollectionDialog(self, collection)
@@ -328,7 +479,6 @@ class CollectionsTab(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             
-            from worker import APIWorker
             worker = APIWorker(
                 "Updating collection",
                 self.main_window.api_client.update_collection,
@@ -339,15 +489,18 @@ class CollectionsTab(QWidget):
                 includeExtensions=data['includeExtensions'],
                 excludeFolders=data['excludeFolders']
             )
-            worker.started.connect(lambda name: self.main_window.status_updated.emit(name))
-            worker.finished.connect(lambda result: self._on_update_success())
-            worker.error.connect(lambda error: self._on_update_error(error))
+            worker.started.connect(self.main_window.status_updated)
+            worker.finished.connect(self._on_update_success)
+            worker.error.connect(self._on_update_error)
             self.main_window.worker_manager.start_worker("update_collection", worker)
     
-    def _on_update_success(self):
+    def _on_update_success(self, result=None):
         """Handle successful collection update"""
         QMessageBox.information(self, "Success", "Collection updated successfully")
-        self.refresh()
+        self.collections_changed.emit()
+        # The response carries the updated record; replace just its row
+        if not (isinstance(result, dict) and self.model.update_collection(result)):
+            self.refresh()
     
     def _on_update_error(self, error_msg):
         """Handle collection update error"""
@@ -365,21 +518,22 @@ class CollectionsTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            from worker import APIWorker
             worker = APIWorker(
                 "Deleting collection",
                 self.main_window.api_client.delete_collection,
                 collection_id
             )
-            worker.started.connect(lambda name: self.main_window.status_updated.emit(name))
-            worker.finished.connect(lambda result: self._on_delete_success())
-            worker.error.connect(lambda error: self._on_delete_error(error))
+            worker.started.connect(self.main_window.status_updated)
+            worker.finished.connect(partial(self._on_delete_success, collection_id))
+            worker.error.connect(self._on_delete_error)
             self.main_window.worker_manager.start_worker("delete_collection", worker)
     
-    def _on_delete_success(self):
+    def _on_delete_success(self, collection_id, result=None):
         """Handle successful collection deletion"""
         QMessageBox.information(self, "Success", "Collection deleted successfully")
-        self.refresh()
+        self.collections_changed.emit()
+        if not self.model.remove_collection(collection_id):
+            self.refresh()
     
     def _on_delete_error(self, error_msg):
         """Handle collection deletion error"""
@@ -392,9 +546,19 @@ class CollectionsTab(QWidget):
         self.main_window.tabs.setCurrentIndex(2)  # Files tab
         self.main_window.files_tab.set_collection_filter(collection_id)
     
-    def on_row_double_clicked(self, row, column):
+    def on_row_action(self, action, row):
+        """Handle a click on one of the Actions column buttons"""
+        collection_id = self.model.collection_at(row).get('id')
+        if action == 'view':
+            self.view_files(collection_id)
+        elif action == 'edit':
+            self.edit_collection(collection_id)
+        elif action == 'delete':
+            self.delete_collection(collection_id)
+    
+    def on_row_double_clicked(self, index):
         """Handle row double-click"""
-        collection_id = int(self.table.item(row, 0).text())
+        collection_id = self.model.collection_at(index.row()).get('id')
         self.view_files(collection_id)
     
     def show_context_menu(self, position):
@@ -403,22 +567,22 @@ class CollectionsTab(QWidget):
         if row < 0:
             return
         
-        collection_id = int(self.table.item(row, 0).text())
+        collection_id = self.model.collection_at(row).get('id')
         
         menu = QMenu(self)
         
         view_action = QAction("📄 View Files", self)
-        view_action.triggered.connect(lambda: self.view_files(collection_id))
+        view_action.triggered.connect(partial(self.view_files, collection_id))
         menu.addAction(view_action)
         
         edit_action = QAction("✏️ Edit", self)
-        edit_action.triggered.connect(lambda: self.edit_collection(collection_id))
+        edit_action.triggered.connect(partial(self.edit_collection, collection_id))
         menu.addAction(edit_action)
         
         menu.addSeparator()
         
         delete_action = QAction("🗑️ Delete", self)
-        delete_action.triggered.connect(lambda: self.delete_collection(collection_id))
+        delete_action.triggered.connect(partial(self.delete_collection, collection_id))
         menu.addAction(delete_action)
         
         menu.exec(self.table.viewport().mapToGlobal(position))
@@ -4,12 +4,41 @@ Dashboard Tab - System overview and statistics
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QFrame, QPushButton, QGroupBox, QScrollArea, QTextEdit
+    QLabel, QFrame, QPushButton, QGroupBox, QScrollArea
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont
-import time
 
+from styles import get_font
+from throttle import Throttler
+from worker import APIWorker
+
+
+# Vectors system information block, filled from the /status response
+_VECTORS_INFO_TEMPLATE = "\n".join((
+    "Vectors API Status:",
+    "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+    "Status: {status}",
+    "ChromaDB Path: {chromaDbPath}",
+    "Ollama URL: {ollamaUrl}",
+    "Embedding Model: {embeddingModel}",
+    "Default Collection: {defaultCollectionName}",
+    "Chunk Size: {defaultChunkSize}",
+    "Chunk Overlap: {defaultChunkOverlap}",
+    "Max Workers: {defaultMaxWorkers}",
+    "",
+))
+
+# Shown for any field the status response leaves out
+_VECTORS_INFO_DEFAULTS = {
+    'status': 'Unknown',
+    'chromaDbPath': 'N/A',
+    'ollamaUrl': 'N/A',
+    'embeddingModel': 'N/A',
+    'defaultCollectionName': 'default',
+    'defaultChunkSize': 20,
+    'defaultChunkOverlap': 2,
+    'defaultMaxWorkers': 5,
+}
 
 class StatCard(QFrame):
     """Card widget for displaying statistics"""
@@ -17,30 +46,18 @@ class StatCard(QFrame):
     def __init__(self, title: str, value: str = "0", icon: str = "📊", parent=None):
         super().__init__(parent)
         self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        self.setObjectName("StatCard")  # Styled by style.qss
         
         layout = QVBoxLayout(self)
         
         # Icon and title
         header_layout = QHBoxLayout()
         icon_label = QLabel(icon)
-        icon_font = QFont()
-        icon_font.setPointSize(24)
-        icon_label.setFont(icon_font)
+        icon_label.setFont(get_font(24))
         header_layout.addWidget(icon_label)
         
         title_label = QLabel(title)
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(11)
-        title_label.setFont(title_font)
+        title_label.setFont(get_font(11, bold=True))
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         
@@ -48,18 +65,17 @@ class StatCard(QFrame):
         
         # Value
         self.value_label = QLabel(value)
-        value_font = QFont()
-        value_font.setPointSize(28)
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
-        self.value_label.setStyleSheet("color: #2196F3;")
+        self.value_label.setFont(get_font(28, bold=True))
+        self.value_label.setObjectName("StatCardValue")
         layout.addWidget(self.value_label)
         
         layout.addStretch()
     
     def set_value(self, value: str):
-        """Update the displayed value"""
-        self.value_label.setText(str(value))
+        """Update the displayed value (no-op when unchanged, to avoid a relayout)"""
+        text = str(value)
+        if text != self.value_label.text():
+            self.value_label.setText(text)
 
 
 class DashboardTab(QWidget):
@@ -69,11 +85,17 @@ class DashboardTab(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("Dashboard")  # Scopes the dashboard rules in style.qss
         self.main_window = parent
-        self.last_refresh_time = 0  # Track last refresh
-        self.cache_duration = 30  # Cache for 30 seconds
-        self.is_loading = False  # Prevent concurrent loads
-        self.init_ui()
+        self.cache_duration = 30  # Auto-refresh interval in seconds while the tab is visible
+        # Coalesce repeated refresh clicks into one load
+        self._refresh_throttle = Throttler(self._load_dashboard, 500, parent=self)
+        # Runs only while the tab is shown, so a hidden dashboard costs nothing
+        self._auto_refresh_timer = QTimer(self)
+        self._auto_refresh_timer.setInterval(self.cache_duration * 1000)
+        self._auto_refresh_timer.timeout.connect(self.refresh)
+        # The UI is built on first show (see showEvent)
+        self._ui_built = False
     
     def init_ui(self):
         """Initialize the UI"""
@@ -83,10 +105,7 @@ class DashboardTab(QWidget):
         
         # Title
         title = QLabel("System Dashboard")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(get_font(16, bold=True))
         layout.addWidget(title)
         
         # Statistics cards
@@ -111,20 +130,6 @@ class DashboardTab(QWidget):
         
         # API Status Section
         api_group = QGroupBox("API Status")
-        api_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
         api_layout = QVBoxLayout(api_group)
         
         self.filetracker_info = QLabel("FileTracker API: Checking...")
@@ -137,18 +142,15 @@ class DashboardTab(QWidget):
         
         # System Info Section
         system_group = QGroupBox("System Information")
-        system_group.setStyleSheet(api_group.styleSheet())
         system_layout = QVBoxLayout(system_group)
         
-        self.system_info_text = QTextEdit()
-        self.system_info_text.setReadOnly(True)
-        self.system_info_text.setMaximumHeight(150)
-        self.system_info_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f9f9f9;
-                font-family: 'Consolas', 'Courier New', monospace;
-            }
-        """)
+        # A plain-text label: no QTextDocument to re-layout on every refresh
+        self.system_info_text = QLabel()
+        self.system_info_text.setObjectName("SystemInfo")
+        self.system_info_text.setTextFormat(Qt.TextFormat.PlainText)
+        self.system_info_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.system_info_text.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self._last_info_text = None
         system_layout.addWidget(self.system_info_text)
         
         layout.addWidget(system_group)
@@ -169,63 +171,87 @@ class DashboardTab(QWidget):
         
         layout.addLayout(actions_layout)
         layout.addStretch()
-        
-        # Initial load
-        self.refresh()
     
     def force_refresh(self):
-        """Force refresh bypassing cache"""
-        self.last_refresh_time = 0  # Reset cache
-        self.refresh()
+        """Force refresh bypassing the throttle and the client's response cache"""
+        if not self._ui_built:
+            return  # Loaded on first show
+        self._refresh_throttle.cancel()
+        api_client = self.main_window.api_client if self.main_window else None
+        if api_client:
+            api_client.invalidate(api_client.filetracker_url)
+            api_client.invalidate(api_client.vectors_url)
+        self._load_dashboard()
     
     def refresh(self):
-        """Refresh dashboard data with caching"""
+        """Refresh dashboard data (throttled)"""
+        if not self._ui_built:
+            return  # Loaded on first show
+        self._refresh_throttle()
+    
+    def showEvent(self, event):
+        """Build the UI on first show, then refresh and auto-refresh while shown"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+        super().showEvent(event)
+        self.refresh()
+        self._auto_refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop auto-refreshing while hidden"""
+        super().hideEvent(event)
+        self._auto_refresh_timer.stop()
+    
+    def _load_dashboard(self):
+        """Load all dashboard data in the background"""
         if not self.main_window or not self.main_window.api_client:
             return
         
-        # Check if we're already loading
-        if self.is_loading:
-            self.main_window.status_updated.emit("Dashboard refresh already in progress...")
-            return
-        
-        # Check cache - don't refresh if data is fresh (< 30 seconds old)
-        current_time = time.time()
-        if current_time - self.last_refresh_time < self.cache_duration:
-            time_since_refresh = int(current_time - self.last_refresh_time)
-            self.main_window.status_updated.emit(f"Using cached data ({time_since_refresh}s ago)")
-            return
-        
-        self.is_loading = True
-        api = self.main_window.api_client
-        
-        # Get FileTracker statistics in background
-        from worker import APIWorker
-        
-        ft_stats_worker = APIWorker(
-            "Loading FileTracker statistics",
-            api.get_filetracker_statistics
-        )
-        ft_stats_worker.finished.connect(self._on_ft_stats_loaded)
-        ft_stats_worker.error.connect(self._on_ft_stats_error)
-        self.main_window.worker_manager.start_worker("ft_stats", ft_stats_worker)
-        
-        # Get processing jobs status in background
-        jobs_worker = APIWorker(
-            "Loading processing jobs",
-            api.get_processing_status
+        # One worker fetches all four payloads concurrently
+        worker = APIWorker(
+            "Loading dashboard",
+            self.main_window.api_client.get_dashboard_bundle
         )
-        jobs_worker.finished.connect(self._on_jobs_loaded)
-        jobs_worker.error.connect(lambda e: None)  # Silent fail
-        self.main_window.worker_manager.start_worker("jobs_status", jobs_worker)
-        
-        # Get Vectors status in background
-        v_status_worker = APIWorker(
-            "Loading Vectors status",
-            api.get_vectors_status
-        )
-        v_status_worker.finished.connect(lambda status: self._on_vectors_status_loaded(status, api))
-        v_status_worker.error.connect(self._on_vectors_error)
-        self.main_window.worker_manager.start_worker("v_status", v_status_worker)
+        worker.finished.connect(self._on_dashboard_loaded)
+        worker.error.connect(self._on_ft_stats_error)
+        self.main_window.worker_manager.start_worker("dashboard_bundle", worker)
+    
+    def _on_dashboard_loaded(self, bundle):
+        """Dispatch a dashboard bundle to the section handlers"""
+        # Apply every section's changes behind a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            ft_stats = bundle['filetracker_statistics']
+            if isinstance(ft_stats, Exception):
+                self._on_ft_stats_error(str(ft_stats))
+            else:
+                self._on_ft_stats_loaded(ft_stats)
+            
+            jobs = bundle['processing_status']
+            if not isinstance(jobs, Exception):  # Silent fail
+                self._on_jobs_loaded(jobs)
+            
+            v_status = bundle['vectors_status']
+            if isinstance(v_status, Exception):
+                self._on_vectors_error(str(v_status))
+            else:
+                v_stats = bundle['vectors_statistics']
+                self._display_vectors_info(v_status, {} if isinstance(v_stats, Exception) else v_stats)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _set_api_info(label, text, color):
+        """Update an API status line, touching only what changed"""
+        if label.text() != text:
+            label.setText(text)
+        if label.property("statusColor") != color:
+            # Matched by QLabel[statusColor=...] in style.qss; a re-polish
+            # applies it without parsing a new stylesheet
+            label.setProperty("statusColor", color)
+            label.style().unpolish(label)
+            label.style().polish(label)
     
     def _on_ft_stats_loaded(self, ft_stats):
         """Handle FileTracker statistics loaded"""
@@ -234,23 +260,17 @@ class DashboardTab(QWidget):
         self.dirty_card.set_value(ft_stats.get('dirty_files', 0))
         self.processed_card.set_value(ft_stats.get('processed_files', 0))
         
-        self.filetracker_info.setText(
-            f"✅ FileTracker API: Online | Database: {ft_stats.get('database_path', 'N/A')}"
+        self._set_api_info(
+            self.filetracker_info,
+            f"✅ FileTracker API: Online | Database: {ft_stats.get('database_path', 'N/A')}",
+            "green"
         )
-        self.filetracker_info.setStyleSheet("color: green;")
         
-        # Update cache timestamp and mark loading complete
-        self.last_refresh_time = time.time()
-        self.is_loading = False
         self.main_window.status_updated.emit("Dashboard refreshed")
     
     def _on_ft_stats_error(self, error_msg):
         """Handle FileTracker statistics error"""
-        self.filetracker_info.setText(f"❌ FileTracker API: Offline - {error_msg}")
-        self.filetracker_info.setStyleSheet("color: red;")
-        
-        # Mark loading complete even on error
-        self.is_loading = False
+        self._set_api_info(self.filetracker_info, f"❌ FileTracker API: Offline - {error_msg}", "red")
         self.main_window.status_updated.emit("Failed to load statistics")
     
     def _on_jobs_loaded(self, jobs):
@@ -262,37 +282,17 @@ class DashboardTab(QWidget):
         watchers = [j for j in jobs if j.get('name', '').startswith('Watch_Collection_')]
         self.watchers_card.set_value(len(watchers))
     
-    def _on_vectors_status_loaded(self, v_status, api):
-        """Handle Vectors status loaded"""
-        # Get Vectors statistics too
-        from worker import APIWorker
-        v_stats_worker = APIWorker(
-            "Loading Vectors statistics",
-            api.get_vectors_statistics
-        )
-        v_stats_worker.finished.connect(lambda v_stats: self._display_vectors_info(v_status, v_stats))
-        v_stats_worker.error.connect(lambda e: self._display_vectors_info(v_status, {}))
-        self.main_window.worker_manager.start_worker("v_stats", v_stats_worker)
-    
     def _display_vectors_info(self, v_status, v_stats):
         """Display Vectors information"""
-        info_text = f"""Vectors API Status:
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Status: {v_status.get('status', 'Unknown')}
-ChromaDB Path: {v_status.get('chromaDbPath', 'N/A')}
-Ollama URL: {v_status.get('ollamaUrl', 'N/A')}
-Embedding Model: {v_status.get('embeddingModel', 'N/A')}
-Default Collection: {v_status.get('defaultCollectionName', 'default')}
-Chunk Size: {v_status.get('defaultChunkSize', 20)}
-Chunk Overlap: {v_status.get('defaultChunkOverlap', 2)}
-Max Workers: {v_status.get('defaultMaxWorkers', 5)}
-"""
+        info_text = _VECTORS_INFO_TEMPLATE.format_map({**_VECTORS_INFO_DEFAULTS, **v_status})
+        
+        self._set_api_info(self.vectors_info, "✅ Vectors API: Online", "green")
         
-        self.vectors_info.setText("✅ Vectors API: Online")
-        self.vectors_info.setStyleSheet("color: green;")
-        self.system_info_text.setPlainText(info_text)
+        # The settings rarely change; skip the relayout when they haven't
+        if info_text != self._last_info_text:
+            self._last_info_text = info_text
+            self.system_info_text.setText(info_text)
     
     def _on_vectors_error(self, error_msg):
         """Handle Vectors status error"""
-        self.vectors_info.setText(f"❌ Vectors API: Offline - {error_msg}")
-        self.vectors_info.setStyleSheet("color: red;")
+        self._set_api_info(self.vectors_info, f"❌ Vectors API: Offline - {error_msg}", "red")
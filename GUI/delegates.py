@@ -0,0 +1,138 @@
+"""
+Item delegates shared by the table views
+Paints row action buttons directly instead of creating a widget per row
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QToolTip, QApplication
+from PyQt6.QtCore import Qt, QEvent, QRect, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont
+
+
+@dataclass(frozen=True)
+class RowAction:
+    """A button painted in an actions cell"""
+    key: str
+    glyph: str
+    tooltip: str
+    color: str = "#2196F3"
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Paints a row of small action buttons and reports clicks on them
+    
+    Nothing is instantiated per row: each distinct button face is rendered
+    to a QPixmap once and blitted for every visible cell, and clicks are
+    hit-tested in editorEvent().
+    
+    Signals:
+        action_triggered: Emitted with the action key and the row clicked
+    """
+    
+    action_triggered = pyqtSignal(str, int)  # action key, row
+    
+    BUTTON_WIDTH = 30
+    BUTTON_HEIGHT = 24
+    SPACING = 2
+    MARGIN = 2
+    
+    # Button faces shared by every delegate instance: (glyph, color, height, dpr) -> QPixmap
+    _pixmaps: Dict[Tuple[str, str, int, float], QPixmap] = {}
+    
+    def __init__(self, actions: Union[Sequence[RowAction], Callable[[QModelIndex], Sequence[RowAction]]],
+                 parent=None):
+        """
+        Initialize the delegate
+        
+        Args:
+            actions: The buttons to show, or a callable returning them for a given index
+            parent: Parent object (usually the view)
+        """
+        super().__init__(parent)
+        self._actions = actions
+    
+    def actions_for(self, index: QModelIndex) -> Sequence[RowAction]:
+        """Get the buttons shown for an index"""
+        return self._actions(index) if callable(self._actions) else self._actions
+    
+    def _button_rects(self, rect: QRect, count: int) -> List[QRect]:
+        """Lay out count buttons left to right, vertically centered in rect"""
+        height = min(self.BUTTON_HEIGHT, rect.height() - 2 * self.MARGIN)
+        top = rect.top() + (rect.height() - height) // 2
+        left = rect.left() + self.MARGIN
+        step = self.BUTTON_WIDTH + self.SPACING
+        return [QRect(left + i * step, top, self.BUTTON_WIDTH, height) for i in range(count)]
+    
+    @classmethod
+    def _button_pixmap(cls, action: RowAction, height: int, dpr: float) -> QPixmap:
+        """Render (once) the face of a button"""
+        key = (action.glyph, action.color, height, dpr)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(int(cls.BUTTON_WIDTH * dpr), int(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(action.color))
+            painter.drawRoundedRect(QRect(0, 0, cls.BUTTON_WIDTH, height), 4, 4)
+            painter.setPen(QColor("white"))
+            font = QFont(QApplication.font())
+            font.setBold(True)
+            painter.setFont(font)
+            painter.drawText(QRect(0, 0, cls.BUTTON_WIDTH, height), Qt.AlignmentFlag.AlignCenter, action.glyph)
+            painter.end()
+            
+            cls._pixmaps[key] = pixmap
+        return pixmap
+    
+    def paint(self, painter, option, index):
+        # Cell background and selection highlight only, no text
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        actions = self.actions_for(index)
+        dpr = painter.device().devicePixelRatioF()
+        for action, rect in zip(actions, self._button_rects(option.rect, len(actions))):
+            painter.drawPixmap(rect.topLeft(), self._button_pixmap(action, rect.height(), dpr))
+    
+    @classmethod
+    def width_for(cls, count: int) -> int:
+        """Get the cell width needed to show count buttons"""
+        return 2 * cls.MARGIN + count * cls.BUTTON_WIDTH + max(count - 1, 0) * cls.SPACING
+    
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        size.setWidth(self.width_for(len(self.actions_for(index))))
+        size.setHeight(max(size.height(), self.BUTTON_HEIGHT + 2 * self.MARGIN))
+        return size
+    
+    def _action_at(self, pos, option, index):
+        """Get the action whose button contains pos, if any"""
+        actions = self.actions_for(index)
+        for action, rect in zip(actions, self._button_rects(option.rect, len(actions))):
+            if rect.contains(pos):
+                return action
+        return None
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            action = self._action_at(event.position().toPoint(), option, index)
+            if action is not None:
+                self.action_triggered.emit(action.key, index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.Type.ToolTip:
+            action = self._action_at(event.pos(), option, index)
+            if action is not None:
+                QToolTip.showText(event.globalPos(), action.tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
@@ -2,24 +2,362 @@
 Files Tab - View and manage files in collections
 """
 
+import sys
+from dataclasses import dataclass
+from functools import partial
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QComboBox, QLabel, QMessageBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QComboBox, QLabel, QMessageBox,
     QCheckBox, QLineEdit, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
 from PyQt6.QtGui import QFont, QAction, QColor
 
+from delegates import ActionButtonsDelegate, RowAction
+from worker import APIWorker
+
+
+# Status cell text and background, shared by every row
+_STATUS_CELLS = {
+    'deleted': ("🗑️ Deleted", QColor(255, 200, 200)),
+    'dirty': ("⚠️ Unprocessed", QColor(255, 255, 200)),
+    'processed': ("✅ Processed", QColor(200, 255, 200)),
+}
+
+# slots=True is only accepted by dataclass() on Python 3.10+
+_ROW_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_ROW_OPTIONS)
+class FileRow:
+    """
+    A file as shown in the files table
+    
+    Built once per load from the API dictionary, with the keys filtering and
+    display read computed up front. Mutable, so status changes are applied
+    in place.
+    """
+    id: int
+    collection_id: int
+    collection_name: str
+    file_path: str
+    file_hash: str
+    dirty: bool
+    deleted: bool
+    path_lower: str
+    date: str
+    status: str
+    
+    @classmethod
+    def from_dict(cls, data, collection_id=None):
+        """
+        Build from an API file dictionary
+        
+        Args:
+            data: File dictionary
+            collection_id: Collection ID, if the dictionary doesn't carry one
+        
+        The FileTracker API sends camelCase keys (filePath, dirty, ...);
+        the database's PascalCase column names are accepted as well.
+        """
+        file_path = data.get('filePath') or data.get('FilePath') or ''
+        dirty = bool(data.get('dirty', data.get('Dirty', False)))
+        deleted = bool(data.get('deleted', data.get('Deleted', False)))
+        return cls(
+            id=data.get('id', 0),
+            collection_id=data.get('collection_id', collection_id),
+            collection_name=data.get('collection_name') or '',
+            file_path=file_path,
+            file_hash=data.get('fileHash') or data.get('FileHash') or '',
+            dirty=dirty,
+            deleted=deleted,
+            path_lower=file_path.lower(),
+            # Just the date of the ISO 8601 timestamp, rather than split on every paint
+            date=(data.get('lastModified') or data.get('LastModified') or '').split('T', 1)[0],
+            status=_status_key(dirty, deleted)
+        )
+    
+    def set_dirty(self, dirty):
+        """Change the dirty flag and the status that follows from it"""
+        self.dirty = dirty
+        self.status = _status_key(dirty, self.deleted)
+
+
+def _status_key(dirty, deleted):
+    """Get the status filter key ('deleted', 'dirty' or 'processed') of a file"""
+    if deleted:
+        return 'deleted'
+    if dirty:
+        return 'dirty'
+    return 'processed'
+
+
+def _run_batches(batch_call, files_by_collection, *args):
+    """
+    Run a batch file call for each collection and combine the results
+    
+    Args:
+        batch_call: APIClient batch method taking (collection_id, file_ids, *args)
+        files_by_collection: Dictionary mapping collection ID to file IDs
+        *args: Extra arguments for batch_call
+    
+    Returns:
+        Dictionary with the total 'count' and every 'failed' file ID
+    """
+    count = 0
+    failed = []
+    for collection_id, file_ids in files_by_collection.items():
+        result = batch_call(collection_id, file_ids, *args)
+        count += result.get('count', 0)
+        failed.extend(result.get('failed', []))
+    return {'count': count, 'failed': failed}
+
+
+class FilesModel(QAbstractTableModel):
+    """
+    Table model over the FileRow objects of the loaded files
+    
+    Cells are produced on demand in data(), so Qt only formats the rows
+    that are actually painted. Rows are exposed FETCH_BATCH at a time
+    through canFetchMore()/fetchMore(), which keeps a reset cheap however
+    many files are loaded. Once every row is shown, fetchMore()
+    emits more_requested if the server has more files to load.
+    """
+    
+    more_requested = pyqtSignal()
+    
+    HEADERS = ["ID", "File Path", "Collection", "Status", "Hash", "Modified", "Actions"]
+    STATUS_COLUMN = 3
+    ACTIONS_COLUMN = 6
+    FETCH_BATCH = 200
+    _CENTERED_COLUMNS = (0, 3)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._loaded_count = 0
+        self._more_available = False  # The server has files not loaded yet
+        self._more_pending = False  # more_requested was emitted and not answered
+    
+    def set_files(self, files, more_available=False):
+        """
+        Replace the rows with a new list of FileRow objects
+        
+        A list of the same length is swapped in place and only the span of
+        loaded rows that differ is signalled, so views keep their scroll
+        position, selection and loaded rows; otherwise the model is reset.
+        
+        Args:
+            files: FileRow objects
+            more_available: Whether the server has more files to load
+        
+        Returns:
+            True if any row changed
+        """
+        self._more_available = more_available
+        self._more_pending = False
+        if len(files) != len(self._rows):
+            self.beginResetModel()
+            self._rows = files
+            self._loaded_count = min(len(files), self.FETCH_BATCH)
+            self.endResetModel()
+            return True
+        
+        changed = [row for row in range(self._loaded_count) if self._rows[row] != files[row]]
+        unchanged_tail = self._rows[self._loaded_count:] == files[self._loaded_count:]
+        self._rows = files
+        if changed:
+            self.dataChanged.emit(
+                self.index(changed[0], 0),
+                self.index(changed[-1], len(self.HEADERS) - 1)
+            )
+        return bool(changed) or not unchanged_tail
+    
+    def append_files(self, files, more_available=False):
+        """
+        Add FileRow objects after the existing rows
+        
+        Args:
+            files: FileRow objects
+            more_available: Whether the server has more files to load
+        """
+        requested = self._more_pending
+        self._more_pending = False
+        self._more_available = more_available
+        if files:
+            self._rows = self._rows + files
+        # Show them right away if the view asked for them or the first page
+        # isn't full yet (if none passed the filters, ask for the next page)
+        if requested or self._loaded_count < self.FETCH_BATCH:
+            self.fetchMore()
+    
+    def update_files(self, files):
+        """Show changes made in place to some of the rows' FileRow objects"""
+        changed = {id(f) for f in files}
+        for row in range(self._loaded_count):
+            if id(self._rows[row]) in changed:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def remove_files(self, files):
+        """Remove some FileRow objects from the rows"""
+        removed = {id(f) for f in files}
+        rows = [row for row, file_row in enumerate(self._rows) if id(file_row) in removed]
+        # From the bottom up, so removals don't shift the rows still to visit
+        for row in reversed(rows):
+            if row < self._loaded_count:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self._loaded_count -= 1
+                self.endRemoveRows()
+            else:
+                del self._rows[row]
+    
+    def file_at(self, row):
+        """Get the FileRow shown in a row"""
+        return self._rows[row]
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return (self._loaded_count < len(self._rows)
+                or (self._more_available and not self._more_pending))
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rows) - self._loaded_count)
+        if count <= 0:
+            if self._more_available and not self._more_pending:
+                self._more_pending = True
+                self.more_requested.emit()
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_count, self._loaded_count + count - 1)
+        self._loaded_count += count
+        self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded_count
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        file_row = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return str(file_row.id)
+            if column == 1:
+                return file_row.file_path
+            if column == 2:
+                return file_row.collection_name or str(file_row.collection_id)
+            if column == 3:
+                return _STATUS_CELLS[file_row.status][0]
+            if column == 4:
+                # Hash (truncated)
+                file_hash = file_row.file_hash
+                if len(file_hash) > 12:
+                    file_hash = file_hash[:12] + "..."
+                return file_hash
+            if column == 5:
+                return file_row.date
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole and column == self.STATUS_COLUMN:
+            return _STATUS_CELLS[file_row.status][1]
+        
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == 1:
+                return file_row.file_path
+            if column == 4:
+                return file_row.file_hash
+            return None
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in self._CENTERED_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        
+        return None
+
+
+class FilesFilterProxy(QSortFilterProxyModel):
+    """
+    Proxy showing the FilesModel rows that pass the status and search filters
+    
+    Acceptance reads the status and path_lower precomputed in each FileRow,
+    so the source rows are never copied or rebuilt when the filters change.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._statuses = frozenset(('dirty', 'processed'))
+        self._search_text = ''
+    
+    def set_filters(self, statuses, search_text):
+        """
+        Change the filters, re-filtering only if they differ
+        
+        Args:
+            statuses: Status keys ('dirty', 'processed', 'deleted') to show
+            search_text: Text the file path must contain (any case)
+        """
+        statuses = frozenset(statuses)
+        search_text = search_text.lower()
+        if statuses == self._statuses and search_text == self._search_text:
+            return
+        self._statuses = statuses
+        self._search_text = search_text
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        file_row = self.sourceModel().file_at(source_row)
+        return (file_row.status in self._statuses
+                and (not self._search_text or self._search_text in file_row.path_lower))
+    
+    def fetchMore(self, parent=QModelIndex()):
+        # Keep paging in source rows until one passes the filters, so a
+        # sparse filter still fills the view
+        source = self.sourceModel()
+        rows = self.rowCount()
+        while self.rowCount() == rows and source.canFetchMore():
+            source.fetchMore()
+    
+    def file_at(self, row):
+        """Get the FileRow shown in a row"""
+        return self.sourceModel().file_at(self.mapToSource(self.index(row, 0)).row())
+
 
 class FilesTab(QWidget):
     """Files management tab"""
     
+    PAGE_SIZE = 200  # Files requested from the server at a time
+    
+    MARK_PROCESSED_ACTION = RowAction('mark_processed', "✓", "Mark as Processed")
+    MARK_UNPROCESSED_ACTION = RowAction('mark_unprocessed', "↺", "Mark as Unprocessed")
+    DELETE_ACTION = RowAction('delete', "🗑️", "Delete", "#f44336")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
         self.current_collection_id = None
         self.current_files = []
-        self.init_ui()
+        self._filter_collections = None  # Collections shown in the filter dropdown
+        self._files_source = None  # Collection ID of current_files, None for all
+        self._files_total = 0  # Files in the server's collection, loaded or not
+        self._files_by_key = {}  # (collection ID, file ID) -> FileRow in current_files
+        # The UI is built and files loaded on first show (see showEvent)
+        self._ui_built = False
     
     def init_ui(self):
         """Initialize the UI"""
@@ -73,7 +411,12 @@ class FilesTab(QWidget):
         filter_layout.addWidget(QLabel("Search:"))
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Filter by path...")
-        self.search_input.textChanged.connect(self.apply_filters)
+        # Filter once typing pauses rather than on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        self.search_input.textChanged.connect(self._filter_timer.start)
         self.search_input.setMinimumWidth(200)
         filter_layout.addWidget(self.search_input)
         
@@ -85,11 +428,16 @@ class FilesTab(QWidget):
         layout.addLayout(filter_layout)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "File Path", "Collection", "Status", "Hash", "Modified", "Actions"
-        ])
+        self.model = FilesModel(self)
+        self.model.more_requested.connect(self._load_next_page)
+        self.proxy = FilesFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        
+        self.actions_delegate = ActionButtonsDelegate(self.row_actions, self.table)
+        self.actions_delegate.action_triggered.connect(self.on_row_action)
+        self.table.setItemDelegateForColumn(FilesModel.ACTIONS_COLUMN, self.actions_delegate)
         
         # Set column widths
         header = self.table.horizontalHeader()
@@ -99,11 +447,13 @@ class FilesTab(QWidget):
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(FilesModel.ACTIONS_COLUMN, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(FilesModel.ACTIONS_COLUMN, ActionButtonsDelegate.width_for(2))
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.show_context_menu)
+        self.table.verticalScrollBar().valueChanged.connect(self._on_table_scrolled)
         
         layout.addWidget(self.table)
         
@@ -112,15 +462,15 @@ class FilesTab(QWidget):
         bulk_layout.addWidget(QLabel("Bulk Actions:"))
         
         mark_processed_btn = QPushButton("Mark Selected as Processed")
-        mark_processed_btn.clicked.connect(lambda: self.bulk_mark_status(False))
+        mark_processed_btn.clicked.connect(partial(self.bulk_mark_status, False))
         bulk_layout.addWidget(mark_processed_btn)
         
         mark_dirty_btn = QPushButton("Mark Selected as Unprocessed")
-        mark_dirty_btn.clicked.connect(lambda: self.bulk_mark_status(True))
+        mark_dirty_btn.clicked.connect(partial(self.bulk_mark_status, True))
         bulk_layout.addWidget(mark_dirty_btn)
         
         delete_selected_btn = QPushButton("Delete Selected")
-        delete_selected_btn.setStyleSheet("QPushButton { background-color: #f44336; }")
+        delete_selected_btn.setProperty("variant", "danger")
         delete_selected_btn.clicked.connect(self.bulk_delete)
         bulk_layout.addWidget(delete_selected_btn)
         
@@ -132,38 +482,83 @@ class FilesTab(QWidget):
         self.load_collections()
         self.refresh()
     
+    def showEvent(self, event):
+        """Build the UI on first show, reloading a stale collection filter after that"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+        elif self._filter_collections is None:
+            self.load_collections()
+        super().showEvent(event)
+    
+    def invalidate_collections(self):
+        """Reload the collection filter after collections were created, edited or deleted"""
+        self._filter_collections = None
+        if self._ui_built:
+            self.load_collections()
+    
     def load_collections(self):
         """Load collections for filter dropdown"""
         if not self.main_window or not self.main_window.api_client:
             return
         
-        from worker import APIWorker
         worker = APIWorker(
             "Loading collections",
             self.main_window.api_client.get_collections
         )
         worker.finished.connect(self._on_collections_for_filter_loaded)
-        worker.error.connect(lambda e: print(f"Failed to load collections: {e}"))
+        worker.error.connect(self._on_collections_for_filter_error)
         self.main_window.worker_manager.start_worker("files_load_collections", worker)
     
     def _on_collections_for_filter_loaded(self, collections):
         """Handle collections loaded for filter"""
-        # Clear and repopulate
-        self.collection_combo.clear()
-        self.collection_combo.addItem("All Collections", None)
+        # The client serves repeat loads from its TTL cache; skip the rebuild
+        # when the list is the one already shown
+        if collections == self._filter_collections:
+            return
+        self._filter_collections = collections
         
-        for coll in collections:
-            self.collection_combo.addItem(
-                f"{coll.get('name', '')} (ID: {coll.get('id', '')})",
-                coll.get('id')
-            )
+        # Clear and repopulate without firing a files refresh per change,
+        # keeping the selected collection if it still exists
+        selected_id = self.current_collection_id
+        self.collection_combo.blockSignals(True)
+        try:
+            self.collection_combo.clear()
+            self.collection_combo.addItem("All Collections", None)
+            
+            for coll in collections:
+                self.collection_combo.addItem(
+                    f"{coll.get('name', '')} (ID: {coll.get('id', '')})",
+                    coll.get('id')
+                )
+            self.collection_combo.setCurrentIndex(max(self.collection_combo.findData(selected_id), 0))
+        finally:
+            self.collection_combo.blockSignals(False)
+        
+        if self.collection_combo.currentData() != self.current_collection_id:
+            self.on_collection_changed()
+    
+    def _on_collections_for_filter_error(self, error_msg):
+        """Handle collections load error for filter"""
+        print(f"Failed to load collections: {error_msg}")
     
     def set_collection_filter(self, collection_id):
         """Set the collection filter to a specific ID"""
-        for i in range(self.collection_combo.count()):
-            if self.collection_combo.itemData(i) == collection_id:
-                self.collection_combo.setCurrentIndex(i)
-                break
+        if not self._ui_built:
+            # Loaded, and selected in the dropdown, on first show
+            self.current_collection_id = collection_id
+            return
+        
+        index = self.collection_combo.findData(collection_id)
+        if index >= 0:
+            self.collection_combo.setCurrentIndex(index)
+            return
+        
+        # Not in the dropdown yet (not loaded, or a new collection): load its
+        # files now; the dropdown selects it once it has been reloaded
+        self.current_collection_id = collection_id
+        self.refresh()
+        self.invalidate_collections()
     
     def on_collection_changed(self):
         """Handle collection filter change"""
@@ -172,73 +567,150 @@ class FilesTab(QWidget):
     
     def refresh(self):
         """Refresh files list"""
+        if not self._ui_built:
+            return  # Loaded on first show
         if not self.main_window or not self.main_window.api_client:
             return
         
-        from worker import APIWorker
-        
         if self.current_collection_id:
-            # Get files for specific collection
+            # Load a specific collection page by page; the first page comes
+            # now and the rest as the table is scrolled. A refresh of the
+            # collection already shown reloads every loaded file at once.
+            collection_id = self.current_collection_id
+            limit = self.PAGE_SIZE
+            if collection_id == self._files_source:
+                limit = max(limit, len(self.current_files))
             worker = APIWorker(
                 "Loading files",
-                self.main_window.api_client.get_collection_files,
-                self.current_collection_id
+                self.main_window.api_client.get_collection_files_page,
+                collection_id, 0, limit
             )
-            worker.finished.connect(lambda files: self._on_files_loaded(files, self.current_collection_id))
+            worker.finished.connect(partial(self._on_files_page_loaded, collection_id, 0))
             worker.error.connect(self._on_load_error)
             self.main_window.worker_manager.start_worker("files_refresh", worker)
         else:
-            # Get all collections first, then get their files
+            # Get the files of every collection in one background call
             worker = APIWorker(
-                "Loading collections",
-                self.main_window.api_client.get_collections
+                "Loading files",
+                self.main_window.api_client.get_all_files
             )
-            worker.finished.connect(self._load_all_collections_files)
+            worker.finished.connect(partial(self._set_current_files, source=None))
             worker.error.connect(self._on_load_error)
             self.main_window.worker_manager.start_worker("files_refresh", worker)
     
-    def _load_all_collections_files(self, collections):
-        """Load files for all collections"""
-        # This is a bit more complex - we need to load files for each collection
-        # For simplicity, we'll do it sequentially (could be optimized with parallel workers)
-        all_files = []
-        remaining = len(collections)
-        
-        def on_collection_files_loaded(coll_id, coll_name, files):
-            nonlocal remaining, all_files
-            for f in files:
-                f['collection_id'] = coll_id
-                f['collection_name'] = coll_name
-            all_files.extend(files)
-            remaining -= 1
-            
-            if remaining == 0:
-                self.current_files = all_files
-                self.apply_filters()
-                self.main_window.status_updated.emit(f"Loaded {len(all_files)} files")
+    def _load_next_page(self):
+        """Request the page of the current collection after the loaded files"""
+        collection_id = self._files_source
+        if collection_id is None:
+            return
         
-        for coll in collections:
-            from worker import APIWorker
-            worker = APIWorker(
-                f"Loading files for {coll['name']}",
-                self.main_window.api_client.get_collection_files,
-                coll['id']
-            )
-            coll_id = coll['id']
-            coll_name = coll['name']
-            worker.finished.connect(lambda files, c_id=coll_id, c_name=coll_name: on_collection_files_loaded(c_id, c_name, files))
-            worker.error.connect(lambda e: None)  # Silent fail for individual collections
-            self.main_window.worker_manager.start_worker(f"files_coll_{coll['id']}", worker)
-    
-    def _on_files_loaded(self, files, collection_id):
-        """Handle files loaded for a single collection"""
-        # Add collection info
-        for f in files:
-            f['collection_id'] = collection_id
+        offset = len(self.current_files)
+        worker = APIWorker(
+            "Loading more files",
+            self.main_window.api_client.get_collection_files_page,
+            collection_id, offset, self.PAGE_SIZE
+        )
+        worker.finished.connect(partial(self._on_files_page_loaded, collection_id, offset))
+        worker.error.connect(self._on_page_error)
+        self.main_window.worker_manager.start_worker("files_page", worker)
+    
+    def _on_files_page_loaded(self, collection_id, offset, page):
+        """Handle a page of a single collection's files"""
+        if offset == 0:
+            self._files_total = page['total']
+            self._set_current_files(page['files'], source=collection_id)
+            return
         
+        # Drop pages for a collection or refresh that has been replaced since
+        if collection_id != self._files_source or offset != len(self.current_files):
+            return
+        
+        files = [FileRow.from_dict(f, collection_id) for f in page['files']]
+        self._files_total = page['total']
+        self.current_files.extend(files)
+        self._index_files(files)
+        rows = self.proxy.rowCount()
+        self.model.append_files(files, self._has_more_files())
+        if self.proxy.rowCount() == rows:
+            # None of the page passed the filters; the view is still waiting
+            self.proxy.fetchMore(QModelIndex())
+        self._emit_loaded_status()
+    
+    def _on_page_error(self, error_msg):
+        """Stop paging in the current collection after a failed page load"""
+        self.model.append_files([])
+        self.main_window.status_updated.emit(f"Failed to load more files: {error_msg}")
+    
+    def _has_more_files(self):
+        """Check whether the server has files of the current collection not loaded yet"""
+        return self._files_source is not None and len(self.current_files) < self._files_total
+    
+    def _emit_loaded_status(self):
+        """Report how many files are loaded"""
+        if self._has_more_files():
+            self.main_window.status_updated.emit(
+                f"Loaded {len(self.current_files)} of {self._files_total} files"
+            )
+        else:
+            self.main_window.status_updated.emit(f"Loaded {len(self.current_files)} files")
+    
+    def _set_current_files(self, files, source=None):
+        """
+        Keep a freshly loaded files list and show it through the filters
+        
+        Args:
+            files: File dictionaries
+            source: Collection ID the files belong to, or None for all collections
+        """
+        files = [FileRow.from_dict(f, source) for f in files]
+        
+        if source != self._files_source:
+            # A different collection starts at the top, not at the end where
+            # the table would immediately ask for its next page
+            self.table.scrollToTop()
+        self._files_source = source
         self.current_files = files
-        self.apply_filters()
-        self.main_window.status_updated.emit(f"Loaded {len(files)} files")
+        self._files_by_key = {}
+        self._index_files(files)
+        # A copy, as current_files grows by page while the model pages in rows
+        self.model.set_files(list(files), self._has_more_files())
+        self._emit_loaded_status()
+    
+    def _index_files(self, files):
+        """Make files of current_files findable by collection and file ID"""
+        self._files_by_key.update(((f.collection_id, f.id), f) for f in files)
+    
+    def _set_files_dirty(self, keys, dirty):
+        """
+        Record a status change of loaded files without reloading them
+        
+        Args:
+            keys: (collection ID, file ID) pairs of the changed files
+            dirty: New dirty flag
+        """
+        changed = []
+        for key in keys:
+            file_row = self._files_by_key.get(key)
+            if file_row is not None:
+                file_row.set_dirty(dirty)
+                changed.append(file_row)
+        self.model.update_files(changed)
+    
+    def _remove_files(self, keys):
+        """
+        Drop deleted files from the loaded files without reloading them
+        
+        Args:
+            keys: (collection ID, file ID) pairs of the deleted files
+        """
+        removed = [self._files_by_key.pop(key) for key in keys if key in self._files_by_key]
+        if not removed:
+            return
+        removed_ids = {id(f) for f in removed}
+        self.current_files = [f for f in self.current_files if id(f) not in removed_ids]
+        if self._files_source is not None:
+            self._files_total -= len(removed)
+        self.model.remove_files(removed)
     
     def _on_load_error(self, error_msg):
         """Handle load error"""
@@ -246,153 +718,63 @@ class FilesTab(QWidget):
         self.main_window.status_updated.emit("Failed to load files")
     
     def apply_filters(self):
-        """Apply filters to the files list"""
-        if not self.current_files:
-            self.table.setRowCount(0)
-            return
-        
-        # Get filter values
-        show_dirty = self.show_dirty_checkbox.isChecked()
-        show_processed = self.show_processed_checkbox.isChecked()
-        show_deleted = self.show_deleted_checkbox.isChecked()
-        search_text = self.search_input.text().lower()
-        
-        # Filter files
-        filtered_files = []
-        for f in self.current_files:
-            is_dirty = f.get('Dirty', False)
-            is_deleted = f.get('Deleted', False)
-            
-            # Status filter
-            if is_deleted and not show_deleted:
-                continue
-            if not is_deleted:
-                if is_dirty and not show_dirty:
-                    continue
-                if not is_dirty and not show_processed:
-                    continue
-            
-            # Search filter
-            if search_text and search_text not in f.get('FilePath', '').lower():
-                continue
-            
-            filtered_files.append(f)
-        
-        self.populate_table(filtered_files)
+        """Apply the status checkboxes and the search text to the files shown"""
+        statuses = [
+            status for status, checkbox in (
+                ('dirty', self.show_dirty_checkbox),
+                ('processed', self.show_processed_checkbox),
+                ('deleted', self.show_deleted_checkbox)
+            ) if checkbox.isChecked()
+        ]
+        self.proxy.set_filters(statuses, self.search_input.text())
     
-    def populate_table(self, files):
-        """Populate the table with files"""
-        # Disable updates during batch operations to prevent UI lag
-        self.table.setUpdatesEnabled(False)
-        try:
-            self.table.setRowCount(0)
-            self.table.setRowCount(len(files))  # Pre-allocate all rows
-            
-            for row, file_data in enumerate(files):
-                # ID
-                id_item = QTableWidgetItem(str(file_data.get('id', '')))
-                id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 0, id_item)
-                
-                # File Path
-                path_item = QTableWidgetItem(file_data.get('FilePath', ''))
-                path_item.setToolTip(file_data.get('FilePath', ''))
-                self.table.setItem(row, 1, path_item)
-                
-                # Collection
-                coll_name = file_data.get('collection_name', str(file_data.get('collection_id', '')))
-                self.table.setItem(row, 2, QTableWidgetItem(coll_name))
-                
-                # Status
-                is_dirty = file_data.get('Dirty', False)
-                is_deleted = file_data.get('Deleted', False)
-                
-                if is_deleted:
-                    status = "🗑️ Deleted"
-                    color = QColor(255, 200, 200)
-                elif is_dirty:
-                    status = "⚠️ Unprocessed"
-                    color = QColor(255, 255, 200)
-                else:
-                    status = "✅ Processed"
-                    color = QColor(200, 255, 200)
-                
-                status_item = QTableWidgetItem(status)
-                status_item.setBackground(color)
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 3, status_item)
-                
-                # Hash (truncated)
-                file_hash = file_data.get('FileHash', '')
-                if file_hash and len(file_hash) > 12:
-                    file_hash = file_hash[:12] + "..."
-                hash_item = QTableWidgetItem(file_hash)
-                hash_item.setToolTip(file_data.get('FileHash', ''))
-                self.table.setItem(row, 4, hash_item)
-                
-                # Modified
-                modified = file_data.get('LastModified', '')
-                if modified:
-                    modified = modified.split('T')[0]
-                self.table.setItem(row, 5, QTableWidgetItem(modified))
-                
-                # Actions
-                actions_widget = self.create_actions_widget(file_data)
-                self.table.setCellWidget(row, 6, actions_widget)
-        finally:
-            # Re-enable updates and trigger a single repaint
-            self.table.setUpdatesEnabled(True)
-    
-    def create_actions_widget(self, file_data):
-        """Create actions widget for a file row"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(2)
-        
-        file_id = file_data.get('id')
-        collection_id = file_data.get('collection_id')
-        is_dirty = file_data.get('Dirty', False)
-        
-        # Mark processed/unprocessed button
-        if is_dirty:
-            mark_btn = QPushButton("✓")
-            mark_btn.setToolTip("Mark as Processed")
-            mark_btn.clicked.connect(lambda: self.mark_file_status(collection_id, file_id, False))
-        else:
-            mark_btn = QPushButton("↺")
-            mark_btn.setToolTip("Mark as Unprocessed")
-            mark_btn.clicked.connect(lambda: self.mark_file_status(collection_id, file_id, True))
-        
-        mark_btn.setMaximumWidth(30)
-        layout.addWidget(mark_btn)
-        
-        # Delete button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Delete")
-        delete_btn.setMaximumWidth(30)
-        delete_btn.setStyleSheet("QPushButton { background-color: #f44336; }")
-        delete_btn.clicked.connect(lambda: self.delete_file(collection_id, file_id))
-        layout.addWidget(delete_btn)
-        
-        return widget
+    def _on_table_scrolled(self, value):
+        """Page in the next batch of rows before the last loaded one is reached"""
+        # (A range of 0 is a table being reset, not scrolled; the view itself
+        # fetches more while its rows don't fill the viewport)
+        scroll_bar = self.table.verticalScrollBar()
+        if (scroll_bar.maximum() > 0
+                and value >= scroll_bar.maximum() - scroll_bar.pageStep()
+                and self.proxy.canFetchMore(QModelIndex())):
+            self.proxy.fetchMore(QModelIndex())
+    
+    def row_actions(self, index):
+        """Get the Actions column buttons of a row: toggle the status, delete"""
+        if self.proxy.file_at(index.row()).dirty:
+            return (self.MARK_PROCESSED_ACTION, self.DELETE_ACTION)
+        return (self.MARK_UNPROCESSED_ACTION, self.DELETE_ACTION)
+    
+    def on_row_action(self, action, row):
+        """Handle a click on one of the Actions column buttons"""
+        file_row = self.proxy.file_at(row)
+        file_id = file_row.id
+        collection_id = file_row.collection_id
+        if action == 'mark_processed':
+            self.mark_file_status(collection_id, file_id, False)
+        elif action == 'mark_unprocessed':
+            self.mark_file_status(collection_id, file_id, True)
+        elif action == 'delete':
+            self.delete_file(collection_id, file_id)
     
     def mark_file_status(self, collection_id, file_id, dirty):
         """Mark a file's processing status"""
-        from worker import APIWorker
         worker = APIWorker(
             "Updating file status",
             self.main_window.api_client.update_file_status,
             collection_id, file_id, dirty
         )
-        worker.finished.connect(lambda result: self._on_file_status_updated())
-        worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to update file status:\n{error}"))
+        worker.finished.connect(partial(self._on_file_status_updated, collection_id, file_id, dirty))
+        worker.error.connect(self._on_file_status_error)
         self.main_window.worker_manager.start_worker("mark_file_status", worker)
     
-    def _on_file_status_updated(self):
+    def _on_file_status_updated(self, collection_id, file_id, dirty, result=None):
         """Handle file status updated"""
         self.main_window.status_updated.emit("File status updated")
-        self.refresh()
+        self._set_files_dirty([(collection_id, file_id)], dirty)
+    
+    def _on_file_status_error(self, error_msg):
+        """Handle file status update error"""
+        QMessageBox.critical(self, "Error", f"Failed to update file status:\n{error_msg}")
     
     def delete_file(self, collection_id, file_id):
         """Delete a file"""
@@ -405,81 +787,49 @@ class FilesTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            from worker import APIWorker
             worker = APIWorker(
                 "Deleting file",
                 self.main_window.api_client.delete_file_from_collection,
                 collection_id, file_id
             )
-            worker.finished.connect(lambda result: self._on_file_deleted())
-            worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to delete file:\n{error}"))
+            worker.finished.connect(partial(self._on_file_deleted, collection_id, file_id))
+            worker.error.connect(self._on_file_delete_error)
             self.main_window.worker_manager.start_worker("delete_file", worker)
     
-    def _on_file_deleted(self):
+    def _on_file_deleted(self, collection_id, file_id, result=None):
         """Handle file deleted"""
         self.main_window.status_updated.emit("File deleted")
-        self.refresh()
+        self._remove_files([(collection_id, file_id)])
+    
+    def _on_file_delete_error(self, error_msg):
+        """Handle file deletion error"""
+        QMessageBox.critical(self, "Error", f"Failed to delete file:\n{error_msg}")
     
     def bulk_mark_status(self, dirty):
         """Mark multiple files' status"""
-        selected_rows = set(item.row() for item in self.table.selectedItems())
+        selected_rows = [index.row() for index in self.table.selectionModel().selectedRows()]
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select files first")
             return
         
-        # Collect file IDs and collection IDs
-        files_to_update = []
-        for row in selected_rows:
-            try:
-                file_id = int(self.table.item(row, 0).text())
-                collection_id = self.current_collection_id
-                
-                if not collection_id:
-                    # Need to get collection from data
-                    # For simplicity, skip for now or enhance later
-                    continue
-                
-                files_to_update.append((collection_id, file_id))
-            except:
-                pass
-        
-        if not files_to_update:
-            QMessageBox.warning(self, "No Valid Selection", "No valid files selected")
-            return
-        
-        # Update in background
-        from worker import APIWorker
-        
-        success_count = [0]
-        total = len(files_to_update)
-        remaining = [total]
-        
-        def on_file_updated(result):
-            success_count[0] += 1
-            remaining[0] -= 1
-            if remaining[0] == 0:
-                QMessageBox.information(self, "Success", f"Updated {success_count[0]} files")
-                self.refresh()
-        
-        def on_file_error(error):
-            remaining[0] -= 1
-            if remaining[0] == 0:
-                QMessageBox.information(self, "Partial Success", f"Updated {success_count[0]}/{total} files")
-                self.refresh()
-        
-        for collection_id, file_id in files_to_update:
-            worker = APIWorker(
-                f"Updating file {file_id}",
-                self.main_window.api_client.update_file_status,
-                collection_id, file_id, dirty
-            )
-            worker.finished.connect(on_file_updated)
-            worker.error.connect(on_file_error)
-            self.main_window.worker_manager.start_worker(f"bulk_update_{file_id}", worker)
+        # One batch request per collection, all in a single background call
+        files_by_collection = self._files_by_collection(selected_rows)
+        worker = APIWorker(
+            f"Updating {len(selected_rows)} files",
+            _run_batches,
+            self.main_window.api_client.update_files_status,
+            files_by_collection, dirty
+        )
+        worker.finished.connect(partial(
+            self._on_bulk_finished, "Updated", files_by_collection,
+            partial(self._set_files_dirty, dirty=dirty)
+        ))
+        worker.error.connect(partial(self._on_bulk_error, "update"))
+        self.main_window.worker_manager.start_worker("bulk_update_files", worker)
     
     def bulk_delete(self):
         """Delete multiple files"""
-        selected_rows = set(item.row() for item in self.table.selectedItems())
+        selected_rows = [index.row() for index in self.table.selectionModel().selectedRows()]
         if not selected_rows:
             QMessageBox.warning(self, "No Selection", "Please select files first")
             return
@@ -493,53 +843,56 @@ class FilesTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Collect file IDs and collection IDs
-            files_to_delete = []
-            for row in selected_rows:
-                try:
-                    file_id = int(self.table.item(row, 0).text())
-                    collection_id = self.current_collection_id
-                    
-                    if not collection_id:
-                        continue
-                    
-                    files_to_delete.append((collection_id, file_id))
-                except:
-                    pass
-            
-            if not files_to_delete:
-                QMessageBox.warning(self, "No Valid Selection", "No valid files selected")
-                return
-            
-            # Delete in background
-            from worker import APIWorker
-            
-            success_count = [0]
-            total = len(files_to_delete)
-            remaining = [total]
-            
-            def on_file_deleted(result):
-                success_count[0] += 1
-                remaining[0] -= 1
-                if remaining[0] == 0:
-                    QMessageBox.information(self, "Success", f"Deleted {success_count[0]} files")
-                    self.refresh()
-            
-            def on_file_error(error):
-                remaining[0] -= 1
-                if remaining[0] == 0:
-                    QMessageBox.information(self, "Partial Success", f"Deleted {success_count[0]}/{total} files")
-                    self.refresh()
-            
-            for collection_id, file_id in files_to_delete:
-                worker = APIWorker(
-                    f"Deleting file {file_id}",
-                    self.main_window.api_client.delete_file_from_collection,
-                    collection_id, file_id
-                )
-                worker.finished.connect(on_file_deleted)
-                worker.error.connect(on_file_error)
-                self.main_window.worker_manager.start_worker(f"bulk_delete_{file_id}", worker)
+            # One batch request per collection, all in a single background call
+            files_by_collection = self._files_by_collection(selected_rows)
+            worker = APIWorker(
+                f"Deleting {len(selected_rows)} files",
+                _run_batches,
+                self.main_window.api_client.delete_files_from_collection,
+                files_by_collection
+            )
+            worker.finished.connect(partial(
+                self._on_bulk_finished, "Deleted", files_by_collection, self._remove_files
+            ))
+            worker.error.connect(partial(self._on_bulk_error, "delete"))
+            self.main_window.worker_manager.start_worker("bulk_delete_files", worker)
+    
+    def _files_by_collection(self, rows):
+        """Group the file IDs shown in some rows by collection ID"""
+        files_by_collection = {}
+        for row in rows:
+            file_row = self.proxy.file_at(row)
+            files_by_collection.setdefault(file_row.collection_id, []).append(file_row.id)
+        return files_by_collection
+    
+    def _on_bulk_finished(self, verb, files_by_collection, apply_change, result):
+        """
+        Apply a finished bulk operation to the loaded files and report it
+        
+        Args:
+            verb: Past tense of the operation, for the message
+            files_by_collection: Dictionary mapping collection ID to the file IDs sent
+            apply_change: Method taking the (collection ID, file ID) pairs that succeeded
+            result: Combined batch result with 'count' and 'failed'
+        """
+        failed = set(result['failed'])
+        keys = [
+            (collection_id, file_id)
+            for collection_id, file_ids in files_by_collection.items()
+            for file_id in file_ids if file_id not in failed
+        ]
+        apply_change(keys)
+        
+        total = sum(len(file_ids) for file_ids in files_by_collection.values())
+        if failed:
+            QMessageBox.information(self, "Partial Success", f"{verb} {result['count']}/{total} files")
+        else:
+            QMessageBox.information(self, "Success", f"{verb} {result['count']} files")
+    
+    def _on_bulk_error(self, operation, error):
+        """Report a failed bulk operation"""
+        QMessageBox.critical(self, "Error", f"Failed to {operation} files:\n{error}")
+        self.refresh()
     
     def show_context_menu(self, position):
         """Show context menu for table"""
@@ -547,19 +900,21 @@ class FilesTab(QWidget):
         if row < 0:
             return
         
-        file_id = int(self.table.item(row, 0).text())
+        file_row = self.proxy.file_at(row)
+        file_id = file_row.id
+        collection_id = file_row.collection_id
         
         menu = QMenu(self)
         
         mark_processed_action = QAction("✅ Mark as Processed", self)
         mark_processed_action.triggered.connect(
-            lambda: self.mark_file_status(self.current_collection_id, file_id, False)
+            partial(self.mark_file_status, collection_id, file_id, False)
         )
         menu.addAction(mark_processed_action)
         
         mark_dirty_action = QAction("⚠️ Mark as Unprocessed", self)
         mark_dirty_action.triggered.connect(
-            lambda: self.mark_file_status(self.current_collection_id, file_id, True)
+            partial(self.mark_file_status, collection_id, file_id, True)
         )
         menu.addAction(mark_dirty_action)
         
@@ -567,7 +922,7 @@ class FilesTab(QWidget):
         
         delete_action = QAction("🗑️ Delete", self)
         delete_action.triggered.connect(
-            lambda: self.delete_file(self.current_collection_id, file_id)
+            partial(self.delete_file, collection_id, file_id)
         )
         menu.addAction(delete_action)
         
@@ -9,21 +9,26 @@ from PyQt6.QtWidgets import (
     QTabWidget, QLabel, QPushButton, QMessageBox, QStatusBar,
     QSplitter, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal
+from PyQt6.QtGui import QIcon
 
-from api_client import APIClient, APIClientException
+from api_client import APIClient, APIClientException, get_default_client, close_default_client
 from collections_tab import CollectionsTab
 from files_tab import FilesTab
 from search_tab import SearchTab
 from watcher_tab import WatcherTab
 from dashboard_tab import DashboardTab
 from worker import WorkerManager, StatusBarManager
+from styles import get_font, load_stylesheet
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # API status poll interval, and its ceiling while backing off (ms)
+    STATUS_INTERVAL = 5000
+    MAX_STATUS_INTERVAL = 60000
+    
     # Signals
     status_updated = pyqtSignal(str)
     
@@ -32,6 +37,8 @@ class MainWindow(QMainWindow):
         self.api_client = None
         self.worker_manager = WorkerManager()
         self.status_bar_manager = None  # Initialize after status bar is created
+        self._pending_status = None  # Latest status message not shown yet
+        self._healthy_streak = 0  # Consecutive all-healthy checks while inactive
         self.init_ui()
         self.init_api_client()
         self.setup_auto_refresh()
@@ -41,74 +48,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Ollama-RAG-Sync Control Center")
         self.setGeometry(100, 100, 1400, 900)
         
-        # Apply modern styling
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: white;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 2px solid #2196F3;
-            }
-            QTabBar::tab:hover {
-                background-color: #eeeeee;
-            }
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QLabel {
-                color: #333333;
-            }
-            QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 6px;
-                background-color: white;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 2px solid #2196F3;
-            }
-            QTableWidget {
-                border: 1px solid #cccccc;
-                gridline-color: #e0e0e0;
-                background-color: white;
-            }
-            QHeaderView::section {
-                background-color: #f5f5f5;
-                padding: 8px;
-                border: none;
-                border-bottom: 2px solid #2196F3;
-                font-weight: bold;
-            }
-        """)
-        
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -132,6 +71,9 @@ class MainWindow(QMainWindow):
         self.search_tab = SearchTab(self)
         self.watcher_tab = WatcherTab(self)
         
+        # Keep the files tab's collection filter in step with collection edits
+        self.collections_tab.collections_changed.connect(self.files_tab.invalidate_collections)
+        
         # Add tabs
         self.tabs.addTab(self.dashboard_tab, "📊 Dashboard")
         self.tabs.addTab(self.collections_tab, "📁 Collections")
@@ -156,25 +98,13 @@ class MainWindow(QMainWindow):
         """Create the application header"""
         header = QFrame()
         header.setFrameShape(QFrame.Shape.StyledPanel)
-        header.setStyleSheet("""
-            QFrame {
-                background-color: #2196F3;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+        header.setObjectName("AppHeader")
         
         layout = QHBoxLayout(header)
         
         # Title
         title = QLabel("Ollama-RAG-Sync Control Center")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(get_font(18, bold=True))
         layout.addWidget(title)
         
         layout.addStretch()
@@ -183,8 +113,7 @@ class MainWindow(QMainWindow):
         self.filetracker_status_label = QLabel("FileTracker: ●")
         self.vectors_status_label = QLabel("Vectors: ●")
         
-        status_font = QFont()
-        status_font.setPointSize(11)
+        status_font = get_font(11)
         self.filetracker_status_label.setFont(status_font)
         self.vectors_status_label.setFont(status_font)
         
@@ -193,15 +122,7 @@ class MainWindow(QMainWindow):
         
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.setStyleSheet("""
-            QPushButton {
-                background-color: white;
-                color: #2196F3;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+        refresh_btn.setObjectName("HeaderButton")
         refresh_btn.clicked.connect(self.refresh_all)
         layout.addWidget(refresh_btn)
         
@@ -210,7 +131,8 @@ class MainWindow(QMainWindow):
     def init_api_client(self):
         """Initialize the API client with default settings"""
         try:
-            self.api_client = APIClient()
+            # Shared with every tab and worker so they reuse one connection pool
+            self.api_client = get_default_client()
             self.update_api_status()
             self.status_updated.emit("Connected to APIs")
         except Exception as e:
@@ -222,39 +144,77 @@ class MainWindow(QMainWindow):
     
     def setup_auto_refresh(self):
         """Setup automatic refresh timers"""
-        # Refresh API status every 5 seconds
+        # Refresh API status every 5 seconds while the window is shown
+        # (started and stopped by showEvent/hideEvent/changeEvent), backing
+        # off while it is inactive and both APIs keep reporting healthy
         self.status_timer = QTimer()
+        self.status_timer.setInterval(self.STATUS_INTERVAL)
         self.status_timer.timeout.connect(self.update_api_status)
-        self.status_timer.start(5000)
         
-        # Refresh dashboard every 10 seconds
-        self.dashboard_timer = QTimer()
-        self.dashboard_timer.timeout.connect(self.refresh_dashboard)
-        self.dashboard_timer.start(10000)
+        # The dashboard runs its own auto-refresh timer while it is visible
     
-    def update_api_status(self):
-        """Update API connection status indicators"""
+    def update_api_status(self, use_cache=True):
+        """
+        Update API connection status indicators
+        
+        Args:
+            use_cache: Show recent cached probe results instead of probing again
+        """
         if not self.api_client:
             return
         
-        # Check FileTracker in background
+        if use_cache:
+            cached = self.api_client.cached_health()
+            if None not in cached.values():
+                self._on_health_status(cached)
+                return
+        
+        # Probe both APIs in one background call (concurrently, in the client)
         from worker import APIWorker
-        ft_worker = APIWorker(
-            "Checking FileTracker API",
-            self.api_client.check_filetracker_health
+        worker = APIWorker(
+            "Checking APIs",
+            self.api_client.check_health_all,
+            use_cache=use_cache
         )
-        ft_worker.finished.connect(self._on_filetracker_status)
-        ft_worker.error.connect(lambda e: self._on_filetracker_status(False))
-        self.worker_manager.start_worker("ft_health_check", ft_worker)
+        worker.finished.connect(self._on_health_status)
+        worker.error.connect(self._on_health_error)
+        self.worker_manager.start_worker("health_check", worker)
+    
+    def _on_health_status(self, health):
+        """Handle the health flags of both APIs"""
+        self._on_filetracker_status(health['filetracker'])
+        self._on_vectors_status(health['vectors'])
+        self._update_status_interval(health['filetracker'] and health['vectors'])
+    
+    def _on_health_error(self, error_msg):
+        """Handle a failed health check"""
+        self._on_filetracker_status(False)
+        self._on_vectors_status(False)
+        self._update_status_interval(False)
+    
+    def _update_status_interval(self, healthy):
+        """
+        Back the status poll off exponentially while nothing changes
         
-        # Check Vectors in background
-        v_worker = APIWorker(
-            "Checking Vectors API",
-            self.api_client.check_vectors_health
-        )
-        v_worker.finished.connect(self._on_vectors_status)
-        v_worker.error.connect(lambda e: self._on_vectors_status(False))
-        self.worker_manager.start_worker("v_health_check", v_worker)
+        Args:
+            healthy: Whether both APIs were reported healthy
+        """
+        if healthy and not self.isActiveWindow():
+            self._healthy_streak += 1
+        else:
+            self._healthy_streak = 0
+        
+        interval = min(self.MAX_STATUS_INTERVAL, self.STATUS_INTERVAL << min(self._healthy_streak, 4))
+        if interval != self.status_timer.interval():
+            self.status_timer.setInterval(interval)
+    
+    def _reset_status_interval(self):
+        """Return to the normal poll interval and update the status now"""
+        self._healthy_streak = 0
+        self.status_timer.setInterval(self.STATUS_INTERVAL)
+        if self.status_timer.isActive():
+            self.status_timer.start()  # Restart at the normal interval
+            self.update_api_status()
     
     def _on_filetracker_status(self, ft_healthy):
         """Handle FileTracker status check result"""
@@ -274,6 +234,35 @@ class MainWindow(QMainWindow):
             self.vectors_status_label.setText("Vectors: 🔴")
             self.vectors_status_label.setToolTip("Vectors API is offline")
     
+    def _set_status_polling(self, active):
+        """Start or stop the API status timer, updating right away on resume"""
+        if active == self.status_timer.isActive():
+            return
+        if active:
+            self.status_timer.start()
+            self.update_api_status()
+        else:
+            self.status_timer.stop()
+    
+    def showEvent(self, event):
+        """Poll the API status while the window is shown"""
+        super().showEvent(event)
+        self._set_status_polling(not self.isMinimized())
+    
+    def hideEvent(self, event):
+        """Stop polling the API status while the window is hidden"""
+        super().hideEvent(event)
+        self._set_status_polling(False)
+    
+    def changeEvent(self, event):
+        """Stop polling the API status while minimized; poll normally again on activation"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._set_status_polling(self.isVisible() and not self.isMinimized())
+        elif event.type() == QEvent.Type.ActivationChange:
+            if self.isActiveWindow() and self._healthy_streak:
+                self._reset_status_interval()
+    
     def refresh_all(self):
         """Refresh all tabs"""
         self.status_updated.emit("Refreshing...")
@@ -283,25 +272,32 @@ class MainWindow(QMainWindow):
             if hasattr(current_tab, 'refresh'):
                 current_tab.refresh()
             
-            # Update API status
-            self.update_api_status()
+            # Update API status with a fresh probe, polling normally again
+            self._healthy_streak = 0
+            self.status_timer.setInterval(self.STATUS_INTERVAL)
+            self.update_api_status(use_cache=False)
             
             self.status_updated.emit("Refresh completed")
         except Exception as e:
             self.status_updated.emit(f"Refresh failed: {str(e)}")
             QMessageBox.warning(self, "Refresh Error", f"Failed to refresh:\n{str(e)}")
     
-    def refresh_dashboard(self):
-        """Refresh dashboard if it's the current tab"""
-        if self.tabs.currentWidget() == self.dashboard_tab:
-            try:
-                self.dashboard_tab.refresh()
-            except:
-                pass
-    
     def update_status_bar(self, message: str):
-        """Update the status bar message"""
-        self.status_bar.showMessage(message, 5000)
+        """
+        Update the status bar message
+        
+        Messages set within one event-loop iteration are coalesced; only
+        the latest is shown.
+        """
+        if self._pending_status is None:
+            QTimer.singleShot(0, self._flush_status)
+        self._pending_status = message
+    
+    def _flush_status(self):
+        """Show the latest pending status message"""
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            self.status_bar.showMessage(message, 5000)
     
     def get_api_client(self) -> APIClient:
         """Get the API client instance"""
@@ -318,13 +314,11 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Cancel all background workers
-            self.worker_manager.cancel_all()
-            
-            # Stop timers
+            # Close right away; workers mid-request get a short grace period
+            # and are otherwise abandoned rather than joined
             self.status_timer.stop()
-            self.dashboard_timer.stop()
-            event.accept()
+            self.worker_manager.shutdown(timeout_ms=200)
+            super().closeEvent(event)
         else:
             event.ignore()
 
@@ -334,6 +328,9 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Ollama-RAG-Sync")
     app.setOrganizationName("Ollama-RAG-Sync")
+    # One stylesheet for every widget, parsed once
+    app.setStyleSheet(load_stylesheet())
+    app.aboutToQuit.connect(close_default_client)
     
     window = MainWindow()
     window.show()
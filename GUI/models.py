@@ -0,0 +1,177 @@
+"""
+Typed response models for Ollama-RAG-Sync API data
+Lightweight slotted dataclasses built from the JSON dictionaries returned by the APIs
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+
+try:
+    import msgspec
+except ImportError:  # optional, search responses are then decoded via dicts
+    msgspec = None
+
+HAS_MSGSPEC = msgspec is not None
+
+# slots=True is only accepted by dataclass() on Python 3.10+
+_DATACLASS_OPTIONS = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS['slots'] = True
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Collection:
+    """A FileTracker collection"""
+    id: int
+    name: str
+    source_folder: str = ""
+    include_extensions: str = ""
+    exclude_folders: str = ""
+    description: str = ""
+    created_at: str = ""
+    updated_at: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Collection':
+        """Build from an API collection dictionary, ignoring unknown keys"""
+        return cls(
+            id=data.get('id', 0),
+            name=data.get('name', ''),
+            source_folder=data.get('source_folder') or '',
+            include_extensions=data.get('include_extensions') or '',
+            exclude_folders=data.get('exclude_folders') or '',
+            description=data.get('description') or '',
+            created_at=data.get('created_at') or '',
+            updated_at=data.get('updated_at') or ''
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class TrackedFile:
+    """A file tracked in a FileTracker collection"""
+    id: int
+    collection_id: int = 0
+    file_path: str = ""
+    file_hash: str = ""
+    last_modified: str = ""
+    dirty: bool = False
+    deleted: bool = False
+    original_url: str = ""
+    collection_name: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TrackedFile':
+        """
+        Build from an API file dictionary, ignoring unknown keys
+
+        The FileTracker API sends camelCase keys (filePath, dirty, ...);
+        the database's PascalCase column names are accepted as well.
+        """
+        return cls(
+            id=data.get('id', 0),
+            collection_id=data.get('collection_id', data.get('collectionId', 0)),
+            file_path=data.get('filePath') or data.get('FilePath') or '',
+            file_hash=data.get('fileHash') or data.get('FileHash') or '',
+            last_modified=data.get('lastModified') or data.get('LastModified') or '',
+            dirty=bool(data.get('dirty', data.get('Dirty', False))),
+            deleted=bool(data.get('deleted', data.get('Deleted', False))),
+            original_url=data.get('originalUrl') or data.get('OriginalUrl') or '',
+            collection_name=data.get('collection_name') or ''
+        )
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ChunkResult:
+    """A single search hit (chunk or document) from the Vectors API"""
+    score: float
+    source: str = ""
+    content: str = ""
+    document_id: str = ""
+    document_name: str = ""
+    chunk_id: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChunkResult':
+        """
+        Build from an API search result dictionary
+
+        Accepts the key variants the search endpoints use, in the same
+        order of preference as the search tab (score/similarity/distance,
+        file_path/source, content/text).
+        """
+        score = data.get('score', data.get('similarity', data.get('distance', 0.0)))
+        metadata = data.get('metadata') or {}
+        return cls(
+            score=float(score),
+            source=data.get('file_path') or data.get('source') or metadata.get('source', ''),
+            content=data.get('content') or data.get('text') or '',
+            document_id=str(data.get('document_id', '')),
+            document_name=data.get('document_name') or '',
+            chunk_id=str(data.get('chunk_id', '')),
+            metadata=metadata
+        )
+
+
+if HAS_MSGSPEC:
+    class _WireSearchHit(msgspec.Struct):
+        """A search hit as sent by the Vectors API; every key variant is optional"""
+        score: Optional[float] = None
+        similarity: Optional[float] = None
+        distance: Optional[float] = None
+        file_path: Optional[str] = None
+        source: Optional[str] = None
+        content: Optional[str] = None
+        text: Optional[str] = None
+        document_id: Any = ""
+        document_name: Optional[str] = None
+        chunk_id: Any = ""
+        metadata: Optional[Dict[str, Any]] = None
+
+    class _WireSearchResponse(msgspec.Struct):
+        """Envelope of the /api/search/* responses"""
+        success: bool = False
+        results: List[_WireSearchHit] = []
+        error: Optional[str] = None
+
+    _search_decoder = msgspec.json.Decoder(_WireSearchResponse)
+
+
+def decode_search_response(content: bytes) -> Dict[str, Any]:
+    """
+    Decode a raw search response body straight into ChunkResult objects
+
+    msgspec parses and validates the bytes in one pass without building an
+    intermediate dict per hit. Only available when HAS_MSGSPEC is true.
+
+    Args:
+        content: Raw JSON response body
+
+    Returns:
+        Dictionary with 'success', 'results' (List[ChunkResult]) and 'error'
+
+    Raises:
+        ValueError: If the body is not a valid search response
+    """
+    try:
+        wire = _search_decoder.decode(content)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e))
+
+    results = []
+    for hit in wire.results:
+        score = hit.score
+        if score is None:
+            score = hit.similarity if hit.similarity is not None else (hit.distance or 0.0)
+        metadata = hit.metadata or {}
+        results.append(ChunkResult(
+            score=float(score),
+            source=hit.file_path or hit.source or metadata.get('source', ''),
+            content=hit.content or hit.text or '',
+            document_id=str(hit.document_id),
+            document_name=hit.document_name or '',
+            chunk_id=str(hit.chunk_id),
+            metadata=metadata
+        ))
+    return {'success': wire.success, 'results': results, 'error': wire.error}
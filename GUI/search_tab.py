@@ -2,14 +2,237 @@
 Search Tab - Search for documents and chunks using semantic similarity
 """
 
+import json
+from operator import itemgetter
+
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
-    QTableWidgetItem, QHeaderView, QPlainTextEdit, QLabel, QSpinBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QPlainTextEdit, QLabel, QSpinBox,
     QDoubleSpinBox, QGroupBox, QRadioButton, QComboBox, QCheckBox,
     QMessageBox, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QKeySequence, QShortcut
+
+from styles import get_font
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Rank texts for every result count the max results spin box allows
+_RANK_STRS = [str(i) for i in range(1, 101)]
+
+_NEWLINES_TO_SPACES = str.maketrans('\r\n', '  ')
+
+# Longest content shown in a preview tooltip; the details dialog shows it all
+_TOOLTIP_MAX_CHARS = 4096
+
+
+def _normalize_result(result):
+    """
+    Resolve the fields a result may carry under either of two keys
+    
+    Args:
+        result: Search result dictionary
+        
+    Returns:
+        (score, file_path, collection, content) tuple
+    """
+    if 'score' in result:
+        score = result['score']
+    else:
+        score = result.get('distance', 0)
+    
+    file_path = result['file_path'] if 'file_path' in result else result.get('source', 'N/A')
+    
+    if 'collection' in result:
+        collection = result['collection']
+    else:
+        collection = (result.get('metadata') or {}).get('collection', 'N/A')
+    
+    content = result['content'] if 'content' in result else result.get('text', '')
+    return score, file_path, collection, content
+
+
+def _normalize_results(results):
+    """
+    Normalize the results of one search
+    
+    A response's results share one shape, so the key of each field is picked
+    from the first result and read with a single itemgetter; a result that
+    lacks one of those keys falls back to _normalize_result().
+    
+    Args:
+        results: Search result dictionaries
+        
+    Returns:
+        List of (score, file_path, collection, content) tuples
+    """
+    if not results:
+        return []
+    
+    sample = results[0]
+    get_fields = itemgetter(
+        'score' if 'score' in sample else 'distance',
+        'file_path' if 'file_path' in sample else 'source',
+        'content' if 'content' in sample else 'text'
+    )
+    top_level_collection = 'collection' in sample
+    
+    normalized = []
+    for result in results:
+        try:
+            score, file_path, content = get_fields(result)
+            if top_level_collection:
+                collection = result['collection']
+            else:
+                collection = result['metadata']['collection']
+        except (KeyError, TypeError):
+            normalized.append(_normalize_result(result))
+        else:
+            normalized.append((score, file_path, collection, content))
+    return normalized
+
+
+def _export_json(file_path, results):
+    """
+    Write search results to a JSON file
+    
+    Args:
+        file_path: Destination file
+        results: Search result dictionaries
+        
+    Returns:
+        The file path written
+    """
+    if orjson is not None:
+        # orjson encodes straight to UTF-8 bytes in C
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    return file_path
+
+
+def _export_text(file_path, results):
+    """
+    Write search results to a plain text file
+    
+    Args:
+        file_path: Destination file
+        results: Search result dictionaries
+        
+    Returns:
+        The file path written
+    """
+    with open(file_path, 'w', encoding='utf-8') as f:
+        # Written one record at a time rather than built up in memory
+        f.writelines(
+            f"Result #{idx}\n"
+            f"File: {result.get('file_path', result.get('source', 'N/A'))}\n"
+            f"Score: {result.get('score', result.get('distance', 'N/A'))}\n"
+            f"Content:\n{result.get('content', result.get('text', ''))}\n"
+            "\n" + "="*80 + "\n\n"
+            for idx, result in enumerate(results, 1)
+        )
+    return file_path
+
+
+def _format_scores(scores):
+    """
+    Format the scores of one search for display
+    
+    Args:
+        scores: Score of each result
+        
+    Returns:
+        List of score texts, numbers with 4 decimals
+    """
+    if all(type(score) is float for score in scores):
+        # The usual case: one mapped bound method, no per-score type checks
+        return list(map('{:.4f}'.format, scores))
+    return [
+        f"{score:.4f}" if isinstance(score, (int, float)) else str(score)
+        for score in scores
+    ]
+
+
+class SearchResultsModel(QAbstractTableModel):
+    """
+    Table model over search results
+    
+    Each result's cell texts are formatted once in set_results() into a
+    tuple; data() only indexes into it.
+    """
+    
+    HEADERS = ["Rank", "Score", "File Path", "Collection", "Preview"]
+    _CENTERED_COLUMNS = (0, 1)
+    # Tooltip of a column, as an index into the row tuple
+    _TOOLTIP_FIELDS = {2: 2, 4: 5}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def set_results(self, results):
+        """Replace the rows with a new list of search result dictionaries"""
+        normalized = _normalize_results(results)
+        score_texts = _format_scores([fields[0] for fields in normalized])
+        
+        self.beginResetModel()
+        self._rows = [
+            self._format_row(idx, fields, score_text)
+            for idx, (fields, score_text) in enumerate(zip(normalized, score_texts))
+        ]
+        self.endResetModel()
+    
+    @staticmethod
+    def _format_row(idx, normalized, score_text):
+        """Build the (rank, score, path, collection, preview, content tooltip) texts of a normalized result"""
+        _, file_path, collection, content = normalized
+        rank = _RANK_STRS[idx] if idx < len(_RANK_STRS) else str(idx + 1)
+        
+        if content:
+            # Slice first so only the shown part is translated
+            preview = content[:200].translate(_NEWLINES_TO_SPACES)
+            if len(content) > 200:
+                preview += "..."
+            tooltip = content[:_TOOLTIP_MAX_CHARS]
+            if len(content) > _TOOLTIP_MAX_CHARS:
+                tooltip += "\n…"
+        else:
+            preview = "No preview available"
+            tooltip = "No content"
+        
+        return (rank, score_text, file_path, str(collection), preview, tooltip)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][column]
+        if role == Qt.ItemDataRole.ToolTipRole and column in self._TOOLTIP_FIELDS:
+            return self._rows[index.row()][self._TOOLTIP_FIELDS[column]]
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in self._CENTERED_COLUMNS:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
 
 
 class SearchTab(QWidget):
@@ -19,7 +242,22 @@ class SearchTab(QWidget):
         super().__init__(parent)
         self.main_window = parent
         self.search_results = []
-        self.init_ui()
+        self._current_query = None  # Stripped query text, None once edited
+        self._detail_dialog = None  # Result details dialog, built on first use
+        # Collapse repeated clicks / held Ctrl+Enter into one search
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self._do_search)
+        # The UI is built and collections loaded on first show (see showEvent)
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        """Build the UI the first time the tab is shown"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+        super().showEvent(event)
     
     def init_ui(self):
         """Initialize the UI"""
@@ -28,10 +266,7 @@ class SearchTab(QWidget):
         
         # Header
         title = QLabel("Semantic Search")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(get_font(16, bold=True))
         layout.addWidget(title)
         
         # Create splitter for search params and results
@@ -49,6 +284,7 @@ class SearchTab(QWidget):
         self.query_input.setPlaceholderText("Enter your search query here...\n\nExample: machine learning algorithms for classification")
         self.query_input.setMaximumHeight(100)
         self.query_input.setTabChangesFocus(True)  # Allow tab to move to next field
+        self.query_input.textChanged.connect(self._on_query_changed)
         query_layout.addWidget(self.query_input)
         
         search_params_layout.addWidget(query_group)
@@ -118,7 +354,7 @@ class SearchTab(QWidget):
         self.search_btn = QPushButton("🔍 Search")
         self.search_btn.clicked.connect(self.perform_search)
         self.search_btn.setMinimumHeight(40)
-        self.search_btn.setStyleSheet("QPushButton { font-size: 14px; font-weight: bold; }")
+        self.search_btn.setObjectName("PrimaryAction")
         search_btn_layout.addStretch()
         search_btn_layout.addWidget(self.search_btn)
         search_btn_layout.addStretch()
@@ -132,9 +368,7 @@ class SearchTab(QWidget):
         
         results_header_layout = QHBoxLayout()
         self.results_label = QLabel("Results (0)")
-        results_font = QFont()
-        results_font.setBold(True)
-        self.results_label.setFont(results_font)
+        self.results_label.setFont(get_font(None, bold=True))
         results_header_layout.addWidget(self.results_label)
         results_header_layout.addStretch()
         
@@ -144,22 +378,24 @@ class SearchTab(QWidget):
         
         results_layout.addLayout(results_header_layout)
         
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(5)
-        self.results_table.setHorizontalHeaderLabels([
-            "Rank", "Score", "File Path", "Collection", "Preview"
-        ])
+        self.results_model = SearchResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         
-        # Set column widths
+        # Set column widths (fixed/interactive, so new results never make
+        # the header measure every row)
         header = self.results_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(0, 50)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(1, 80)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
+        header.resizeSection(3, 150)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
         
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.results_table.cellDoubleClicked.connect(self.show_result_details)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.results_table.doubleClicked.connect(self._on_result_double_clicked)
         
         results_layout.addWidget(self.results_table)
         
@@ -201,9 +437,34 @@ class SearchTab(QWidget):
             if coll != "default":
                 self.collection_combo.addItem(coll, coll)
     
+    def _on_query_changed(self):
+        """Drop the cached query text after an edit"""
+        self._current_query = None
+    
+    def _query_text(self):
+        """
+        Get the stripped query text
+        
+        Copied out of the editor only after it has been edited, rather than on
+        every search or every keystroke.
+        
+        Returns:
+            The query text
+        """
+        if self._current_query is None:
+            self._current_query = self.query_input.toPlainText().strip()
+        return self._current_query
+    
     def perform_search(self):
-        """Perform the search"""
-        query = self.query_input.toPlainText().strip()
+        """Perform the search once repeated requests have settled"""
+        self._search_debounce.start()
+    
+    def _do_search(self):
+        """Start the search in the background"""
+        if not self.search_btn.isEnabled():
+            return  # A search is already running
+        
+        query = self._query_text()
         
         if not query:
             QMessageBox.warning(self, "No Query", "Please enter a search query")
@@ -276,58 +537,13 @@ class SearchTab(QWidget):
     
     def display_results(self, results):
         """Display search results in the table"""
-        # Disable updates during batch operations to prevent UI lag
-        self.results_table.setUpdatesEnabled(False)
-        try:
-            self.results_table.setRowCount(0)
-            self.results_label.setText(f"Results ({len(results)})")
-            
-            # Set row count once instead of inserting rows one by one
-            self.results_table.setRowCount(len(results))
-            
-            for idx, result in enumerate(results, 1):
-                row = idx - 1
-                
-                # Rank
-                rank_item = QTableWidgetItem(str(idx))
-                rank_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.results_table.setItem(row, 0, rank_item)
-                
-                # Score
-                score = result.get('score', result.get('distance', 0))
-                if isinstance(score, (int, float)):
-                    score_text = f"{score:.4f}"
-                else:
-                    score_text = str(score)
-                
-                score_item = QTableWidgetItem(score_text)
-                score_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.results_table.setItem(row, 1, score_item)
-                
-                # File Path
-                file_path = result.get('file_path', result.get('source', 'N/A'))
-                path_item = QTableWidgetItem(file_path)
-                path_item.setToolTip(file_path)
-                self.results_table.setItem(row, 2, path_item)
-                
-                # Collection
-                collection = result.get('collection', result.get('metadata', {}).get('collection', 'N/A'))
-                self.results_table.setItem(row, 3, QTableWidgetItem(str(collection)))
-                
-                # Preview
-                content = result.get('content', result.get('text', ''))
-                if content:
-                    preview = content[:200] + "..." if len(content) > 200 else content
-                    preview = preview.replace('\n', ' ')
-                else:
-                    preview = "No preview available"
-                
-                preview_item = QTableWidgetItem(preview)
-                preview_item.setToolTip(content if content else "No content")
-                self.results_table.setItem(row, 4, preview_item)
-        finally:
-            # Re-enable updates and trigger a single repaint
-            self.results_table.setUpdatesEnabled(True)
+        self.results_label.setText(f"Results ({len(results)})")
+        # One model reset instead of a QTableWidgetItem per cell
+        self.results_model.set_results(results)
+    
+    def _on_result_double_clicked(self, index):
+        """Show the details of a double-clicked result"""
+        self.show_result_details(index.row(), index.column())
     
     def show_result_details(self, row, column):
         """Show detailed view of a search result"""
@@ -336,15 +552,6 @@ class SearchTab(QWidget):
         
         result = self.search_results[row]
         
-        # Create detail dialog
-        from PyQt6.QtWidgets import QDialog, QTextBrowser
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Search Result Details")
-        dialog.setMinimumSize(700, 500)
-        
-        layout = QVBoxLayout(dialog)
-        
         # Result info
         info_text = f"""
 <h2>Search Result #{row + 1}</h2>
@@ -353,26 +560,51 @@ class SearchTab(QWidget):
 <p><b>Score:</b> {result.get('score', result.get('distance', 'N/A'))}</p>
         """
         
-        info_browser = QTextBrowser()
-        info_browser.setHtml(info_text)
-        info_browser.setMaximumHeight(150)
-        layout.addWidget(info_browser)
+        dialog = self._get_detail_dialog()
+        self._detail_info_browser.setHtml(info_text)
+        self._detail_content_browser.setPlainText(
+            result.get('content', result.get('text', 'No content available'))
+        )
+        dialog.exec()
+    
+    def _get_detail_dialog(self):
+        """
+        Get the result details dialog, building it on first use
+        
+        The one dialog is reused for every result; only its contents change.
+        
+        Returns:
+            The details QDialog
+        """
+        if self._detail_dialog is not None:
+            return self._detail_dialog
+        
+        from PyQt6.QtWidgets import QDialog, QTextBrowser
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Search Result Details")
+        dialog.setMinimumSize(700, 500)
+        
+        layout = QVBoxLayout(dialog)
+        
+        self._detail_info_browser = QTextBrowser()
+        self._detail_info_browser.setMaximumHeight(150)
+        layout.addWidget(self._detail_info_browser)
         
         # Content
         content_label = QLabel("<b>Content:</b>")
         layout.addWidget(content_label)
         
-        content_browser = QTextBrowser()
-        content = result.get('content', result.get('text', 'No content available'))
-        content_browser.setPlainText(content)
-        layout.addWidget(content_browser)
+        self._detail_content_browser = QTextBrowser()
+        layout.addWidget(self._detail_content_browser)
         
         # Close button
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(dialog.close)
         layout.addWidget(close_btn)
         
-        dialog.exec()
+        self._detail_dialog = dialog
+        return dialog
     
     def export_results(self):
         """Export search results to a file"""
@@ -390,28 +622,15 @@ class SearchTab(QWidget):
         )
         
         if file_path:
-            # Export in background to avoid blocking UI
+            # Export in background to avoid blocking UI, from a snapshot so a
+            # search finishing mid-export can't change what is written
             from worker import APIWorker
-            import json
-            
-            def export_worker():
-                """Worker function to export results"""
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    if file_path.endswith('.json'):
-                        json.dump(self.search_results, f, indent=2, ensure_ascii=False)
-                    else:
-                        for idx, result in enumerate(self.search_results, 1):
-                            f.write(f"Result #{idx}\n")
-                            f.write(f"File: {result.get('file_path', result.get('source', 'N/A'))}\n")
-                            f.write(f"Score: {result.get('score', result.get('distance', 'N/A'))}\n")
-                            f.write(f"Content:\n{result.get('content', result.get('text', ''))}\n")
-                            f.write("\n" + "="*80 + "\n\n")
-                return file_path
             
-            worker = APIWorker("Exporting results", export_worker)
+            export_func = _export_json if file_path.endswith('.json') else _export_text
+            worker = APIWorker("Exporting results", export_func, file_path, list(self.search_results))
             worker.finished.connect(lambda path: self._on_export_success(path))
             worker.error.connect(lambda error: self._on_export_error(error))
-            self.main_window.worker_manager.start_worker("export_results", worker)
+            self.main_window.worker_manager.start_worker("export_results", worker, kind="cpu")
             self.main_window.status_updated.emit("Exporting results...")
     
     def _on_export_success(self, file_path):
@@ -426,4 +645,6 @@ class SearchTab(QWidget):
     
     def refresh(self):
         """Refresh (reload collections)"""
+        if not self._ui_built:
+            return  # Loaded on first show
         self.load_collections()
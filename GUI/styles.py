@@ -0,0 +1,47 @@
+"""
+Shared styling resources for the GUI
+Fonts are created once and shared by every widget that uses them
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def get_font(point_size: Optional[int], bold: bool = False) -> QFont:
+    """
+    Get a shared QFont with the given size and weight
+    
+    Built on first use rather than at import time because a QFont needs a
+    running QApplication. QFont is implicitly shared, so handing the same
+    instance to many widgets is safe.
+    
+    Args:
+        point_size: Font size in points, or None for the default size
+        bold: Whether the font is bold
+        
+    Returns:
+        The cached QFont
+    """
+    font = QFont()
+    if point_size is not None:
+        font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+def load_stylesheet() -> str:
+    """
+    Read the application stylesheet (style.qss next to this module)
+    
+    Meant to be applied once with QApplication.setStyleSheet(); widgets
+    select their variant by objectName or dynamic property, so none of
+    them needs a stylesheet of its own.
+    
+    Returns:
+        The stylesheet text
+    """
+    return Path(__file__).with_name('style.qss').read_text(encoding='utf-8')
@@ -0,0 +1,62 @@
+"""
+Call throttling for GUI slots
+Coalesces bursts of calls (repeated clicks, chained refreshes) into one call per time window
+"""
+
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QTimer
+
+
+class Throttler(QObject):
+    """
+    Runs a function at most once per time window
+    
+    The first call in a quiet period runs immediately (when leading is
+    true); further calls inside the window are collapsed into a single
+    trailing call when the window ends. Signal arguments are discarded, so
+    an instance can be connected straight to clicked/timeout signals.
+    """
+    
+    def __init__(self, func: Callable[[], None], timeout: int, leading: bool = True, parent=None):
+        """
+        Initialize the throttler
+        
+        Args:
+            func: Function to call, without arguments
+            timeout: Window length in milliseconds
+            leading: Call immediately on the first request of a window
+            parent: Parent QObject that owns the internal timer
+        """
+        super().__init__(parent)
+        self._func = func
+        self._leading = leading
+        self._pending = False
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(timeout)
+        self._timer.timeout.connect(self._on_timeout)
+    
+    def __call__(self, *args):
+        if self._timer.isActive():
+            self._pending = True
+            return
+        
+        if self._leading:
+            self._func()
+        else:
+            self._pending = True
+        self._timer.start()
+    
+    def _on_timeout(self):
+        """Run the trailing call, if one was requested, and open a new window"""
+        if self._pending:
+            self._pending = False
+            self._func()
+            self._timer.start()
+    
+    def cancel(self):
+        """Drop any pending trailing call"""
+        self._pending = False
+        self._timer.stop()
@@ -2,6 +2,8 @@
 Watcher Tab - Manage file watchers for collections
 """
 
+import re
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget,
     QTableWidgetItem, QHeaderView, QLabel, QMessageBox, QDialog,
@@ -9,7 +11,18 @@ from PyQt6.QtWidgets import (
     QGroupBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtGui import QColor
+
+from delegates import ActionButtonsDelegate, RowAction
+from styles import get_font
+
+
+# Name of a collection's watcher job, capturing the collection ID
+_WATCH_RE = re.compile(r'^Watch_Collection_(\d+)$')
+
+# (text, background color) of a watcher's status cell, shared by every row
+_ACTIVE = ("🟢 Active", QColor(200, 255, 200))
+_INACTIVE = ("⚪ Inactive", QColor(240, 240, 240))
 
 
 class WatcherConfigDialog(QDialog):
@@ -18,6 +31,7 @@ class WatcherConfigDialog(QDialog):
     def __init__(self, parent=None, collection=None):
         super().__init__(parent)
         self.collection = collection
+        self._exclude_cache = (None, [])  # (exclude folders text, parsed folder names)
         self.init_ui()
     
     def init_ui(self):
@@ -96,11 +110,16 @@ class WatcherConfigDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
+    def _exclude_folders(self):
+        """Get the folder names to exclude, parsing the text only when it changed"""
+        exclude_text = self.exclude_folders_text.toPlainText()
+        if exclude_text != self._exclude_cache[0]:
+            folders = [line.strip() for line in exclude_text.split('\n')]
+            self._exclude_cache = (exclude_text, [folder for folder in folders if folder])
+        return list(self._exclude_cache[1])
+    
     def get_config(self):
         """Get watcher configuration"""
-        exclude_text = self.exclude_folders_text.toPlainText().strip()
-        exclude_folders = [line.strip() for line in exclude_text.split('\n') if line.strip()]
-        
         return {
             'watch_created': self.watch_created_cb.isChecked(),
             'watch_modified': self.watch_modified_cb.isChecked(),
@@ -108,18 +127,33 @@ class WatcherConfigDialog(QDialog):
             'watch_renamed': self.watch_renamed_cb.isChecked(),
             'include_subdirectories': self.include_subdirs_cb.isChecked(),
             'process_interval': self.interval_spin.value(),
-            'omit_folders': exclude_folders
+            'omit_folders': self._exclude_folders()
         }
 
 
 class WatcherTab(QWidget):
     """File watcher management tab"""
     
+    # Watcher status poll interval, and its ceiling while backing off (ms)
+    POLL_INTERVAL = 5000
+    MAX_POLL_INTERVAL = 60000
+    
+    ACTIONS_COLUMN = 5
+    START_ACTION = RowAction('start', "▶", "Start Watcher", "#4CAF50")
+    CONFIGURE_ACTION = RowAction('configure', "⚙", "Configure")
+    STOP_ACTION = RowAction('stop', "⏹", "Stop Watcher", "#f44336")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.main_window = parent
         self.collections = []
         self.watcher_status = {}
+        self._rendered = {}  # Collection ID -> (active, job ID) shown in its row
+        self._row_by_id = {}  # Collection ID -> table row
+        self._table_collections = None  # (ID, name, source folder) of each table row
+        self._pending_status_ids = set()  # Collection IDs awaiting a status repaint (None: all)
+        self._idle_ticks = 0  # Consecutive polls with no watcher change
+        self._interval_ms = self.POLL_INTERVAL
         self.init_ui()
         self.setup_auto_refresh()
     
@@ -132,10 +166,7 @@ class WatcherTab(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("File Watchers")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(get_font(16, bold=True))
         header_layout.addWidget(title)
         
         header_layout.addStretch()
@@ -146,7 +177,7 @@ class WatcherTab(QWidget):
         header_layout.addWidget(refresh_btn)
         
         stop_all_btn = QPushButton("⏹ Stop All Watchers")
-        stop_all_btn.setStyleSheet("QPushButton { background-color: #f44336; }")
+        stop_all_btn.setProperty("variant", "danger")
         stop_all_btn.clicked.connect(self.stop_all_watchers)
         header_layout.addWidget(stop_all_btn)
         
@@ -158,7 +189,7 @@ class WatcherTab(QWidget):
             "Configure and start watchers for collections below."
         )
         info_label.setWordWrap(True)
-        info_label.setStyleSheet("QLabel { color: #666; margin: 10px 0; }")
+        info_label.setObjectName("InfoLabel")
         layout.addWidget(info_label)
         
         # Table
@@ -175,33 +206,60 @@ class WatcherTab(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(self.ACTIONS_COLUMN, QHeaderView.ResizeMode.Fixed)
+        header.resizeSection(self.ACTIONS_COLUMN, ActionButtonsDelegate.width_for(2))
+        
+        # Action buttons are painted by one delegate rather than a widget per row
+        self.actions_delegate = ActionButtonsDelegate(self.row_actions, self.table)
+        self.actions_delegate.action_triggered.connect(self.on_row_action)
+        self.table.setItemDelegateForColumn(self.ACTIONS_COLUMN, self.actions_delegate)
         
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         
         layout.addWidget(self.table)
         
+        # Status repaints requested within 100 ms are applied as one table update
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(100)
+        self._repaint_timer.timeout.connect(self._apply_table_status)
+        
         # Status summary
         self.status_label = QLabel("Active Watchers: 0")
-        status_font = QFont()
-        status_font.setBold(True)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(get_font(None, bold=True))
         layout.addWidget(self.status_label)
         
-        # Load data
-        self.refresh()
+        # Load data once the event loop runs (the API client is not set up yet)
+        QTimer.singleShot(0, self.refresh)
     
     def setup_auto_refresh(self):
-        """Setup automatic refresh timer"""
-        self.refresh_timer = QTimer()
+        """
+        Setup automatic refresh timer (running only while the tab is shown)
+        
+        Polls every 5 seconds, backing off while no watcher changes.
+        """
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self._interval_ms)
         self.refresh_timer.timeout.connect(self.refresh_status)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
+    
+    def showEvent(self, event):
+        """Refresh the watcher status and auto-refresh while shown"""
+        super().showEvent(event)
+        self.refresh_status()
+        self.refresh_timer.start()
+    
+    def hideEvent(self, event):
+        """Stop auto-refreshing while hidden"""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
     
     def refresh(self):
         """Refresh collections and watcher status"""
         if not self.main_window or not self.main_window.api_client:
             return
         
+        self._reset_poll_interval()
+        
         from worker import APIWorker
         
         # Get collections
@@ -211,7 +269,7 @@ class WatcherTab(QWidget):
         )
         worker.finished.connect(self._on_collections_loaded)
         worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to load data:\n{error}"))
-        self.main_window.worker_manager.start_worker("watcher_refresh", worker)
+        self.main_window.worker_manager.start_worker("watcher_refresh", worker, kind="io")
     
     def _on_collections_loaded(self, collections):
         """Handle collections loaded"""
@@ -220,14 +278,55 @@ class WatcherTab(QWidget):
         # Get watcher status
         self.refresh_status()
         
-        self.populate_table()
+        # Rebuild the rows only when the collections shown in them changed
+        table_collections = [
+            (coll.get('id'), coll.get('name', ''), coll.get('source_folder', ''))
+            for coll in collections
+        ]
+        if table_collections == self._table_collections:
+            self.schedule_table_status()
+        else:
+            self.populate_table()
+            self._table_collections = table_collections
         self.main_window.status_updated.emit(f"Loaded {len(self.collections)} collections")
     
-    def refresh_status(self):
-        """Refresh watcher status only"""
+    def refresh_status(self, restart=False):
+        """
+        Refresh watcher status only
+        
+        Args:
+            restart: Discard a status request already in flight and issue a new
+                one (after a watcher was started or stopped); otherwise its
+                response is awaited instead
+        """
         if not self.main_window or not self.main_window.api_client:
             return
+        if not self.isVisible():
+            return  # Refreshed again when shown
         
+        worker_manager = self.main_window.worker_manager
+        if restart:
+            self._reset_poll_interval()
+            worker_manager.start_worker("watcher_status", self._create_status_worker(), kind="io")
+        else:
+            worker_manager.start_worker_dedup("watcher_status", self._create_status_worker, kind="io")
+    
+    def _back_off_poll(self):
+        """Double the poll interval after every 3 polls in a row without a change"""
+        self._idle_ticks += 1
+        if self._idle_ticks % 3 == 0 and self._interval_ms < self.MAX_POLL_INTERVAL:
+            self._interval_ms = min(self._interval_ms * 2, self.MAX_POLL_INTERVAL)
+            self.refresh_timer.setInterval(self._interval_ms)
+    
+    def _reset_poll_interval(self):
+        """Return to the normal poll interval"""
+        self._idle_ticks = 0
+        if self._interval_ms != self.POLL_INTERVAL:
+            self._interval_ms = self.POLL_INTERVAL
+            self.refresh_timer.setInterval(self._interval_ms)
+    
+    def _create_status_worker(self):
+        """Create the worker that loads the watcher status"""
         from worker import APIWorker
         worker = APIWorker(
             "Checking watcher status",
@@ -235,33 +334,42 @@ class WatcherTab(QWidget):
         )
         worker.finished.connect(self._on_status_loaded)
         worker.error.connect(lambda e: None)  # Silent fail
-        self.main_window.worker_manager.start_worker("watcher_status", worker)
+        return worker
     
     def _on_status_loaded(self, jobs):
         """Handle processing status loaded"""
-        # Build status map
-        self.watcher_status = {}
-        for job in jobs:
-            job_name = job.get('name', '')
-            if job_name.startswith('Watch_Collection_'):
-                # Extract collection ID
-                try:
-                    coll_id = int(job_name.replace('Watch_Collection_', ''))
-                    self.watcher_status[coll_id] = {
-                        'active': job.get('state') == 'Running',
-                        'job_id': job.get('id'),
-                        'state': job.get('state')
-                    }
-                except:
-                    pass
+        # Build status map, keyed by the collection ID matched in each watcher job's name
+        matches = ((_WATCH_RE.match(job.get('name', '')), job) for job in jobs)
+        watcher_status = {
+            int(match.group(1)): {
+                'active': job.get('state') == 'Running',
+                'job_id': job.get('id'),
+                'state': job.get('state')
+            }
+            for match, job in matches if match
+        }
+        
+        # Nothing to repaint when no watcher changed since the last poll
+        if watcher_status == self.watcher_status:
+            self._back_off_poll()
+            return
+        self._reset_poll_interval()
+        
+        # Only the collections whose watcher changed need their rows redrawn
+        old_status = self.watcher_status
+        changed_ids = {
+            coll_id for coll_id in old_status.keys() | watcher_status.keys()
+            if old_status.get(coll_id) != watcher_status.get(coll_id)
+        }
+        self.watcher_status = watcher_status
         
         # Update status label
-        active_count = sum(1 for status in self.watcher_status.values() if status.get('active'))
+        active_count = sum(1 for status in self.watcher_status.values() if status['active'])
         self.status_label.setText(f"Active Watchers: {active_count}")
         
         # Update table if it's populated
         if self.table.rowCount() > 0:
-            self.update_table_status()
+            self.schedule_table_status(changed_ids)
     
     def populate_table(self):
         """Populate the table with collections"""
@@ -270,6 +378,8 @@ class WatcherTab(QWidget):
         try:
             self.table.setRowCount(0)
             self.table.setRowCount(len(self.collections))  # Pre-allocate all rows
+            self._rendered = {}
+            self._row_by_id = {coll.get('id'): row for row, coll in enumerate(self.collections)}
             
             for row, collection in enumerate(self.collections):
                 coll_id = collection.get('id')
@@ -294,81 +404,112 @@ class WatcherTab(QWidget):
                 job_item = QTableWidgetItem(str(job_id) if job_id else '-')
                 job_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
                 self.table.setItem(row, 4, job_item)
+                self._rendered[coll_id] = self._rendered_state(coll_id)
                 
-                # Actions
-                actions_widget = self.create_actions_widget(collection)
-                self.table.setCellWidget(row, 5, actions_widget)
+                # Actions (painted by the delegate from the active flag)
+                actions_item = QTableWidgetItem()
+                actions_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+                actions_item.setData(Qt.ItemDataRole.UserRole, self._rendered[coll_id][0])
+                self.table.setItem(row, self.ACTIONS_COLUMN, actions_item)
         finally:
             # Re-enable updates and trigger a single repaint
             self.table.setUpdatesEnabled(True)
     
+    def _status_cell(self, collection_id):
+        """Get the (text, background color) of a collection's status cell"""
+        return _ACTIVE if self.watcher_status.get(collection_id, {}).get('active', False) else _INACTIVE
+    
+    def _rendered_state(self, collection_id):
+        """Get the (active, job ID) pair that a collection's row displays"""
+        status = self.watcher_status.get(collection_id, {})
+        return status.get('active', False), status.get('job_id')
+    
     def create_status_item(self, collection_id):
         """Create status item for a collection"""
-        status = self.watcher_status.get(collection_id, {})
-        is_active = status.get('active', False)
-        
-        if is_active:
-            status_text = "🟢 Active"
-            color = QColor(200, 255, 200)
-        else:
-            status_text = "⚪ Inactive"
-            color = QColor(240, 240, 240)
+        status_text, color = self._status_cell(collection_id)
         
         item = QTableWidgetItem(status_text)
         item.setBackground(color)
         item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         return item
     
-    def update_table_status(self):
-        """Update status column in table"""
-        for row in range(self.table.rowCount()):
-            coll_id_text = self.table.item(row, 0).text()
-            if coll_id_text:
-                coll_id = int(coll_id_text)
-                status_item = self.create_status_item(coll_id)
-                self.table.setItem(row, 3, status_item)
-                
-                # Update job ID
-                job_id = self.watcher_status.get(coll_id, {}).get('job_id', '')
-                job_item = QTableWidgetItem(str(job_id) if job_id else '-')
-                job_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self.table.setItem(row, 4, job_item)
+    def schedule_table_status(self, collection_ids=None):
+        """
+        Update status column in table within 100 ms
+        
+        Requests made before the update runs are merged into it, so a poll
+        landing right after a start/stop repaints the table once.
+        
+        Args:
+            collection_ids: Update only the rows of these collections (default: all)
+        """
+        if collection_ids is None:
+            self._pending_status_ids = None
+        elif self._pending_status_ids is not None:
+            self._pending_status_ids.update(collection_ids)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def _apply_table_status(self):
+        """Apply the status updates collected by schedule_table_status"""
+        collection_ids, self._pending_status_ids = self._pending_status_ids, set()
+        self.update_table_status(collection_ids)
     
-    def create_actions_widget(self, collection):
-        """Create actions widget for a collection row"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(2)
+    def update_table_status(self, collection_ids=None):
+        """
+        Update status column in table
         
-        coll_id = collection.get('id')
-        is_active = self.watcher_status.get(coll_id, {}).get('active', False)
-        
-        if is_active:
-            # Stop button
-            stop_btn = QPushButton("⏹")
-            stop_btn.setToolTip("Stop Watcher")
-            stop_btn.setMaximumWidth(35)
-            stop_btn.setStyleSheet("QPushButton { background-color: #f44336; }")
-            stop_btn.clicked.connect(lambda: self.stop_watcher(coll_id))
-            layout.addWidget(stop_btn)
-        else:
-            # Start button
-            start_btn = QPushButton("▶")
-            start_btn.setToolTip("Start Watcher")
-            start_btn.setMaximumWidth(35)
-            start_btn.setStyleSheet("QPushButton { background-color: #4CAF50; }")
-            start_btn.clicked.connect(lambda: self.start_watcher(collection))
-            layout.addWidget(start_btn)
-            
-            # Configure button
-            config_btn = QPushButton("⚙")
-            config_btn.setToolTip("Configure")
-            config_btn.setMaximumWidth(35)
-            config_btn.clicked.connect(lambda: self.configure_watcher(collection))
-            layout.addWidget(config_btn)
+        Rows showing their current state are skipped; changed rows have
+        their existing items edited in place.
         
-        return widget
+        Args:
+            collection_ids: Update only the rows of these collections (default: all)
+        """
+        self.table.setUpdatesEnabled(False)
+        try:
+            if collection_ids is None:
+                collection_ids = self._row_by_id.keys()
+            for coll_id in collection_ids:
+                row = self._row_by_id.get(coll_id)
+                if row is None:
+                    continue  # A watcher for a collection not in the table
+                
+                rendered = self._rendered_state(coll_id)
+                if self._rendered.get(coll_id) == rendered:
+                    continue
+                self._rendered[coll_id] = rendered
+                
+                status_text, color = self._status_cell(coll_id)
+                status_item = self.table.item(row, 3)
+                status_item.setText(status_text)
+                status_item.setBackground(color)
+                
+                # Update job ID
+                job_id = rendered[1]
+                self.table.item(row, 4).setText(str(job_id) if job_id else '-')
+                
+                # Switch the action buttons between stop and start/configure
+                self.table.item(row, self.ACTIONS_COLUMN).setData(Qt.ItemDataRole.UserRole, rendered[0])
+        finally:
+            self.table.setUpdatesEnabled(True)
+    
+    def row_actions(self, index):
+        """Get the Actions column buttons of a row: stop, or start and configure"""
+        if index.data(Qt.ItemDataRole.UserRole):
+            return (self.STOP_ACTION,)
+        return (self.START_ACTION, self.CONFIGURE_ACTION)
+    
+    def on_row_action(self, action, row):
+        """Handle a click on one of the Actions column buttons"""
+        if not 0 <= row < len(self.collections):
+            return
+        collection = self.collections[row]
+        if action == 'stop':
+            self.stop_watcher(collection.get('id'))
+        elif action == 'start':
+            self.start_watcher(collection)
+        elif action == 'configure':
+            self.configure_watcher(collection)
     
     def configure_watcher(self, collection):
         """Configure watcher for a collection"""
@@ -404,7 +545,7 @@ class WatcherTab(QWidget):
         )
         worker.finished.connect(lambda result: self._on_watcher_started(collection, result))
         worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to start watcher:\n{error}"))
-        self.main_window.worker_manager.start_worker("start_watcher", worker)
+        self.main_window.worker_manager.start_worker("start_watcher", worker, kind="io")
     
     def _on_watcher_started(self, collection, result):
         """Handle watcher started"""
@@ -415,8 +556,8 @@ class WatcherTab(QWidget):
             f"Job ID: {result.get('job_id', 'N/A')}"
         )
         
-        self.refresh_status()
-        self.update_table_status()
+        self.refresh_status(restart=True)
+        self.schedule_table_status()
     
     def stop_watcher(self, collection_id):
         """Stop a file watcher"""
@@ -428,14 +569,14 @@ class WatcherTab(QWidget):
         )
         worker.finished.connect(lambda success: self._on_watcher_stopped(success))
         worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to stop watcher:\n{error}"))
-        self.main_window.worker_manager.start_worker("stop_watcher", worker)
+        self.main_window.worker_manager.start_worker("stop_watcher", worker, kind="io")
     
     def _on_watcher_stopped(self, success):
         """Handle watcher stopped"""
         if success:
             QMessageBox.information(self, "Success", "Watcher stopped successfully")
-            self.refresh_status()
-            self.update_table_status()
+            self.refresh_status(restart=True)
+            self.schedule_table_status()
         else:
             QMessageBox.warning(self, "Warning", "Failed to stop watcher")
     
@@ -457,28 +598,18 @@ class WatcherTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Stop all watchers in background
+            # Stop all watchers in one background request
             from worker import APIWorker
-            
-            stopped_count = [0]  # Use list to allow modification in closure
-            total = len(active_watchers)
-            
-            def on_watcher_stopped(success):
-                if success:
-                    stopped_count[0] += 1
-                
-                if stopped_count[0] + (total - len(active_watchers)) >= total:
-                    # All done
-                    QMessageBox.information(self, "Success", f"Stopped {stopped_count[0]} watchers")
-                    self.refresh_status()
-                    self.update_table_status()
-            
-            for coll_id in active_watchers:
-                worker = APIWorker(
-                    f"Stopping watcher {coll_id}",
-                    self.main_window.api_client.stop_collection_watcher,
-                    coll_id
-                )
-                worker.finished.connect(on_watcher_stopped)
-                worker.error.connect(lambda e: on_watcher_stopped(False))
-                self.main_window.worker_manager.start_worker(f"stop_watcher_{coll_id}", worker)
+            worker = APIWorker(
+                f"Stopping {len(active_watchers)} watchers",
+                self.main_window.api_client.stop_collection_watchers,
+                active_watchers
+            )
+            worker.finished.connect(self._on_watchers_stopped)
+            worker.error.connect(lambda error: QMessageBox.critical(self, "Error", f"Failed to stop watchers:\n{error}"))
+            self.main_window.worker_manager.start_worker("stop_all_watchers", worker, kind="io")
+    
+    def _on_watchers_stopped(self, result):
+        """Handle watchers stopped by stop_all_watchers"""
+        QMessageBox.information(self, "Success", f"Stopped {result.get('count', 0)} watchers")
+        self.refresh_status(restart=True)
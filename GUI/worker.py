@@ -3,26 +3,38 @@ Background Worker for API calls
 Prevents GUI freezing by executing API calls in separate threads
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
-from typing import Callable, Any, Dict, Optional
+import weakref
+from PyQt6.QtCore import QDeadlineTimer, QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+from typing import Callable, Any, Dict, Literal, Optional
 
 
-class APIWorker(QThread):
+class WorkerSignals(QObject):
     """
-    Worker thread for executing API calls in the background
+    Signals of an APIWorker
     
-    Signals:
-        started: Emitted when the worker starts
-        finished: Emitted when the worker completes successfully
-        error: Emitted when an error occurs
-        progress: Emitted to report progress (optional)
+    QRunnable is not a QObject, so its signals live on this companion
+    object, created in (and delivering to) the GUI thread.
     """
     
-    # Signals
     started = pyqtSignal(str)  # operation name
     finished = pyqtSignal(object)  # result
     error = pyqtSignal(str)  # error message
     progress = pyqtSignal(int, str)  # percentage, status message
+
+
+class APIWorker(QRunnable):
+    """
+    Task for executing API calls in the background
+    
+    Runs on a QThreadPool (one of the WorkerManager's), so no thread is created
+    or destroyed per call.
+    
+    Signals:
+        started: Emitted when the worker starts
+        finished: Emitted when the worker completes successfully
+        error: Emitted when an error occurs
+        progress: Emitted to report progress (optional)
+    """
     
     def __init__(self, operation_name: str, func: Callable, *args, **kwargs):
         """
@@ -40,12 +52,22 @@ class APIWorker(QThread):
         self.args = args
         self.kwargs = kwargs
         self._is_cancelled = False
+        self._pool = None  # Pool the worker was queued on
         
-        # Ensure thread is properly cleaned up
-        self.setTerminationEnabled(True)
+        self.signals = WorkerSignals()
+        self.started = self.signals.started
+        self.finished = self.signals.finished
+        self.error = self.signals.error
+        self.progress = self.signals.progress
     
     def run(self):
-        """Execute the function in the background thread"""
+        """
+        Execute the function on a pool thread
+        
+        The pool deletes the runnable once this returns, and the signals
+        object is deleted later from the GUI thread, so neither is ever
+        freed on the pool thread while Python still runs this method.
+        """
         try:
             if self._is_cancelled:
                 return
@@ -59,37 +81,35 @@ class APIWorker(QThread):
             if not self._is_cancelled:
                 self.error.emit(str(e))
         finally:
-            # Ensure thread exits cleanly
-            self.quit()
+            self.signals.deleteLater()
+    
+    def start(self, pool: Optional[QThreadPool] = None):
+        """
+        Queue the worker on a thread pool
+        
+        Args:
+            pool: Pool to run on (default: the global pool)
+        """
+        self._pool = pool or QThreadPool.globalInstance()
+        # Owned by the pool (a GUI-thread object) until run() schedules its deletion
+        self.signals.setParent(self._pool)
+        self._pool.start(self)
     
     def cancel(self):
-        """Cancel the operation gracefully"""
-        self._is_cancelled = True
+        """
+        Cancel the operation
         
-        # Request thread to stop and wait for it
-        if self.isRunning():
-            self.requestInterruption()
-            self.quit()
-            # Wait up to 3 seconds for graceful exit
-            if not self.wait(3000):
-                # Force terminate if it doesn't exit gracefully
-                self.terminate()
-                self.wait()
-    
-    def __del__(self):
-        """Destructor - ensure thread is stopped before deletion"""
+        A queued worker is taken off the pool; a running one finishes its
+        call but emits nothing.
+        """
+        self._is_cancelled = True
+        if self._pool is None:
+            return
         try:
-            if self.isRunning():
-                self._is_cancelled = True
-                self.requestInterruption()
-                self.quit()
-                # Wait briefly for graceful exit
-                if not self.wait(1000):
-                    self.terminate()
-                    self.wait()
+            if self._pool.tryTake(self):
+                self.signals.deleteLater()  # Never runs, so never schedules it
         except RuntimeError:
-            # Thread may already be deleted, ignore
-            pass
+            pass  # Already run and deleted by the pool
 
 
 class WorkerManager:
@@ -100,44 +120,79 @@ class WorkerManager:
     
     def __init__(self):
         self.workers: Dict[str, APIWorker] = {}
+        # Separate bounded pools, so a burst of HTTP calls queues behind its
+        # own limit and never holds up local work (or the GUI thread)
+        self.io_pool = QThreadPool()
+        self.io_pool.setMaxThreadCount(16)
+        self.cpu_pool = QThreadPool()
+        self.cpu_pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
     
-    def start_worker(self, worker_id: str, worker: APIWorker):
+    def start_worker(self, worker_id: str, worker: APIWorker,
+                     kind: Literal["io", "cpu"] = "io"):
         """
         Start a new worker
         
         Args:
             worker_id: Unique identifier for the worker
             worker: APIWorker instance to start
+            kind: "io" for API calls, "cpu" for local processing
         """
         # Cancel and clean up existing worker with same ID if running
         if worker_id in self.workers:
             old_worker = self.workers[worker_id]
             old_worker.cancel()
             # Disconnect signals to prevent callbacks
-            try:
-                old_worker.finished.disconnect()
-                old_worker.error.disconnect()
-                old_worker.started.disconnect()
-            except (TypeError, RuntimeError):
-                # Signals may not be connected
-                pass
+            self._safe_disconnect(old_worker)
         
         self.workers[worker_id] = worker
         
-        # Connect cleanup handlers with lambda to capture worker_id
-        worker.finished.connect(lambda: self._cleanup_worker(worker_id))
-        worker.error.connect(lambda _: self._cleanup_worker(worker_id))
+        # Connect cleanup handlers with lambda to capture worker_id (and a
+        # weak reference, so a late signal never drops a newer worker)
+        worker_ref = weakref.ref(worker)
+        worker.finished.connect(lambda: self._cleanup_worker(worker_id, worker_ref))
+        worker.error.connect(lambda _: self._cleanup_worker(worker_id, worker_ref))
         
         # Start the worker
-        worker.start()
+        worker.start(self.cpu_pool if kind == "cpu" else self.io_pool)
     
-    def _cleanup_worker(self, worker_id: str):
+    def start_worker_dedup(self, worker_id: str, factory: Callable[[], APIWorker],
+                           kind: Literal["io", "cpu"] = "io") -> APIWorker:
+        """
+        Start a worker unless one with the same ID is still in flight
+        
+        A caller arriving while the request is outstanding waits for its
+        response instead of cancelling it and starting over, so the worker
+        is only created when there is none.
+        
+        Args:
+            worker_id: Unique identifier for the worker
+            factory: Creates the APIWorker, with its signals connected
+            kind: "io" for API calls, "cpu" for local processing
+            
+        Returns:
+            The worker whose result will be delivered
+        """
+        worker = self.workers.get(worker_id)
+        if worker is None:
+            worker = factory()
+            self.start_worker(worker_id, worker, kind)
+        return worker
+    
+    @staticmethod
+    def _safe_disconnect(worker: APIWorker):
+        """Disconnect every slot from a worker's signals, so nothing queued still reaches them"""
+        for signal in (worker.finished, worker.error, worker.started, worker.progress):
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                # Signal not connected, or its object already deleted
+                pass
+    
+    def _cleanup_worker(self, worker_id: str, worker_ref):
         """Remove finished worker from tracking"""
-        if worker_id in self.workers:
-            worker = self.workers[worker_id]
-            # Ensure thread has finished before removing
-            if worker.isRunning():
-                worker.wait(1000)
+        worker = worker_ref()
+        if worker is not None and self.workers.get(worker_id) is worker:
+            self._safe_disconnect(worker)
             del self.workers[worker_id]
     
     def cancel_worker(self, worker_id: str):
@@ -145,12 +200,7 @@ class WorkerManager:
         if worker_id in self.workers:
             worker = self.workers[worker_id]
             worker.cancel()
-            try:
-                worker.finished.disconnect()
-                worker.error.disconnect()
-                worker.started.disconnect()
-            except (TypeError, RuntimeError):
-                pass
+            self._safe_disconnect(worker)
             del self.workers[worker_id]
     
     def cancel_all(self):
@@ -161,17 +211,30 @@ class WorkerManager:
             self.cancel_worker(worker_id)
         self.workers.clear()
     
+    def shutdown(self, timeout_ms: int = 2000) -> bool:
+        """
+        Cancel all workers and wait for those already running to return
+        
+        Called explicitly on exit (see MainWindow.closeEvent) while the
+        application still exists. Pool threads cannot be terminated, so any
+        worker still running after the timeout is left to finish unobserved.
+        
+        Args:
+            timeout_ms: Milliseconds to wait, for both pools together
+            
+        Returns:
+            True if no worker was still running
+        """
+        self.cancel_all()
+        # The int overload of waitForDone, since the QDeadlineTimer one needs Qt 6.8
+        deadline = QDeadlineTimer(timeout_ms)
+        io_done = self.io_pool.waitForDone(timeout_ms)
+        cpu_done = self.cpu_pool.waitForDone(max(0, deadline.remainingTime()))
+        return io_done and cpu_done
+    
     def is_busy(self) -> bool:
         """Check if any workers are running"""
         return len(self.workers) > 0
-    
-    def __del__(self):
-        """Destructor - ensure all workers are stopped"""
-        try:
-            self.cancel_all()
-        except (RuntimeError, TypeError):
-            # May fail during application shutdown
-            pass
 
 
 class StatusBarManager:
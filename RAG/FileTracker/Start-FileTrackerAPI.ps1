@@ -113,12 +113,16 @@ try {
                     "/api/collections/{id} - DELETE: Delete collection by ID",
                     "/api/collections/{id}/settings - GET: Get collection settings",
                     "/api/collections/{id}/watch - POST: Start/stop watching collection",
+                    "/api/watchers/stop - POST: Stop watching a list of collections",
                     "/api/collections/{id}/files - GET: Get files in collection",
                     "/api/collections/{id}/files - POST: Add file to collection",
                     "/api/collections/{id}/files - PUT: Update file status in collection",
                     "/api/collections/{id}/files/{fileId} - DELETE: Remove file from collection",
                     "/api/collections/{id}/files/{fileId} - PUT: Update file status in collection",
+                    "/api/collections/{id}/files/batch - POST: Update status for / remove a list of files",
+                    "/api/collections/{id}/file-counts - GET: Get dirty/processed/deleted file counts",
                     "/api/collections/{id}/update - POST: Update collection files",
+                    "/api/files - GET: Get files of all collections",
                     "/api/files/{fileId}/metadata - GET: Get file metadata for file ID"
                 )
             }
@@ -416,6 +420,56 @@ try {
             }
         }  
 
+        # POST /api/watchers/stop (Stop watching a list of collections)
+        Add-PodeRoute -Method Post -Path "$ApiPath/watchers/stop" -ScriptBlock {
+            try {
+                $data = $WebEvent.Data
+                if ($null -eq $data.collectionIds) {
+                    Write-PodeJsonResponse -StatusCode 400 -Value @{ success = $false; error = "Invalid request. Requires 'collectionIds' field." }; return
+                }
+
+                # Stop every watch job, disabling the watch settings over one connection
+                $stoppedIds = @()
+                $failedIds = @()
+                $conn = Get-DatabaseConnection -DatabasePath $using:localDatabasePath -InstallPath $using:localInstallPath
+                try {
+                    foreach ($rawId in @($data.collectionIds)) {
+                        $collectionId = [int]$rawId
+                        $watchJob = Get-Job -Name "Watch_Collection_$collectionId" -ErrorAction SilentlyContinue
+                        if (-not $watchJob) { $failedIds += $collectionId; continue }
+
+                        Stop-Job -Id $watchJob.Id; Remove-Job -Id $watchJob.Id
+                        $stoppedIds += $collectionId
+                        Write-Log "Stopped watch job for collection $collectionId"
+
+                        try {
+                            $cmd = $conn.CreateCommand()
+                            # Get current settings first to preserve other values
+                            $cmd.CommandText = "SELECT value FROM settings WHERE key = @Key"
+                            $cmd.Parameters.Add((New-Object Microsoft.Data.Sqlite.SqliteParameter("@Key", "collection_${collectionId}_watch")))
+                            $settingsJson = $cmd.ExecuteScalar()
+                            $currentSettings = if ($settingsJson) { ConvertFrom-Json $settingsJson } else { @{} }
+                            $currentSettings.enabled = $false # Set to disabled
+
+                            $cmd.CommandText = "INSERT OR REPLACE INTO settings (key, value, updated_at) VALUES (@Key, @Value, @UpdatedAt)"
+                            $cmd.Parameters.Add((New-Object Microsoft.Data.Sqlite.SqliteParameter("@Value", (ConvertTo-Json $currentSettings -Compress))))
+                            $cmd.Parameters.Add((New-Object Microsoft.Data.Sqlite.SqliteParameter("@UpdatedAt", [DateTime]::UtcNow.ToString("o"))))
+                            $cmd.ExecuteNonQuery()
+                        } catch { Write-Log "Failed to update watch settings to disabled for collection $collectionId : $_" -Level "ERROR" }
+                    }
+                } finally {
+                    $conn.Close()
+                }
+
+                Write-Log "Stopped $($stoppedIds.Count) watcher(s) ($($failedIds.Count) not being watched)"
+                Write-PodeJsonResponse -Value @{ success = $true; count = $stoppedIds.Count; stopped = $stoppedIds; failed = $failedIds }
+
+            } catch {
+                Write-Log "Error in POST /watchers/stop: $_" -Level "ERROR"
+                Write-PodeJsonResponse -StatusCode 500 -Value @{ success = $false; error = "Internal Server Error: $($_.Exception.Message)" }
+            }
+        }
+
         # GET /api/collections/{id}/files
         Add-PodeRoute -Method Get -Path "$ApiPath/collections/:collectionId/files" -ScriptBlock {
             try {
@@ -423,6 +477,8 @@ try {
                 $dirty = $false
                 $processed = $false
                 $deleted = $false
+                $offset = 0
+                $limit = 0
 
                 if ($null -ne $WebEvent.Query) {
                     $dirtyRaw = $WebEvent.Query["dirty"]
@@ -431,6 +487,9 @@ try {
                     $processed = ($null -ne $processedRaw) -and ($processedRaw -eq "true")
                     $deletedRaw = $WebEvent.Query["deleted"]
                     $deleted = ($null -ne $deletedRaw) -and ($deletedRaw -eq "true")
+                    # Optional paging: ?offset=N&limit=M (limit 0 or absent = all files)
+                    if ($WebEvent.Query["offset"]) { $offset = [int]$WebEvent.Query["offset"] }
+                    if ($WebEvent.Query["limit"]) { $limit = [int]$WebEvent.Query["limit"] }
                 }
                 
                 # Use local variables
@@ -448,8 +507,15 @@ try {
                 # If no specific filter is set, maybe default to DirtyOnly? Or return all non-deleted?
                 # Current Get-CollectionFiles returns all non-deleted if no flags set. Let's keep that.
                 
-                $files = Get-CollectionFiles @params
-                $result = @{ success = $true; files = $files; count = $files.Count; collection_id = $collectionId }
+                if ($limit -gt 0) {
+                    # Total number of matching files, so clients know when to stop paging
+                    $total = Get-CollectionFiles @params -CountOnly
+                    $files = Get-CollectionFiles @params -Offset $offset -Limit $limit
+                    $result = @{ success = $true; files = $files; count = $files.Count; total = $total; offset = $offset; limit = $limit; collection_id = $collectionId }
+                } else {
+                    $files = Get-CollectionFiles @params
+                    $result = @{ success = $true; files = $files; count = $files.Count; collection_id = $collectionId }
+                }
                 Write-PodeJsonResponse -Value $result
                 
             } catch {
@@ -598,6 +664,140 @@ try {
             }
         }
 
+        # POST /api/collections/{id}/files/batch (Update status for / remove a list of files)
+        Add-PodeRoute -Method Post -Path "$ApiPath/collections/:collectionId/files/batch" -ScriptBlock {
+            try {
+                $collectionId = [int]$WebEvent.Parameters['collectionId']
+                $data = $WebEvent.Data
+                $action = if ($data.action) { $data.action } else { "update" }
+
+                if ($action -notin @("update", "delete")) {
+                    Write-PodeJsonResponse -StatusCode 400 -Value @{ success = $false; error = "Invalid action. Use 'update' or 'delete'." }; return
+                }
+                if ($null -eq $data.fileIds) {
+                    Write-PodeJsonResponse -StatusCode 400 -Value @{ success = $false; error = "Invalid request. Requires 'fileIds' field." }; return
+                }
+                if ($action -eq "update" -and $null -eq $data.dirty) {
+                    Write-PodeJsonResponse -StatusCode 400 -Value @{ success = $false; error = "Invalid request. Requires 'dirty' field." }; return
+                }
+
+                # Apply every change over one connection inside a single transaction
+                $processedIds = @()
+                $failedIds = @()
+                $conn = Get-DatabaseConnection -DatabasePath $using:localDatabasePath -InstallPath $using:localInstallPath
+                try {
+                    $transaction = $conn.BeginTransaction()
+                    $cmd = $conn.CreateCommand()
+                    $cmd.Transaction = $transaction
+                    if ($action -eq "delete") {
+                        $cmd.CommandText = "DELETE FROM files WHERE id = @FileId AND collection_id = @CollectionId"
+                    } else {
+                        $cmd.CommandText = "UPDATE files SET Dirty = @Dirty WHERE id = @FileId AND collection_id = @CollectionId"
+                        $null = $cmd.Parameters.Add((New-Object Microsoft.Data.Sqlite.SqliteParameter("@Dirty", [int][bool]$data.dirty)))
+                    }
+                    $null = $cmd.Parameters.Add((New-Object Microsoft.Data.Sqlite.SqliteParameter("@CollectionId", $collectionId)))
+                    $fileIdParam = New-Object Microsoft.Data.Sqlite.SqliteParameter("@FileId", 0)
+                    $null = $cmd.Parameters.Add($fileIdParam)
+
+                    foreach ($fileId in @($data.fileIds)) {
+                        $fileIdParam.Value = [int]$fileId
+                        if ($cmd.ExecuteNonQuery() -gt 0) { $processedIds += [int]$fileId } else { $failedIds += [int]$fileId }
+                    }
+                    $transaction.Commit()
+                } finally {
+                    $conn.Close()
+                }
+
+                Write-Log "Batch $action of $($processedIds.Count) file(s) in collection $collectionId ($($failedIds.Count) not found)"
+                $result = @{ success = $true; action = $action; collection_id = $collectionId; count = $processedIds.Count; failed = $failedIds }
+                if ($action -eq "update") { $result.dirty = [bool]$data.dirty }
+                Write-PodeJsonResponse -Value $result
+
+            } catch {
+                Write-Log "Error in POST /collections/$($WebEvent.Parameters['collectionId'])/files/batch: $_" -Level "ERROR"
+                Write-PodeJsonResponse -StatusCode 500 -Value @{ success = $false; error = "Internal Server Error: $($_.Exception.Message)" }
+            }
+        }
+
+        # GET /api/collections/{id}/file-counts (Dirty/processed/deleted counts without listing files)
+        Add-PodeRoute -Method Get -Path "$ApiPath/collections/:collectionId/file-counts" -ScriptBlock {
+            try {
+                $collectionId = [int]$WebEvent.Parameters['collectionId']
+                $conn = Get-DatabaseConnection -DatabasePath $using:localDatabasePath -InstallPath $using:localInstallPath
+
+                # Same filters as GET /files?dirty|processed|deleted=true, counted in one pass
+                $cmd = $conn.CreateCommand()
+                $cmd.CommandText = @"
+SELECT 
+    COALESCE(SUM(CASE WHEN Dirty = 1 THEN 1 ELSE 0 END), 0) as dirty,
+    COALESCE(SUM(CASE WHEN Dirty = 0 THEN 1 ELSE 0 END), 0) as processed,
+    COALESCE(SUM(CASE WHEN Deleted = 1 THEN 1 ELSE 0 END), 0) as deleted
+FROM files
+WHERE collection_id = @CollectionId
+"@
+                $null = $cmd.Parameters.Add((New-Object Microsoft.Data.Sqlite.SqliteParameter("@CollectionId", $collectionId)))
+
+                $reader = $cmd.ExecuteReader()
+                $null = $reader.Read()
+                $counts = @{
+                    dirty = $reader.GetInt32(0)
+                    processed = $reader.GetInt32(1)
+                    deleted = $reader.GetInt32(2)
+                }
+                $reader.Close()
+                $conn.Close()
+
+                Write-PodeJsonResponse -Value @{ success = $true; collection_id = $collectionId; counts = $counts }
+            } catch {
+                Write-Log "Error in GET /collections/$($WebEvent.Parameters['collectionId'])/file-counts: $_" -Level "ERROR"
+                Write-PodeJsonResponse -StatusCode 500 -Value @{ success = $false; error = "Internal Server Error: $($_.Exception.Message)" }
+            }
+        }
+
+        # GET /api/files (Files of every collection in one response)
+        Add-PodeRoute -Method Get -Path "$ApiPath/files" -ScriptBlock {
+            try {
+                $conn = Get-DatabaseConnection -DatabasePath $using:localDatabasePath -InstallPath $using:localInstallPath
+
+                # Same filters as GET /collections/{id}/files, with the owning collection joined in
+                $whereClauses = @()
+                if ($null -ne $WebEvent.Query) {
+                    if ($WebEvent.Query["dirty"] -eq "true") { $whereClauses += "f.Dirty = 1" }
+                    elseif ($WebEvent.Query["processed"] -eq "true") { $whereClauses += "f.Dirty = 0" }
+                    if ($WebEvent.Query["deleted"] -eq "true") { $whereClauses += "f.Deleted = 1" }
+                }
+
+                $cmd = $conn.CreateCommand()
+                $cmd.CommandText = "SELECT f.id, f.FilePath, f.OriginalUrl, f.LastModified, f.Dirty, f.Deleted, f.collection_id, c.name FROM files f INNER JOIN collections c ON c.id = f.collection_id"
+                if ($whereClauses.Count -gt 0) {
+                    $cmd.CommandText += " WHERE " + ($whereClauses -join " AND ")
+                }
+                $cmd.CommandText += " ORDER BY f.collection_id, f.id"
+
+                $reader = $cmd.ExecuteReader()
+                $files = [System.Collections.Generic.List[object]]::new()
+                while ($reader.Read()) {
+                    $files.Add(@{
+                        id = $reader.GetInt32(0)
+                        filePath = $reader.GetString(1)
+                        originalUrl = if ($reader.IsDBNull(2)) { $null } else { $reader.GetString(2) }
+                        lastModified = $reader.GetString(3)
+                        dirty = $reader.GetBoolean(4)
+                        deleted = $reader.GetBoolean(5)
+                        collection_id = $reader.GetInt32(6)
+                        collection_name = $reader.GetString(7)
+                    })
+                }
+                $reader.Close()
+                $conn.Close()
+
+                Write-PodeJsonResponse -Value @{ success = $true; files = $files; count = $files.Count }
+            } catch {
+                Write-Log "Error in GET /files: $_" -Level "ERROR"
+                Write-PodeJsonResponse -StatusCode 500 -Value @{ success = $false; error = "Internal Server Error: $($_.Exception.Message)" }
+            }
+        }
+
         # GET /api/files/{fileId}/metadata
         Add-PodeRoute -Method Get -Path "$ApiPath/files/:fileId/metadata" -ScriptBlock {
             try {